@@ -9,28 +9,101 @@
 - 如何定义和应用本体规则
 - 如何执行基于规则的推理
 - 如何使用本体约束计算水网状态
+- 如何把互不依赖的对象分区并行求值
+- 如何用 Numba 把逐对象的数值计算编译为并行内核（可选）
 """
 
 import logging
-from typing import Dict
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+    np = None
 
 logger = logging.getLogger(__name__)
 
 
+def _step_kernel(level, flow, opening, inflow):
+    """
+    按对象数组原地执行一步示例规则计算。
+
+    与 _evaluate_partition 中的逐对象计算和内置约束规则等价：
+    水位随入流增加，流量取决于约束前的闸门开度和水位，最后对三者做上下限约束。
+    """
+    for i in _prange(level.shape[0]):
+        water_level = level[i] + 0.01 * inflow[i]
+        gate_opening = opening[i]
+        flow[i] = max(0.0, min(100.0, gate_opening * water_level * 0.5))
+        level[i] = max(0.0, min(10.0, water_level))
+        opening[i] = min(1.0, gate_opening)
+
+
+if numba is not None:
+    _prange = numba.prange
+    _step_kernel = numba.njit(parallel=True, fastmath=True, cache=True)(_step_kernel)
+else:
+    _prange = range
+
+
 class OntologyRuleEngine:
     """
     用于水网仿真的本体规则引擎。
 
     该引擎应用基于本体的规则来计算水网状态。真实实现中会使用 OWL API、
     RDFLib 或自定义规则引擎等本体推理器。
+
+    示例规则只读写单个对象自身的状态，对象之间互不依赖，因此可以按对象分区、
+    并行求值后再合并结果。纯 Python 规则受 GIL 限制，默认顺序执行；当规则
+    调用 NumPy 或原生推理器等会释放 GIL 的实现时，可设置 force_sequential=False。
     """
 
-    def __init__(self):
-        """初始化本体规则引擎。"""
+    def __init__(
+        self,
+        force_sequential: bool = True,
+        max_workers: Optional[int] = None,
+        min_objects_per_worker: int = 64,
+        use_jit: bool = False,
+    ):
+        """
+        初始化本体规则引擎。
+
+        Args:
+            force_sequential: 是否强制顺序求值
+            max_workers: 并行求值的最大线程数（None 使用线程池默认值）
+            min_objects_per_worker: 每个分区的最少对象数，对象过少时不值得并行
+            use_jit: 是否使用 Numba 编译的数组内核执行内置规则（需安装 numba）
+        """
         self.rules = []
         self.ontology_model = {}
+        self.force_sequential = force_sequential
+        self.min_objects_per_worker = max(1, min_objects_per_worker)
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if use_jit and numba is None:
+            logger.warning("numba is not installed; falling back to Python rule evaluation")
+        self.use_jit = use_jit and numba is not None
+        # use_jit 时对象状态以结构数组保存，数组在 load_ontology 中一次性分配
+        self._object_ids: List[int] = []
+        self._positions: Dict[int, int] = {}
+        self._state_arrays: Dict[str, "np.ndarray"] = {}
+        if not force_sequential and not self.use_jit:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="ontology-rules",
+            )
         logger.info("Ontology rule engine initialized")
 
+    def close(self):
+        """释放并行求值使用的线程池。"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def load_ontology(self, topology):
         """
         从拓扑加载本体模型。
@@ -58,9 +131,27 @@ class OntologyRuleEngine:
 
         logger.info(f"Loaded ontology model with {len(self.ontology_model)} instances")
 
+        if self.use_jit:
+            self._build_state_arrays()
+
         # 加载本体规则
         self._load_rules()
 
+    def _build_state_arrays(self):
+        """把本体实例状态转换为按对象编号排列的数组，供编译内核逐步复用。"""
+        self._object_ids = list(self.ontology_model)
+        self._positions = {object_id: index for index, object_id in enumerate(self._object_ids)}
+        size = len(self._object_ids)
+        self._state_arrays = {
+            metrics_code: np.fromiter(
+                (self.ontology_model[object_id]['state'][metrics_code] for object_id in self._object_ids),
+                dtype=np.float64,
+                count=size,
+            )
+            for metrics_code in ('water_level', 'flow', 'gate_opening')
+        }
+        self._state_arrays['inflow'] = np.zeros(size, dtype=np.float64)
+
     def _load_rules(self):
         """
         加载本体规则。
@@ -104,15 +195,81 @@ class OntologyRuleEngine:
         """
         logger.debug(f"Applying ontology rules for step {step}")
 
+        if self.use_jit:
+            return self._apply_rules_jit(boundary_conditions)
+
         # 使用边界条件更新本体模型
         for object_id, bc_values in boundary_conditions.items():
             if object_id in self.ontology_model:
                 self.ontology_model[object_id]['state'].update(bc_values)
 
-        # 应用本体推理
+        # 应用本体推理：对象之间互不依赖，可分区求值后合并
+        items = list(self.ontology_model.items())
+        partitions = self._partition(items)
+        if len(partitions) <= 1:
+            return self._evaluate_partition(items, boundary_conditions)
+
+        results = {}
+        futures = [
+            self._executor.submit(self._evaluate_partition, partition, boundary_conditions)
+            for partition in partitions
+        ]
+        for future in futures:
+            results.update(future.result())
+
+        return results
+
+    def _apply_rules_jit(self, boundary_conditions: Dict[int, Dict[str, float]]) -> Dict[int, Dict[str, float]]:
+        """写入边界条件后调用编译内核，把数组结果转换为字典并同步回本体实例状态。"""
+        arrays = self._state_arrays
+        arrays['inflow'].fill(0.0)
+        for object_id, bc_values in boundary_conditions.items():
+            index = self._positions.get(object_id)
+            if index is None:
+                continue
+            for metrics_code, value in bc_values.items():
+                target = arrays.get(metrics_code)
+                if target is not None:
+                    target[index] = value
+
+        _step_kernel(arrays['water_level'], arrays['flow'], arrays['gate_opening'], arrays['inflow'])
+
+        results = {}
+        ontology_model = self.ontology_model
+        for object_id, water_level, flow, gate_opening in zip(
+            self._object_ids,
+            arrays['water_level'].tolist(),
+            arrays['flow'].tolist(),
+            arrays['gate_opening'].tolist(),
+        ):
+            state = {'water_level': water_level, 'flow': flow, 'gate_opening': gate_opening}
+            results[object_id] = state
+            # 与 Python 路径一致，本体实例状态始终反映最近一步的结果
+            ontology_model[object_id]['state'] = state
+        return results
+
+    def _partition(self, items: List[Tuple[int, dict]]) -> List[List[Tuple[int, dict]]]:
+        """把对象切分为并行求值的分区；不满足并行条件时返回单个分区。"""
+        if self._executor is None:
+            return [items]
+        worker_count = min(
+            self._max_workers,
+            len(items) // self.min_objects_per_worker,
+        )
+        if worker_count <= 1:
+            return [items]
+        chunk_size = -(-len(items) // worker_count)
+        return [items[index:index + chunk_size] for index in range(0, len(items), chunk_size)]
+
+    def _evaluate_partition(
+        self,
+        items: List[Tuple[int, dict]],
+        boundary_conditions: Dict[int, Dict[str, float]],
+    ) -> Dict[int, Dict[str, float]]:
+        """对一个分区内的对象依次执行规则计算，只修改分区内对象的状态。"""
         results = {}
 
-        for object_id, obj_instance in self.ontology_model.items():
+        for object_id, obj_instance in items:
             # 模拟基于本体的计算
             # 真实实现中应使用本体推理，
             # 基于规则和约束推断新事实
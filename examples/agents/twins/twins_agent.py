@@ -126,12 +126,13 @@ class MyTwinsSimulationAgent(TwinsSimulationAgent):
         idz_config_url = self.properties.get_property('idz_config_url')
         config = YamlLoader.from_url(idz_config_url)
 
-        # 在错误上下文中创建水力求解器
+        # 在错误上下文中创建水力求解器；配置 use_jit=true 时使用 Numba 内核
+        use_jit = 'use_jit' in self.properties and self.properties.get_property_as_bool('use_jit')
         with AgentErrorContext(
             ErrorCodes.MODEL_INITIALIZATION_FAILURE,
             agent_name=self.agent_code
         ) as ctx:
-            self._hydraulic_solver = HydraulicSolver()
+            self._hydraulic_solver = HydraulicSolver(use_jit=use_jit)
 
         if ctx.has_error:
             logger.error(f"Failed to create solver: {ctx.error_message}")
@@ -310,39 +311,27 @@ class MyTwinsSimulationAgent(TwinsSimulationAgent):
 
     def on_boundary_condition_update(self, time_series_list: List[ObjectTimeSeries]):
         """
-        带错误处理地处理边界条件更新。
+        处理边界条件更新。
 
         外部边界条件更新时会调用该方法，例如来自现地测量、天气预报等。
+        SDK 已在调用前按列批量写入仿真状态，这里只记录各条对应的状态行。
 
         Args:
             time_series_list: 已更新的时序数据列表
         """
-        logger.info(f"Updating digital twins with {len(time_series_list)} boundary conditions")
-
-        # 带错误处理地记录边界条件更新
-        for time_series in time_series_list:
-            try:
-                logger.info(
-                    f"Boundary condition update: "
-                    f"object={time_series.object_name}, "
-                    f"metrics={time_series.metrics_code}, "
-                    f"values={len(time_series.time_series)}"
+        logger.info("Updating digital twins with %s boundary conditions", len(time_series_list))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            state_index = self.get_boundary_state()[0]
+            for time_series in time_series_list:
+                logger.debug(
+                    "Boundary condition update: object=%s, metrics=%s, values=%s, row=%s",
+                    time_series.object_name,
+                    time_series.metrics_code,
+                    len(time_series.time_series),
+                    state_index.get((time_series.object_id, time_series.metrics_code)),
                 )
 
-                # 如有需要则更新仿真状态
-                if self._simulation_state and time_series.object_id:
-                    state_key = f"{time_series.object_id}_{time_series.metrics_code}"
-                    self._simulation_state[state_key] = time_series
-
-                    logger.debug(f"Updated simulation state: {state_key}")
-
-            except Exception as e:
-                logger.error(
-                    f"Error updating boundary condition for {time_series.object_name}: {e}",
-                    exc_info=True
-                )
-                # 继续处理其他更新
-
 
 def main():
     """
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from hydros_agent_sdk.protocol.agent_commands.base import AgentCommand
 
@@ -20,6 +20,15 @@ class ControlCommandDispatcher:
     ):
         self.send_command = send_command
         self.build_station_target_value_request = build_station_target_value_request
+        self._command_builders: Dict[str, Callable[..., Optional[AgentCommand]]] = {}
+
+    def register_command_builder(
+        self,
+        target_command_type: str,
+        builder: Callable[..., Optional[AgentCommand]],
+    ) -> None:
+        """为指定控制类型登记专用指令构造函数；未登记的类型仍构造站点目标值指令。"""
+        self._command_builders[target_command_type] = builder
 
     def dispatch(self, control_commands: List[Any]) -> None:
         self.dispatch_prepared(self.prepare(control_commands))
@@ -31,6 +40,8 @@ class ControlCommandDispatcher:
         必须在发送前暴露由它生成的 request，以便登记关联关系。
         """
         prepared: List[AgentCommand] = []
+        command_builders = self._command_builders
+        default_builder = self.build_station_target_value_request
         for command in control_commands:
             if isinstance(command, AgentCommand):
                 prepared.append(command)
@@ -55,7 +66,8 @@ class ControlCommandDispatcher:
                 logger.warning("控制指令缺少必要字段，已跳过: %s", command)
                 continue
 
-            command_request = self.build_station_target_value_request(
+            build_command = command_builders.get(target_command_type, default_builder)
+            command_request = build_command(
                 target_agent_code=target_agent_code,
                 target_command_type=target_command_type,
                 target_value=target_value,
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import time
-from typing import Callable, Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING, Union
 
 from hydros_agent_sdk.protocol.agent_commands.base import AgentCommand
 from hydros_agent_sdk.topics import HydrosTopics
@@ -101,9 +101,9 @@ class AgentCommandClient:
                     raise
                 time.sleep((self.base_retry_delay_ms * (2 ** attempt)) / 1000.0)
 
-    def _handle_transport_payload(self, topic: str, payload_str: str) -> None:
+    def _handle_transport_payload(self, topic: str, raw_payload: Union[str, bytes]) -> None:
         try:
-            payload = json.loads(payload_str)
+            payload = json.loads(raw_payload)
             self.runtime.handle_incoming_command(self._decoder.decode(payload))
         except Exception as exc:
             logger.error(
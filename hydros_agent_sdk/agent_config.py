@@ -17,10 +17,14 @@
     mqtt_host = config.properties.output_config.mqtt_broker.mqtt_host
 """
 
+import copy
 import logging
+import sys
+from collections import OrderedDict
 from datetime import date, datetime
-from typing import Optional, Any, Dict, List
-from pydantic import ConfigDict, Field, field_validator
+from threading import Lock
+from typing import Optional, Any, Dict, List, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 from urllib.parse import quote
@@ -38,6 +42,12 @@ logger = logging.getLogger(__name__)
 LEGACY_PUBLIC_S3_PREFIX = "https://hydroos.cn/s3/"
 PUBLIC_S3_PREFIX = "https://s3.hydroos.pub/"
 
+# 按 URL 缓存已解析的配置及其 HTTP 校验头（ETag / Last-Modified），
+# 再次加载时发送条件请求，304 时直接复用，跳过下载、YAML 解析和模型校验。
+_CONFIG_CACHE_MAX_ENTRIES = 32
+_CONFIG_CACHE: "OrderedDict[str, Tuple[Optional[str], Optional[str], AgentConfiguration]]" = OrderedDict()
+_CONFIG_CACHE_LOCK = Lock()
+
 
 class Author(HydroBaseModel):
     """智能体配置的作者信息。"""
@@ -104,6 +114,8 @@ class AgentConfiguration(HydroBaseModel):
     properties: AgentProperties
     components: List[AgentComponentConfiguration] = Field(default_factory=list)
 
+    _merged_properties: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
     @field_validator('release_at', mode='before')
     @classmethod
     def normalize_release_at(cls, value: Any) -> Any:
@@ -133,6 +145,27 @@ class AgentConfiguration(HydroBaseModel):
 
 
 
+    def merged_properties(self) -> Dict[str, Any]:
+        """
+        返回 properties 与全部已启用组件属性合并后的字典（忽略 None 值）。
+
+        组件属性按声明顺序覆盖顶层属性。结果在首次调用时生成并缓存在
+        配置对象上，缓存命中的配置再次装配时无需重新合并；
+        返回的字典及其中的值应视为只读。
+
+        键在生成时驻留（sys.intern），与代码中 get_property 的字面量键是
+        同一对象，字典查找在比较时直接命中身份判断。
+        """
+        if self._merged_properties is None:
+            merged: Dict[str, Any] = {}
+            if self.properties:
+                _merge_property_values(merged, self.properties)
+            for component in self.components or []:
+                if component.enabled and component.properties:
+                    _merge_property_values(merged, component.properties)
+            self._merged_properties = merged
+        return self._merged_properties
+
     def get_property(self, key: str, default: Any = None) -> Any:
         """
         按 key 获取属性值，并支持可选默认值。
@@ -149,6 +182,26 @@ class AgentConfiguration(HydroBaseModel):
         return getattr(self.properties, key, default)
 
 
+def _merge_property_values(merged: Dict[str, Any], properties: AgentProperties) -> None:
+    """
+    把 properties 的非 None 字段（含 extra 字段）直接写入 merged，键驻留后写入。
+
+    等价于 merged.update(properties.model_dump(exclude_none=True))，但不经过
+    Pydantic 的递归序列化；嵌套模型转成字典，YAML 解析出的 dict/list 值深拷贝
+    后写入，合并结果与配置模型不共享可变对象。
+    """
+    extra = properties.__pydantic_extra__
+    for values in (properties.__dict__, extra) if extra else (properties.__dict__,):
+        for key, value in values.items():
+            if value is None:
+                continue
+            if isinstance(value, BaseModel):
+                value = value.model_dump(exclude_none=True)
+            elif isinstance(value, (dict, list)):
+                value = copy.deepcopy(value)
+            merged[sys.intern(key)] = value
+
+
 class AgentConfigLoader:
     """
     智能体配置文件加载类。
@@ -158,13 +211,19 @@ class AgentConfigLoader:
     """
 
     @staticmethod
-    def from_url(url: str, timeout: int = 30) -> AgentConfiguration:
+    def from_url(url: str, timeout: int = 30, use_cache: bool = True) -> AgentConfiguration:
         """
         从 URL 加载智能体配置。
 
+        服务端返回 ETag 或 Last-Modified 时，解析结果按 URL 缓存；再次加载同一
+        URL 时带 If-None-Match / If-Modified-Since 发起条件请求，304 时返回
+        缓存配置的深拷贝，无需重新解析 YAML。每次加载都会向服务端确认，不会返回
+        过期配置；缓存保存私有副本，调用方修改返回的配置不会影响之后的加载。
+
         Args:
             url: 获取 YAML 配置的 URL
             timeout: 请求超时时间，单位秒（默认 30）
+            use_cache: 是否使用条件请求缓存
 
         Returns:
             包含已解析配置的 AgentConfiguration 对象
@@ -182,7 +241,7 @@ class AgentConfigLoader:
             )
 
         normalized_url = AgentConfigLoader.normalize_legacy_public_s3_url(url)
-        logger.info(f"Loading agent configuration from URL: {normalized_url}")
+        logger.info("Loading agent configuration from URL: %s", normalized_url)
 
         try:
             # 编码 URL 以处理非 ASCII 字符（例如中文字符）
@@ -203,25 +262,72 @@ class AgentConfigLoader:
                 parsed.fragment
             ))
 
-            logger.debug(f"Encoded URL: {encoded_url}")
+            logger.debug("Encoded URL: %s", encoded_url)
 
             # 创建带有合适 header 的请求
             request = Request(encoded_url)
             request.add_header('User-Agent', SDK_USER_AGENT)
 
-            with urlopen(request, timeout=timeout) as response:
-                content = response.read().decode('utf-8')
-                return AgentConfigLoader.from_yaml_string(content)
+            cached = None
+            if use_cache:
+                with _CONFIG_CACHE_LOCK:
+                    cached = _CONFIG_CACHE.get(encoded_url)
+                if cached is not None:
+                    etag, last_modified, _ = cached
+                    if etag:
+                        request.add_header('If-None-Match', etag)
+                    if last_modified:
+                        request.add_header('If-Modified-Since', last_modified)
+
+            try:
+                with urlopen(request, timeout=timeout) as response:
+                    content = response.read().decode('utf-8')
+                    headers = getattr(response, 'headers', None)
+            except HTTPError as e:
+                if e.code == 304 and cached is not None:
+                    logger.info("Agent configuration not modified, reusing cached: %s", normalized_url)
+                    with _CONFIG_CACHE_LOCK:
+                        if encoded_url in _CONFIG_CACHE:
+                            _CONFIG_CACHE.move_to_end(encoded_url)
+                    return cached[2].model_copy(deep=True)
+                raise
+
+            config = AgentConfigLoader.from_yaml_string(content)
+            if use_cache:
+                AgentConfigLoader._store_cached_config(encoded_url, headers, config)
+            return config
         except HTTPError as e:
-            logger.error(f"HTTP error loading configuration from {normalized_url}: {e.code} {e.reason}")
+            logger.error("HTTP error loading configuration from %s: %s %s", normalized_url, e.code, e.reason)
             raise
         except URLError as e:
-            logger.error(f"URL error loading configuration from {normalized_url}: {e.reason}")
+            logger.error("URL error loading configuration from %s: %s", normalized_url, e.reason)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error loading configuration from {normalized_url}: {e}")
+            logger.error("Unexpected error loading configuration from %s: %s", normalized_url, e)
             raise
 
+    @staticmethod
+    def _store_cached_config(encoded_url: str, headers, config: AgentConfiguration) -> None:
+        """响应带校验头时缓存配置的私有深拷贝；无法校验新鲜度的响应不缓存。"""
+        etag = headers.get('ETag') if headers is not None else None
+        last_modified = headers.get('Last-Modified') if headers is not None else None
+        etag = etag if isinstance(etag, str) else None
+        last_modified = last_modified if isinstance(last_modified, str) else None
+        with _CONFIG_CACHE_LOCK:
+            if etag is None and last_modified is None:
+                _CONFIG_CACHE.pop(encoded_url, None)
+                return
+            _CONFIG_CACHE[encoded_url] = (etag, last_modified, config.model_copy(deep=True))
+            _CONFIG_CACHE.move_to_end(encoded_url)
+            while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_ENTRIES:
+                _CONFIG_CACHE.popitem(last=False)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """清空按 URL 缓存的配置。"""
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE.clear()
+
     @staticmethod
     def normalize_legacy_public_s3_url(url: Optional[str]) -> Optional[str]:
         if not url:
@@ -250,17 +356,17 @@ class AgentConfigLoader:
                 "Install it with: pip install pyyaml"
             )
 
-        logger.info(f"Loading agent configuration from file: {file_path}")
+        logger.info("Loading agent configuration from file: %s", file_path)
 
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 return AgentConfigLoader.from_yaml_string(content)
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {file_path}")
+            logger.error("Configuration file not found: %s", file_path)
             raise
         except Exception as e:
-            logger.error(f"Error loading configuration from file {file_path}: {e}")
+            logger.error("Error loading configuration from file %s: %s", file_path, e)
             raise
 
     @staticmethod
@@ -291,10 +397,10 @@ class AgentConfigLoader:
 
             return AgentConfiguration(**data)
         except yaml.YAMLError as e:
-            logger.error(f"YAML parsing error: {e}")
+            logger.error("YAML parsing error: %s", e)
             raise ValueError(f"Invalid YAML content: {e}")
         except Exception as e:
-            logger.error(f"Error parsing configuration: {e}")
+            logger.error("Error parsing configuration: %s", e)
             raise ValueError(f"Failed to parse agent configuration: {e}")
 
     @staticmethod
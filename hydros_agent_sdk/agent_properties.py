@@ -3,9 +3,14 @@
 
 本模块提供与 Java 实现对齐的 AgentProperties 类。
 它本质上是一个字典，并为常见属性类型提供类型化访问方法。
+类型化读取结果会被缓存，任何修改入口都会使缓存失效。
 """
 
-from typing import Any
+from typing import Any, Dict, Tuple
+
+# 只缓存不可变标量的转换结果；列表、字典等值可能被原地修改，
+# 不经过任何修改入口，缓存无法感知
+_CACHEABLE_VALUE_TYPES = (str, int, float, bool)
 
 
 class AgentProperties(dict):
@@ -17,8 +22,54 @@ class AgentProperties(dict):
 
     它扩展 dict 以支持灵活的键值存储，同时提供类型化访问方法，
     便于安全读取属性。
+
+    dict 的 C 实现（如 update）不会经过子类的 __setitem__，因此这里
+    覆盖全部修改入口，保证类型化读取缓存不会返回过期值；可被原地修改的
+    值（列表、字典等）不缓存转换结果。
     """
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__()
+        self._typed_cache: Dict[Tuple[str, str], Any] = {}
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # 反序列化时先写入条目再恢复实例属性，需经由 __init__ 重建缓存。
+        return self.__class__, (dict(self),)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._typed_cache.clear()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._typed_cache.clear()
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> "AgentProperties":
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._typed_cache.clear()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._typed_cache.clear()
+        return super().setdefault(key, default)
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        self._typed_cache.clear()
+        return super().pop(key, *args)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        self._typed_cache.clear()
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._typed_cache.clear()
+        super().clear()
+
     def get_property_as_integer(self, property_name: str) -> int:
         """
         将属性值读取为整数。
@@ -33,18 +84,26 @@ class AgentProperties(dict):
             KeyError: 未找到属性时抛出
             ValueError: 属性无法转换为整数时抛出
         """
+        cache_key = ("int", property_name)
+        if cache_key in self._typed_cache:
+            return self._typed_cache[cache_key]
+
         value = self.get(property_name)
         if value is None:
             raise KeyError(f"Property not found: {property_name}")
 
         try:
             if isinstance(value, (int, float)):
-                return int(value)
-            return int(str(value))
+                result = int(value)
+            else:
+                result = int(str(value))
         except (ValueError, TypeError) as e:
             raise ValueError(
                 f"Property '{property_name}' cannot be converted to integer: {value}"
             ) from e
+        if isinstance(value, _CACHEABLE_VALUE_TYPES):
+            self._typed_cache[cache_key] = result
+        return result
 
     def get_property_as_string(self, property_name: str) -> str:
         """
@@ -60,19 +119,26 @@ class AgentProperties(dict):
             KeyError: 未找到属性时抛出
             ValueError: 属性无法转换为字符串时抛出
         """
+        cache_key = ("str", property_name)
+        if cache_key in self._typed_cache:
+            return self._typed_cache[cache_key]
+
         value = self.get(property_name)
         if value is None:
             raise KeyError(f"Property not found: {property_name}")
 
         if isinstance(value, str):
-            return value
-
-        try:
-            return str(value)
-        except Exception as e:
-            raise ValueError(
-                f"Property '{property_name}' cannot be converted to string: {value}"
-            ) from e
+            result = value
+        else:
+            try:
+                result = str(value)
+            except Exception as e:
+                raise ValueError(
+                    f"Property '{property_name}' cannot be converted to string: {value}"
+                ) from e
+        if isinstance(value, _CACHEABLE_VALUE_TYPES):
+            self._typed_cache[cache_key] = result
+        return result
 
     def get_property_as_float(self, property_name: str) -> float:
         """
@@ -88,18 +154,26 @@ class AgentProperties(dict):
             KeyError: 未找到属性时抛出
             ValueError: 属性无法转换为浮点数时抛出
         """
+        cache_key = ("float", property_name)
+        if cache_key in self._typed_cache:
+            return self._typed_cache[cache_key]
+
         value = self.get(property_name)
         if value is None:
             raise KeyError(f"Property not found: {property_name}")
 
         try:
             if isinstance(value, (int, float)):
-                return float(value)
-            return float(str(value))
+                result = float(value)
+            else:
+                result = float(str(value))
         except (ValueError, TypeError) as e:
             raise ValueError(
                 f"Property '{property_name}' cannot be converted to float: {value}"
             ) from e
+        if isinstance(value, _CACHEABLE_VALUE_TYPES):
+            self._typed_cache[cache_key] = result
+        return result
 
     def get_property_as_bool(self, property_name: str) -> bool:
         """
@@ -114,17 +188,23 @@ class AgentProperties(dict):
         Raises:
             KeyError: 未找到属性时抛出
         """
+        cache_key = ("bool", property_name)
+        if cache_key in self._typed_cache:
+            return self._typed_cache[cache_key]
+
         value = self.get(property_name)
         if value is None:
             raise KeyError(f"Property not found: {property_name}")
 
         if isinstance(value, bool):
-            return value
-
-        if isinstance(value, str):
-            return value.lower() in ('true', 'yes', '1', 'on')
-
-        return bool(value)
+            result = value
+        elif isinstance(value, str):
+            result = value.lower() in ('true', 'yes', '1', 'on')
+        else:
+            result = bool(value)
+        if isinstance(value, _CACHEABLE_VALUE_TYPES):
+            self._typed_cache[cache_key] = result
+        return result
 
     def get_property(self, property_name: str, default: Any = None) -> Any:
         """
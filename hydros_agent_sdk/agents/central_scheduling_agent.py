@@ -5,7 +5,7 @@ CentralSchedulingAgent 提供不默认装配 MPC 的中央调度通用能力。
 """
 
 import logging
-from typing import Any, Optional, List, Dict
+from typing import Any, Callable, Optional, List, Dict
 from abc import abstractmethod
 
 from hydros_agent_sdk.agent_commands.dispatching import ControlCommandDispatcher
@@ -190,6 +190,18 @@ class CentralSchedulingAgent(TickableAgent):
             self._handle_control_command_response
         )
 
+    def register_control_command_builder(
+        self,
+        target_command_type: str,
+        builder: Callable[..., Optional[Any]],
+    ) -> None:
+        """登记 dict 控制意图按 target_command_type 使用的指令构造函数。
+
+        子类通常在 on_init 中调用；构造函数接收与
+        StationTargetValueCommandBuilder.build_station_target_value_request 相同的关键字参数。
+        """
+        self._control_command_dispatcher.register_command_builder(target_command_type, builder)
+
     def dispatch_control_commands_and_await_execution(
         self,
         control_commands: List[Any],
@@ -340,9 +352,7 @@ class CentralSchedulingAgent(TickableAgent):
         try:
             event = request.time_series_data_changed_event
             if event and event.object_time_series:
-                for time_series in event.object_time_series:
-                    cache_key = f"{time_series.object_id}_{time_series.metrics_code}"
-                    self._time_series_cache[cache_key] = time_series
+                self._ingest_and_apply(event.object_time_series)
                 self.on_boundary_condition_update(event.object_time_series)
 
             return ResponseFactory.time_series_data_update_succeed(self, request)
@@ -350,24 +360,15 @@ class CentralSchedulingAgent(TickableAgent):
             logger.error("Error handling central scheduling time series update: %s", e, exc_info=True)
             return ResponseFactory.time_series_data_update_failed(self, request)
 
-    def on_boundary_condition_update(self, time_series_list: List[ObjectTimeSeries]):
+    def _apply_single_boundary(self, time_series: ObjectTimeSeries) -> None:
         """
-        处理优化的边界条件更新。
-
-        该方法使用新的边界条件更新优化模型。
+        使用单条边界条件更新优化模型。
 
         参数:
-            time_series_list: 更新后的时间序列数据列表
+            time_series: 刚写入缓存的时间序列数据
         """
-        logger.info(f"Updating optimization model with {len(time_series_list)} boundary conditions")
-
-        # 使用边界条件更新优化模型
-        for time_series in time_series_list:
-            logger.debug(
-                f"Boundary condition: object={time_series.object_name}, "
-                f"metrics={time_series.metrics_code}"
-            )
-            # 待办：更新优化模型约束
+        # 待办：更新优化模型约束
+        pass
 
     def get_metrics_topic(self) -> str:
         """返回中央调度指标数据使用的 MQTT topic。"""
@@ -332,9 +332,7 @@ class MpcCentralSchedulingAgent(CentralSchedulingAgent):
         try:
             event = request.time_series_data_changed_event
             if event and event.object_time_series:
-                for time_series in event.object_time_series:
-                    cache_key = f"{time_series.object_id}_{time_series.metrics_code}"
-                    self._time_series_cache[cache_key] = time_series
+                self._ingest_and_apply(event.object_time_series)
                 self.on_boundary_condition_update(event.object_time_series)
 
             self._mpc_rolling_runtime.handle_time_series_changed(event)
@@ -4,10 +4,16 @@
 本模块提供 OntologySimulationAgent 类，在 TickableAgent 基础上增加本体仿真能力。
 """
 
+import copy
 import logging
-from typing import Optional, List
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional, List, Tuple
+from urllib.parse import urlparse
 
 from .tickable_agent import TickableAgent
+from hydros_agent_sdk.utils.hydro_object_utils import HydroObjectUtilsV2, WaterwayTopology
 from hydros_agent_sdk.runtime.response_factory import ResponseFactory
 from hydros_agent_sdk.utils.mqtt_metrics import MqttMetrics
 from hydros_agent_sdk.protocol.commands import (
@@ -26,6 +32,78 @@ from hydros_agent_sdk.protocol.models import (
 
 logger = logging.getLogger(__name__)
 
+_LOG_BANNER = "=" * 70
+
+# 同一进程内多个任务/智能体共享的拓扑缓存。缓存中保存一份原始拓扑，
+# 每个智能体拿到各自的深拷贝，修改自己的拓扑不会影响其他智能体
+_TOPOLOGY_CACHE_MAX_ENTRIES = 8
+_TOPOLOGY_CACHE: "OrderedDict[Tuple[Any, ...], WaterwayTopology]" = OrderedDict()
+_TOPOLOGY_CACHE_LOCK = Lock()
+# HTTP(S) 建模 URL -> (确认时刻 time.monotonic(), 源文件版本)。在有效期内复用上次确认的
+# 版本，同一批初始化的智能体不必各自发起一次 HEAD 请求（服务端慢时每次最长要等超时）；
+# 本地文件的 stat 几乎没有开销，每次都重新确认
+_SOURCE_VERSION_TTL_SECONDS = 60.0
+_SOURCE_VERSIONS: Dict[str, Tuple[float, str]] = {}
+
+
+def _modeling_source_version(modeling_url: str) -> Optional[str]:
+    """获取建模源文件版本；HTTP(S) 源在有效期内复用上次成功确认的结果，无法确定时不记录。"""
+    if urlparse(modeling_url).scheme not in ('http', 'https'):
+        return HydroObjectUtilsV2.get_modeling_source_version(modeling_url)
+
+    now = time.monotonic()
+    with _TOPOLOGY_CACHE_LOCK:
+        validated = _SOURCE_VERSIONS.get(modeling_url)
+    if validated is not None and now - validated[0] < _SOURCE_VERSION_TTL_SECONDS:
+        return validated[1]
+
+    source_version = HydroObjectUtilsV2.get_modeling_source_version(modeling_url)
+    if source_version is not None:
+        with _TOPOLOGY_CACHE_LOCK:
+            _SOURCE_VERSIONS[modeling_url] = (now, source_version)
+    return source_version
+
+
+def _load_cached_topology(
+    modeling_url: str,
+    param_keys: Optional[Iterable[str]],
+    with_metrics_code: bool,
+) -> WaterwayTopology:
+    """
+    按建模 URL、参数键和源文件版本缓存拓扑；无法确定版本时不缓存。
+
+    每次返回的拓扑都归调用方独有（缓存命中时返回深拷贝）。
+    """
+    source_version = _modeling_source_version(modeling_url)
+    normalized_param_keys = None if param_keys is None else frozenset(param_keys)
+    if source_version is None:
+        return HydroObjectUtilsV2.build_waterway_topology(
+            modeling_yml_uri=modeling_url,
+            param_keys=normalized_param_keys,
+            with_metrics_code=with_metrics_code,
+        )
+
+    cache_key = (modeling_url, normalized_param_keys, with_metrics_code, source_version)
+    with _TOPOLOGY_CACHE_LOCK:
+        topology = _TOPOLOGY_CACHE.get(cache_key)
+        if topology is not None:
+            _TOPOLOGY_CACHE.move_to_end(cache_key)
+    if topology is not None:
+        logger.info("Reusing cached topology: %s", modeling_url)
+        return copy.deepcopy(topology)
+
+    topology = HydroObjectUtilsV2.build_waterway_topology(
+        modeling_yml_uri=modeling_url,
+        param_keys=normalized_param_keys,
+        with_metrics_code=with_metrics_code,
+    )
+    cached_topology = copy.deepcopy(topology)
+    with _TOPOLOGY_CACHE_LOCK:
+        _TOPOLOGY_CACHE[cache_key] = cached_topology
+        while len(_TOPOLOGY_CACHE) > _TOPOLOGY_CACHE_MAX_ENTRIES:
+            _TOPOLOGY_CACHE.popitem(last=False)
+    return topology
+
 
 class OntologySimulationAgent(TickableAgent):
     """
@@ -58,6 +136,8 @@ class OntologySimulationAgent(TickableAgent):
         ```
     """
 
+    __slots__ = ('_ontology_model', '_topology', '_adjacency')
+
     def __init__(
         self,
         sim_coordination_client,
@@ -108,8 +188,10 @@ class OntologySimulationAgent(TickableAgent):
         # 本体模型和拓扑
         self._ontology_model = None
         self._topology = None
+        # 拓扑的 CSR 邻接表示，按步遍历上下游时使用
+        self._adjacency = None
 
-        logger.info(f"OntologySimulationAgent initialized: {self.agent_id}")
+        logger.info("OntologySimulationAgent initialized: %s", self.agent_id)
 
     def on_init(self, request: SimTaskInitRequest) -> SimTaskInitResponse:
         """
@@ -127,31 +209,35 @@ class OntologySimulationAgent(TickableAgent):
         Returns:
             任务初始化响应
         """
-        logger.info("="*70)
-        logger.info(f"INITIALIZING ONTOLOGY SIMULATION AGENT: {self.biz_scene_instance_id}")
-        logger.info("="*70)
+        logger.info(_LOG_BANNER)
+        logger.info("INITIALIZING ONTOLOGY SIMULATION AGENT: %s", self.biz_scene_instance_id)
+        logger.info(_LOG_BANNER)
 
         try:
             # 加载智能体配置
             logger.info("Loading agent configuration...")
             self.load_agent_configuration(request)
-            logger.info(f"Configuration loaded with {len(self.properties)} properties")
+            logger.info("Configuration loaded with %s properties", len(self.properties))
 
             # 从本体模型加载水网拓扑
             hydros_objects_modeling_url = self.properties.get_property('hydros_objects_modeling_url')
             if hydros_objects_modeling_url:
                 logger.info("Loading water network topology from ontology model...")
-                from hydros_agent_sdk.utils import HydroObjectUtilsV2
 
-                # 加载包含指定参数的拓扑
+                # 加载包含指定参数的拓扑；相同版本的建模文件复用已构建的拓扑
                 param_keys = self.properties.get_property('param_keys', {'max_opening', 'min_opening'})
-                self._topology = HydroObjectUtilsV2.build_waterway_topology(
-                    modeling_yml_uri=hydros_objects_modeling_url,
-                    param_keys=param_keys,
-                    with_metrics_code=True
+                self._topology = _load_cached_topology(
+                    hydros_objects_modeling_url,
+                    param_keys,
+                    with_metrics_code=True,
                 )
 
-                logger.info(f"Loaded topology with {len(self._topology.top_objects)} top-level objects")
+                self._adjacency = self._topology.adjacency()
+                logger.info(
+                    "Loaded topology with %s top-level objects, %s adjacency nodes",
+                    len(self._topology.top_objects),
+                    len(self._adjacency),
+                )
 
                 # 初始化本体模型（子类专属）
                 self._initialize_ontology_model()
@@ -161,19 +247,20 @@ class OntologySimulationAgent(TickableAgent):
             # 将智能体状态更新为 ACTIVE
             object.__setattr__(self, 'agent_status', AgentStatus.ACTIVE)
 
-            logger.info(f"Ontology simulation agent initialized: {self.agent_id}")
+            logger.info("Ontology simulation agent initialized: %s", self.agent_id)
 
             response = ResponseFactory.init_succeed(self, request)
 
             logger.info(
-                f"发布协调指令成功,commandId={response.command_id},"
-                f"commandType=sim_task_init_response 到MQTT Topic={self.sim_coordination_client.topic}"
+                "发布协调指令成功,commandId=%s,commandType=sim_task_init_response 到MQTT Topic=%s",
+                response.command_id,
+                self.sim_coordination_client.topic,
             )
 
             return response
 
         except Exception as e:
-            logger.error(f"Failed to initialize ontology simulation agent: {e}", exc_info=True)
+            logger.error("Failed to initialize ontology simulation agent: %s", e, exc_info=True)
 
             return ResponseFactory.init_failed(self, request)
 
@@ -197,15 +284,15 @@ class OntologySimulationAgent(TickableAgent):
         Returns:
             要通过 MQTT 发送的 MqttMetrics 对象列表
         """
-        logger.info(f"Executing ontology simulation step {request.step}")
+        logger.info("Executing ontology simulation step %s", request.step)
 
         try:
             metrics_list = self._execute_ontology_simulation(request.step)
-            logger.info(f"Ontology simulation step {request.step} completed")
+            logger.info("Ontology simulation step %s completed", request.step)
             return metrics_list
 
         except Exception as e:
-            logger.error(f"Error in ontology simulation step {request.step}: {e}", exc_info=True)
+            logger.error("Error in ontology simulation step %s: %s", request.step, e, exc_info=True)
             return None
 
     def _execute_ontology_simulation(self, step: int) -> List[MqttMetrics]:
@@ -225,24 +312,15 @@ class OntologySimulationAgent(TickableAgent):
         logger.warning("Using default ontology simulation (no-op)")
         return []
 
-    def on_boundary_condition_update(self, time_series_list: List[ObjectTimeSeries]):
+    def _apply_single_boundary(self, time_series: ObjectTimeSeries) -> None:
         """
-        处理本体仿真的边界条件更新。
-
-        该方法会用新的边界条件更新本体模型。
+        使用单条边界条件更新本体模型。
 
         Args:
-            time_series_list: 已更新的时序数据列表
+            time_series: 刚写入缓存的时序数据
         """
-        logger.info(f"Updating ontology model with {len(time_series_list)} boundary conditions")
-
-        # 使用边界条件更新本体模型
-        for time_series in time_series_list:
-            logger.debug(
-                f"Boundary condition: object={time_series.object_name}, "
-                f"metrics={time_series.metrics_code}"
-            )
-            # 待办：更新本体模型状态
+        # 待办：更新本体模型状态
+        pass
 
     def on_terminate(self, request: SimTaskTerminateRequest) -> SimTaskTerminateResponse:
         """
@@ -259,27 +337,29 @@ class OntologySimulationAgent(TickableAgent):
         Returns:
             任务终止响应
         """
-        logger.info("="*70)
-        logger.info(f"TERMINATING ONTOLOGY SIMULATION AGENT: {self.biz_scene_instance_id}")
-        logger.info("="*70)
+        logger.info(_LOG_BANNER)
+        logger.info("TERMINATING ONTOLOGY SIMULATION AGENT: %s", self.biz_scene_instance_id)
+        logger.info(_LOG_BANNER)
 
         try:
             # 清理本体模型
             self._ontology_model = None
             self._topology = None
+            self._adjacency = None
 
-            logger.info(f"Ontology simulation agent terminated: {self.agent_id}")
+            logger.info("Ontology simulation agent terminated: %s", self.agent_id)
 
             response = ResponseFactory.terminate_succeed(self, request)
 
             logger.info(
-                f"发布协调指令成功,commandId={response.command_id},"
-                f"commandType=sim_task_terminate_response 到MQTT Topic={self.sim_coordination_client.topic}"
+                "发布协调指令成功,commandId=%s,commandType=sim_task_terminate_response 到MQTT Topic=%s",
+                response.command_id,
+                self.sim_coordination_client.topic,
             )
 
             return response
 
         except Exception as e:
-            logger.error(f"Error terminating ontology simulation agent: {e}", exc_info=True)
+            logger.error("Error terminating ontology simulation agent: %s", e, exc_info=True)
 
             return ResponseFactory.terminate_failed(self, request)
@@ -7,14 +7,14 @@ tick 驱动仿真能力和时序数据更新处理。
 
 import logging
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Union
 
 from hydros_agent_sdk.base_agent import BaseHydroAgent
 from hydros_agent_sdk.error_codes import ErrorCodes
 from hydros_agent_sdk.runtime.response_factory import ResponseFactory
 from hydros_agent_sdk.runtime.time_series_cache import TimeSeriesCache
 from hydros_agent_sdk.transport.mqtt_metrics_publisher import MqttMetricsPublisher
-from hydros_agent_sdk.utils.mqtt_metrics import MqttMetrics
+from hydros_agent_sdk.utils.mqtt_metrics import MetricsColumns, MqttMetrics
 from hydros_agent_sdk.protocol.commands import (
     TickCmdRequest,
     TickCmdResponse,
@@ -62,6 +62,15 @@ class TickableAgent(BaseHydroAgent):
     - on_boundary_condition_update(): 响应缓存后的边界条件变化
     """
 
+    # tick 热路径上的运行时状态放入 slot：Pydantic extra 属性每次读取都要走
+    # BaseModel.__getattr__ 回退查找，slot 则是直接的描述符访问。
+    __slots__ = (
+        '_current_step',
+        'time_series_cache',
+        '_time_series_cache',
+        'metrics_publisher',
+    )
+
     def __init__(
         self,
         sim_coordination_client,
@@ -121,7 +130,7 @@ class TickableAgent(BaseHydroAgent):
             edge_node_code=hydros_node_id,
         )
 
-        logger.info(f"TickableAgent initialized: {self.agent_id}")
+        logger.info("TickableAgent initialized: %s", self.agent_id)
 
     def supports_tick_command(self) -> bool:
         """返回该智能体是否参与仿真 tick 分派。"""
@@ -145,31 +154,19 @@ class TickableAgent(BaseHydroAgent):
             Tick 指令响应
         """
         self._current_step = request.step
+        # 每个仿真步都会经过这里，逐步日志只在 DEBUG 记录
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        logger.info(f"Processing tick: step={request.step}, commandId={request.command_id}")
+        if debug_enabled:
+            logger.debug("Processing tick: step=%s, commandId=%s", request.step, request.command_id)
 
+        # 异常捕获只包住子类计算；成功响应和指标发布在 try 之外
         try:
             # 执行仿真步（子类专属逻辑）
             metrics_list = self.on_tick_simulation(request)
-            if isinstance(metrics_list, TickCmdResponse):
-                return metrics_list
-
-            # 通过 MQTT 发送指标数据
-            if metrics_list:
-                self.metrics_publisher.publish_batch(metrics_list)
-                logger.info(f"Sent {len(metrics_list)} metrics for step {request.step}")
-
-            response = ResponseFactory.tick_succeed(self, request)
-
-            logger.info(
-                f"发布协调指令成功,commandId={response.command_id},"
-                f"commandType=tick_cmd_response 到MQTT Topic={self.sim_coordination_client.topic}"
-            )
-
-            return response
 
         except Exception as e:
-            logger.error(f"Error processing tick {request.step}: {e}", exc_info=True)
+            logger.error("Error processing tick %s: %s", request.step, e, exc_info=True)
 
             return ResponseFactory.tick_failed(
                 self,
@@ -181,18 +178,68 @@ class TickableAgent(BaseHydroAgent):
                 ),
             )
 
+        # 未返回指标（None 或空列表）时完全跳过发布路径
+        if metrics_list:
+            if isinstance(metrics_list, TickCmdResponse):
+                return metrics_list
+            self._publish_tick_metrics(request, metrics_list, debug_enabled)
+
+        response = ResponseFactory.tick_succeed(self, request)
+
+        if debug_enabled:
+            logger.debug(
+                "发布协调指令成功,commandId=%s,commandType=tick_cmd_response 到MQTT Topic=%s",
+                response.command_id,
+                self.sim_coordination_client.topic,
+            )
+
+        return response
+
+    def _publish_tick_metrics(
+        self,
+        request: TickCmdRequest,
+        metrics_list: Union[List[MqttMetrics], MetricsColumns],
+        debug_enabled: bool,
+    ) -> None:
+        """
+        发布本步指标。
+
+        本步计算已经完成，发布失败只记录错误，不把 tick 判为失败。
+        """
+        try:
+            # 通过 MQTT 发送指标数据；按列返回时直接由列数据编码报文
+            if isinstance(metrics_list, MetricsColumns):
+                metrics_count = self.metrics_publisher.publish_columns(
+                    metrics_list,
+                    step_index=request.step,
+                    source_id=self.agent_code,
+                    biz_scene_instance_id=self.biz_scene_instance_id,
+                )
+            else:
+                metrics_count = self.metrics_publisher.publish_batch(metrics_list)
+        except Exception as e:
+            logger.error("Error publishing metrics for step %s: %s", request.step, e, exc_info=True)
+            return
+        if debug_enabled:
+            logger.debug("Sent %s metrics for step %s", metrics_count, request.step)
+
     @abstractmethod
-    def on_tick_simulation(self, request: TickCmdRequest) -> Optional[List[MqttMetrics]]:
+    def on_tick_simulation(
+        self,
+        request: TickCmdRequest,
+    ) -> Union[List[MqttMetrics], MetricsColumns, None]:
         """
         执行仿真步逻辑。
 
-        子类在这里实现各自的仿真逻辑。
+        子类在这里实现各自的仿真逻辑。指标量大时可返回 MetricsColumns，
+        按列给出对象 ID、对象名、指标编码和值，SDK 直接编码报文，
+        step_index 和 source_id 取自当前请求和 agent_code。
 
         Args:
             request: Tick 指令请求
 
         Returns:
-            要通过 MQTT 发送的 MqttMetrics 对象列表，或 None
+            要通过 MQTT 发送的 MqttMetrics 对象列表、MetricsColumns，或 None
         """
         pass
 
@@ -202,11 +249,12 @@ class TickableAgent(BaseHydroAgent):
 
         该方法会：
         1. 从事件中提取时序数据
-        2. 更新内部缓存
+        2. 单趟遍历：更新内部缓存并调用 _apply_single_boundary()
         3. 调用 on_boundary_condition_update() 执行子类专属处理
         4. 返回 TimeSeriesDataUpdateResponse
 
-        子类可覆盖 on_boundary_condition_update() 来处理边界条件变化。
+        逐条处理边界条件的子类应覆盖 _apply_single_boundary()，避免再次遍历列表；
+        需要整批处理时再覆盖 on_boundary_condition_update()。
 
         Args:
             request: 时序数据更新请求
@@ -214,30 +262,53 @@ class TickableAgent(BaseHydroAgent):
         Returns:
             时序数据更新响应
         """
-        logger.info(f"Received time series data update: commandId={request.command_id}")
-
-        try:
-            # 从事件中提取时间序列数据
-            event = request.time_series_data_changed_event
-            if event and event.object_time_series:
-                for time_series in event.object_time_series:
-                    self.time_series_cache.update(time_series)
-
-                    logger.info(
-                        f"Updated time series: object={time_series.object_name}, "
-                        f"metrics={time_series.metrics_code}, "
-                        f"values={len(time_series.time_series)}"
-                    )
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Received time series data update: commandId=%s", request.command_id)
+
+        # 从事件中提取时间序列数据
+        event = request.time_series_data_changed_event
+        if event and event.object_time_series:
+            try:
+                self._ingest_and_apply(event.object_time_series)
+                if debug_enabled:
+                    logger.debug("Updated %s time series", len(event.object_time_series))
 
                 # 调用子类专属处理器
                 self.on_boundary_condition_update(event.object_time_series)
 
-            return ResponseFactory.time_series_data_update_succeed(self, request)
+            except Exception as e:
+                logger.error("Error handling time series data update: %s", e, exc_info=True)
 
-        except Exception as e:
-            logger.error(f"Error handling time series data update: {e}", exc_info=True)
+                return ResponseFactory.time_series_data_update_failed(self, request)
+
+        return ResponseFactory.time_series_data_update_succeed(self, request)
+
+    def _ingest_and_apply(self, time_series_list: List[ObjectTimeSeries]) -> None:
+        """在一趟遍历中写入时序缓存并逐条应用边界条件。"""
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for time_series in time_series_list:
+            self.time_series_cache.update(time_series)
 
-            return ResponseFactory.time_series_data_update_failed(self, request)
+            if debug_enabled:
+                logger.debug(
+                    "Updated time series: object=%s, metrics=%s, values=%s",
+                    time_series.object_name,
+                    time_series.metrics_code,
+                    len(time_series.time_series),
+                )
+            self._apply_single_boundary(time_series)
+
+    def _apply_single_boundary(self, time_series: ObjectTimeSeries) -> None:
+        """
+        应用单条已缓存的边界条件。
+
+        子类可覆盖该方法逐条更新模型状态。默认实现不执行任何操作。
+
+        Args:
+            time_series: 刚写入缓存的时序数据
+        """
+        pass
 
     def on_boundary_condition_update(self, time_series_list: List[ObjectTimeSeries]):
         """
@@ -250,6 +321,21 @@ class TickableAgent(BaseHydroAgent):
         """
         pass
 
+    def flush_metrics(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        刷出后台 writer 中尚未发布的指标并停止 writer。
+
+        metrics_write_and_flush=False 时 on_tick 不等待指标发布完成，
+        任务终止时由运行时调用本方法保证已入队指标最终送达。
+
+        Args:
+            timeout: 等待 writer 排空的秒数
+
+        Returns:
+            是否在超时前排空
+        """
+        return self.metrics_publisher.close(timeout)
+
     @property
     def current_step(self) -> int:
         """获取当前仿真步。"""
@@ -5,10 +5,18 @@
 """
 
 import logging
-from typing import Optional, List
+import math
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from threading import Lock
+from typing import Dict, Optional, List, Sequence, Tuple
 
 from .tickable_agent import TickableAgent
 from hydros_agent_sdk.runtime.response_factory import ResponseFactory
+from hydros_agent_sdk.runtime.time_series_cache import CacheKey
+from hydros_agent_sdk.utils import HydroObjectUtilsV2
 from hydros_agent_sdk.utils.mqtt_metrics import MqttMetrics, create_mock_metrics
 from hydros_agent_sdk.protocol.commands import (
     SimTaskInitRequest,
@@ -26,6 +34,24 @@ from hydros_agent_sdk.protocol.models import (
 
 logger = logging.getLogger(__name__)
 
+_LOG_BANNER = "=" * 70
+
+# 后台加载拓扑的共享线程池，首次使用时创建。生命周期与进程相同，不单独关闭：
+# 空闲的工作线程不占用拓扑数据，解释器退出时由 concurrent.futures 统一回收
+_TOPOLOGY_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_TOPOLOGY_EXECUTOR_LOCK = Lock()
+
+
+def _topology_executor() -> ThreadPoolExecutor:
+    global _TOPOLOGY_EXECUTOR
+    with _TOPOLOGY_EXECUTOR_LOCK:
+        if _TOPOLOGY_EXECUTOR is None:
+            _TOPOLOGY_EXECUTOR = ThreadPoolExecutor(
+                max_workers=4,
+                thread_name_prefix="TwinsTopologyLoader",
+            )
+        return _TOPOLOGY_EXECUTOR
+
 
 class TwinsSimulationAgent(TickableAgent):
     """
@@ -59,6 +85,17 @@ class TwinsSimulationAgent(TickableAgent):
         ```
     """
 
+    __slots__ = (
+        '_twins_model',
+        '_topology',
+        '_state_index',
+        '_state_values',
+        '_state_steps',
+        '_make_metrics',
+        '_mock_metric_spec',
+        '_topology_future',
+    )
+
     def __init__(
         self,
         sim_coordination_client,
@@ -109,9 +146,23 @@ class TwinsSimulationAgent(TickableAgent):
         # 数字孪生模型和状态
         self._twins_model = None
         self._topology = None
-        self._simulation_state = {}
+        # 边界条件状态按列存储：(object_id, metrics_code) -> 行号，
+        # 各行的最新值（float64，缺失记为 NaN）和对应 step（int64，缺失记为 -1）
+        self._state_index: Dict[CacheKey, int] = {}
+        self._state_values = array('d')
+        self._state_steps = array('q')
+        # 默认模拟指标的 (object_id, object_name, metrics_code)，拓扑加载后一次性生成
+        self._mock_metric_spec: Optional[List[Tuple[int, Optional[str], str]]] = None
+        # async_topology_load=true 时后台加载拓扑的 Future，首个 tick 前等待完成
+        self._topology_future: Optional[Future] = None
+        # 逐条构造指标时绑定不变的来源和任务字段
+        self._make_metrics = partial(
+            create_mock_metrics,
+            source_id=agent_code,
+            job_instance_id=context.biz_scene_instance_id,
+        )
 
-        logger.info(f"TwinsSimulationAgent initialized: {self.agent_id}")
+        logger.info("TwinsSimulationAgent initialized: %s", self.agent_id)
 
     def on_init(self, request: SimTaskInitRequest) -> SimTaskInitResponse:
         """
@@ -129,59 +180,84 @@ class TwinsSimulationAgent(TickableAgent):
         Returns:
             任务初始化响应
         """
-        logger.info("="*70)
-        logger.info(f"INITIALIZING DIGITAL TWINS SIMULATION AGENT: {self.biz_scene_instance_id}")
-        logger.info("="*70)
+        logger.info(_LOG_BANNER)
+        logger.info("INITIALIZING DIGITAL TWINS SIMULATION AGENT: %s", self.biz_scene_instance_id)
+        logger.info(_LOG_BANNER)
 
         try:
             # 加载智能体配置
             logger.info("Loading agent configuration...")
             self.load_agent_configuration(request)
-            logger.info(f"Configuration loaded with {len(self.properties)} properties")
+            logger.info("Configuration loaded with %s properties", len(self.properties))
 
             # 加载水网拓扑
             hydros_objects_modeling_url = self.properties.get_property('hydros_objects_modeling_url')
             if hydros_objects_modeling_url:
-                logger.info("Loading water network topology for digital twins...")
-                from hydros_agent_sdk.utils import HydroObjectUtilsV2
-
                 # 加载包含全部参数的拓扑，用于高保真仿真
                 param_keys = self.properties.get_property(
                     'param_keys',
                     {'max_opening', 'min_opening', 'interpolate_cross_section_count'}
                 )
-                self._topology = HydroObjectUtilsV2.build_waterway_topology(
-                    modeling_yml_uri=hydros_objects_modeling_url,
-                    param_keys=param_keys,
-                    with_metrics_code=True
+                async_load = (
+                    'async_topology_load' in self.properties
+                    and self.properties.get_property_as_bool('async_topology_load')
                 )
-
-                logger.info(f"Loaded topology with {len(self._topology.top_objects)} top-level objects")
-
-                # 初始化数字孪生模型（子类专属）
-                self._initialize_twins_model()
+                if async_load:
+                    # 大型水网的下载和解析放到后台，初始化响应不必等待
+                    logger.info("Loading water network topology for digital twins in background...")
+                    self._topology_future = _topology_executor().submit(
+                        _build_topology, hydros_objects_modeling_url, param_keys
+                    )
+                else:
+                    logger.info("Loading water network topology for digital twins...")
+                    self._apply_topology(_build_topology(hydros_objects_modeling_url, param_keys))
             else:
                 logger.warning("No hydros_objects_modeling_url configured")
 
             # 将智能体状态更新为 ACTIVE
             object.__setattr__(self, 'agent_status', AgentStatus.ACTIVE)
 
-            logger.info(f"Digital twins simulation agent initialized: {self.agent_id}")
+            logger.info("Digital twins simulation agent initialized: %s", self.agent_id)
 
             response = ResponseFactory.init_succeed(self, request)
 
             logger.info(
-                f"发布协调指令成功,commandId={response.command_id},"
-                f"commandType=sim_task_init_response 到MQTT Topic={self.sim_coordination_client.topic}"
+                "发布协调指令成功,commandId=%s,commandType=sim_task_init_response 到MQTT Topic=%s",
+                response.command_id,
+                self.sim_coordination_client.topic,
             )
 
             return response
 
         except Exception as e:
-            logger.error(f"Failed to initialize digital twins simulation agent: {e}", exc_info=True)
+            logger.error("Failed to initialize digital twins simulation agent: %s", e, exc_info=True)
 
             return ResponseFactory.init_failed(self, request)
 
+    def _apply_topology(self, topology) -> None:
+        """写入已加载的水网拓扑并初始化数字孪生模型。"""
+        self._topology = topology
+
+        logger.info("Loaded topology with %s top-level objects", len(topology.top_objects))
+
+        # 初始化数字孪生模型（子类专属）
+        self._initialize_twins_model()
+        self._mock_metric_spec = self._build_mock_metric_spec()
+
+    def _await_topology(self) -> None:
+        """
+        等待后台拓扑加载完成。
+
+        后台线程只构建拓扑，结果在这里（tick 所在线程）写回智能体；终止时
+        Future 已被丢弃，晚到的结果不会再写回。加载失败时重新抛出原异常，
+        由 on_tick 返回失败响应；成功后不再等待。
+        """
+        future = self._topology_future
+        if future is not None:
+            topology = future.result()
+            self._topology_future = None
+            self._apply_topology(topology)
+
     def _initialize_twins_model(self):
         """
         初始化数字孪生模型。
@@ -203,15 +279,17 @@ class TwinsSimulationAgent(TickableAgent):
         Returns:
             要通过 MQTT 发送的 MqttMetrics 对象列表
         """
-        logger.info(f"Executing digital twins simulation step {request.step}")
+        logger.info("Executing digital twins simulation step %s", request.step)
+
+        self._await_topology()
 
         try:
             metrics_list = self._execute_twins_simulation(request.step)
-            logger.info(f"Digital twins simulation step {request.step} completed")
+            logger.info("Digital twins simulation step %s completed", request.step)
             return metrics_list
 
         except Exception as e:
-            logger.error(f"Error in digital twins simulation step {request.step}: {e}", exc_info=True)
+            logger.error("Error in digital twins simulation step %s: %s", request.step, e, exc_info=True)
             return None
 
     def _execute_twins_simulation(self, step: int) -> List[MqttMetrics]:
@@ -230,47 +308,162 @@ class TwinsSimulationAgent(TickableAgent):
         # 子类应覆盖该方法
         logger.warning("Using default digital twins simulation (mock data)")
 
-        metrics_list = []
+        spec = self._mock_metric_spec
+        if spec is None:
+            spec = self._build_mock_metric_spec()
+            # 拓扑尚未加载时得到的是空表，不缓存，拓扑就绪后的下一步再构建
+            if self._topology is not None:
+                self._mock_metric_spec = spec
+
+        value = 0.5 + (step % 10) * 0.05
+        make_metrics = self._make_metrics
+        return [
+            make_metrics(
+                object_id=object_id,
+                object_name=object_name,
+                step_index=step,
+                metrics_code=metrics_code,
+                value=value,
+            )
+            for object_id, object_name, metrics_code in spec
+        ]
+
+    def _build_mock_metric_spec(self) -> List[Tuple[int, Optional[str], str]]:
+        """从拓扑中选出默认模拟指标的输出对象，避免每个 tick 重新遍历拓扑。"""
+        spec = []
         if self._topology:
-            for top_obj in self._topology.top_objects[:3]:  # 前 3 个对象
-                for child in top_obj.children[:2]:  # 前 2 个子对象
-                    if child.metrics:
-                        for metrics_code in child.metrics[:1]:  # 第 1 个指标
-                            metrics_list.append(create_mock_metrics(
-                                source_id=self.agent_code,
-                                job_instance_id=self.biz_scene_instance_id,
-                                object_id=child.object_id,
-                                object_name=child.object_name,
-                                step_index=step,
-                                metrics_code=metrics_code,
-                                value=0.5 + (step % 10) * 0.05
-                            ))
-
-        return metrics_list
-
-    def on_boundary_condition_update(self, time_series_list: List[ObjectTimeSeries]):
+            for top_obj in islice(self._topology.top_objects, 3):  # 前 3 个对象
+                for child in islice(top_obj.children, 2):  # 前 2 个子对象
+                    for metrics_code in islice(child.metrics, 1):  # 第 1 个指标
+                        spec.append((child.object_id, child.object_name, metrics_code))
+        return spec
+
+    def _ingest_and_apply(self, time_series_list: List[ObjectTimeSeries]) -> None:
         """
-        处理数字孪生仿真的边界条件更新。
+        写入时序缓存后按列一次性更新边界条件状态。
 
-        该方法用新的边界条件更新仿真状态，用于与物理系统实时同步。
+        子类覆盖了 _apply_single_boundary() 时回退到基类的逐条处理，保持其调用约定。
+        """
+        if type(self)._apply_single_boundary is not TwinsSimulationAgent._apply_single_boundary:
+            super()._ingest_and_apply(time_series_list)
+            return
+
+        update_cache = self.time_series_cache.update
+        for time_series in time_series_list:
+            update_cache(time_series)
+        rows = self._store_boundary_states(time_series_list)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated %s boundary state rows", len(rows))
+
+    def _apply_single_boundary(self, time_series: ObjectTimeSeries) -> None:
+        """
+        使用单条边界条件更新数字孪生仿真状态。
+
+        用于与物理系统实时同步。
 
         Args:
-            time_series_list: 已更新的时序数据列表
+            time_series: 刚写入缓存的时序数据
         """
-        logger.info(f"Updating digital twins state with {len(time_series_list)} boundary conditions")
+        self._store_boundary_state(time_series)
 
-        # 使用边界条件更新仿真状态
+        # 待办：更新水力求解器的边界条件
+
+    def _store_boundary_state(self, time_series: ObjectTimeSeries) -> int:
+        """
+        把边界条件的最新值写入按列存储的仿真状态，返回其行号。
+
+        每个 (object_id, metrics_code) 首次出现时分配新行，之后原地覆盖，
+        不保留 ObjectTimeSeries 引用。
+        """
+        key = (time_series.object_id, time_series.metrics_code)
+        points = time_series.time_series
+        latest = points[-1] if points else None
+        value = math.nan if latest is None or latest.value is None else latest.value
+        step = -1 if latest is None or latest.step is None else latest.step
+
+        row = self._state_index.get(key)
+        if row is None:
+            row = self._state_index[key] = len(self._state_values)
+            self._state_values.append(value)
+            self._state_steps.append(step)
+        else:
+            self._state_values[row] = value
+            self._state_steps[row] = step
+        return row
+
+    def _store_boundary_states(self, time_series_list: List[ObjectTimeSeries]) -> List[int]:
+        """把一批边界条件拆成列后交给 update_boundary_state_bulk()，返回各条对应的行号。"""
+        object_ids = []
+        metrics_codes = []
+        values = []
+        steps = []
         for time_series in time_series_list:
-            logger.debug(
-                f"Boundary condition: object={time_series.object_name}, "
-                f"metrics={time_series.metrics_code}"
-            )
+            points = time_series.time_series
+            latest = points[-1] if points else None
+            object_ids.append(time_series.object_id)
+            metrics_codes.append(time_series.metrics_code)
+            values.append(math.nan if latest is None or latest.value is None else latest.value)
+            steps.append(-1 if latest is None or latest.step is None else latest.step)
+        return self.update_boundary_state_bulk(object_ids, metrics_codes, values, steps)
+
+    def update_boundary_state_bulk(
+        self,
+        object_ids: Sequence[int],
+        metrics_codes: Sequence[str],
+        values: Sequence[float],
+        steps: Sequence[int],
+    ) -> List[int]:
+        """
+        按列批量写入边界条件的最新值，返回各条对应的行号。
+
+        四列按位置一一对应，可以是 list、array 或 numpy 数组（先经 tolist() 转为
+        Python 标量）。缺失值记为 NaN，缺失 step 记为 -1；同一批中重复的键以最后一条为准。
+        全量同步且顺序与行号一致时整段切片赋值，不逐行写入。
 
-            # 存入仿真状态
-            state_key = f"{time_series.object_id}_{time_series.metrics_code}"
-            self._simulation_state[state_key] = time_series
+        Raises:
+            ValueError: 各列长度不一致
+        """
+        object_ids = _as_list(object_ids)
+        metrics_codes = _as_list(metrics_codes)
+        values = _as_list(values)
+        steps = _as_list(steps)
+        count = len(object_ids)
+        if not count == len(metrics_codes) == len(values) == len(steps):
+            raise ValueError("Boundary state columns must have the same length")
+
+        index = self._state_index
+        state_values = self._state_values
+        state_steps = self._state_steps
+        rows = [index.get(key) for key in zip(object_ids, metrics_codes)]
+        if None in rows:
+            for position, row in enumerate(rows):
+                if row is None:
+                    key = (object_ids[position], metrics_codes[position])
+                    row = index.get(key)
+                    if row is None:
+                        row = index[key] = len(state_values)
+                        state_values.append(math.nan)
+                        state_steps.append(-1)
+                    rows[position] = row
+
+        if count == len(state_values) and rows == list(range(count)):
+            state_values[:] = array('d', values)
+            state_steps[:] = array('q', steps)
+        else:
+            for row, value, step in zip(rows, values, steps):
+                state_values[row] = value
+                state_steps[row] = step
+        return rows
+
+    def get_boundary_state(self) -> Tuple[Dict[CacheKey, int], array, array]:
+        """
+        返回边界条件状态的 (行号索引, values, steps)。
 
-            # 待办：更新水力求解器的边界条件
+        values 为 float64、steps 为 int64 的 array，均支持 buffer 协议，
+        可用 numpy.frombuffer 零拷贝交给水力求解器按行批量读取。
+        """
+        return self._state_index, self._state_values, self._state_steps
 
     def on_terminate(self, request: SimTaskTerminateRequest) -> SimTaskTerminateResponse:
         """
@@ -287,28 +480,53 @@ class TwinsSimulationAgent(TickableAgent):
         Returns:
             任务终止响应
         """
-        logger.info("="*70)
-        logger.info(f"TERMINATING DIGITAL TWINS SIMULATION AGENT: {self.biz_scene_instance_id}")
-        logger.info("="*70)
+        logger.info(_LOG_BANNER)
+        logger.info("TERMINATING DIGITAL TWINS SIMULATION AGENT: %s", self.biz_scene_instance_id)
+        logger.info(_LOG_BANNER)
 
         try:
-            # 清理数字孪生模型
+            # 清理数字孪生模型；尚未开始的后台拓扑加载直接取消，
+            # 已在运行的加载完成后结果随 Future 一起丢弃，不会写回智能体
+            if self._topology_future is not None:
+                self._topology_future.cancel()
+                self._topology_future = None
             self._twins_model = None
             self._topology = None
-            self._simulation_state.clear()
+            self._mock_metric_spec = None
+            self._state_index.clear()
+            self._state_values = array('d')
+            self._state_steps = array('q')
 
-            logger.info(f"Digital twins simulation agent terminated: {self.agent_id}")
+            logger.info("Digital twins simulation agent terminated: %s", self.agent_id)
 
             response = ResponseFactory.terminate_succeed(self, request)
 
             logger.info(
-                f"发布协调指令成功,commandId={response.command_id},"
-                f"commandType=sim_task_terminate_response 到MQTT Topic={self.sim_coordination_client.topic}"
+                "发布协调指令成功,commandId=%s,commandType=sim_task_terminate_response 到MQTT Topic=%s",
+                response.command_id,
+                self.sim_coordination_client.topic,
             )
 
             return response
 
         except Exception as e:
-            logger.error(f"Error terminating digital twins simulation agent: {e}", exc_info=True)
+            logger.error("Error terminating digital twins simulation agent: %s", e, exc_info=True)
 
             return ResponseFactory.terminate_failed(self, request)
+
+
+def _build_topology(modeling_yml_uri: str, param_keys):
+    """下载并解析水网拓扑；只返回结果，不修改智能体状态，可在后台线程运行。"""
+    return HydroObjectUtilsV2.build_waterway_topology(
+        modeling_yml_uri=modeling_yml_uri,
+        param_keys=param_keys,
+        with_metrics_code=True
+    )
+
+
+def _as_list(column: Sequence) -> list:
+    """把列数据转成 list；array 和 numpy 数组经 tolist() 一次性转为 Python 标量。"""
+    if isinstance(column, list):
+        return column
+    tolist = getattr(column, 'tolist', None)
+    return tolist() if tolist is not None else list(column)
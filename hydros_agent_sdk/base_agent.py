@@ -6,7 +6,7 @@ Hydros 智能体基础实现。
 """
 
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Any, ClassVar, FrozenSet, Iterable, Optional, TYPE_CHECKING
 from abc import ABC, abstractmethod
 from pydantic import ConfigDict
 
@@ -32,6 +32,8 @@ from hydros_agent_sdk.protocol.commands import (
     OutflowTimeSeriesRequest,
 )
 from hydros_agent_sdk.agent_properties import AgentProperties
+from hydros_agent_sdk.runtime.agent_configuration_service import AgentConfigurationService
+from hydros_agent_sdk.runtime.agent_context import AgentContext
 from hydros_agent_sdk.runtime.response_factory import ResponseFactory
 
 # 仅用于类型检查，避免运行时循环导入
@@ -79,8 +81,17 @@ class BaseHydroAgent(HydroAgentInstance, ABC):
         properties: 带类型化访问方法的 AgentProperties 字典
     """
 
-    # 配置 Pydantic 允许非模型属性使用额外字段
-    model_config = ConfigDict(extra='allow', arbitrary_types_allowed=True)
+    # 配置 Pydantic 允许非模型属性使用额外字段；各智能体子类的校验器和序列化器
+    # 推迟到首次实例化时构建，只导入不实例化的子类不付出构建开销
+    model_config = ConfigDict(extra='allow', arbitrary_types_allowed=True, defer_build=True)
+
+    # SDK 自身的运行时属性放入 slot：不进入 __pydantic_extra__，读取时也不走
+    # BaseModel.__getattr__ 回退查找。extra='allow' 保留给子类自定义的动态属性。
+    __slots__ = ('sim_coordination_client', 'state_manager', 'properties')
+
+    # 本类及子类声明的全部 slot 名。BaseModel.__setattr__ 不缓存 slot 的赋值处理器，
+    # 每次赋值都要重新解析（约 1.6µs），这些名字直接写入 slot
+    _slot_attribute_names: ClassVar[FrozenSet[str]] = frozenset(__slots__)
 
     # 动态设置属性的类型提示（通过 object.__setattr__ 设置）
     # 仅用于 IDE 支持，不是 Pydantic 字段
@@ -146,22 +157,42 @@ class BaseHydroAgent(HydroAgentInstance, ABC):
             **kwargs
         )
 
-        # 存储非 Pydantic 属性（不会序列化）
-        # 由于 model_config extra='allow'，这些属性会作为额外字段保存
+        # 存储非 Pydantic 属性（不会序列化），直接写入 slot
         object.__setattr__(self, 'sim_coordination_client', sim_coordination_client)
         object.__setattr__(self, 'state_manager', sim_coordination_client.state_manager)
         object.__setattr__(self, 'properties', AgentProperties())
 
         # 注意：日志上下文（task_id、biz_component）会由 SimCoordinationClient
         # 在处理指令时自动设置，因此回调中的全部日志都会包含正确的上下文信息。
-        logger.info(f"Created agent instance: {self.agent_id}")
-        logger.info(f"  - Agent Code: {self.agent_code}")
-        logger.info(f"  - Agent Name: {self.agent_name}")
-        logger.info(f"  - Agent Type: {self.agent_type}")
-        logger.info(f"  - Context: {self.biz_scene_instance_id}")
-        logger.info(f"  - Status: {self.agent_status}")
-        logger.info(f"  - Instance Status: {self.agent_instance_status}")
-        logger.info(f"  - Drive Mode: {self.drive_mode}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Created agent instance: %s [code=%s, name=%s, type=%s, context=%s, "
+                "status=%s, instanceStatus=%s, driveMode=%s]",
+                self.agent_id,
+                self.agent_code,
+                self.agent_name,
+                self.agent_type,
+                self.biz_scene_instance_id,
+                self.agent_status,
+                self.agent_instance_status,
+                self.drive_mode,
+            )
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._slot_attribute_names = frozenset(
+            name
+            for klass in cls.__mro__
+            if issubclass(klass, BaseHydroAgent)
+            for name in klass.__dict__.get('__slots__', ())
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._slot_attribute_names:
+            object.__setattr__(self, name, value)
+        else:
+            super().__setattr__(name, value)
 
     @abstractmethod
     def on_init(self, request: SimTaskInitRequest) -> SimTaskInitResponse:
@@ -224,7 +255,7 @@ class BaseHydroAgent(HydroAgentInstance, ABC):
         Returns:
             时序数据更新响应
         """
-        logger.info(f"Time series data update: {request.command_id}")
+        logger.info("Time series data update: %s", request.command_id)
 
         return ResponseFactory.time_series_data_update_succeed(self, request)
 
@@ -240,7 +271,7 @@ class BaseHydroAgent(HydroAgentInstance, ABC):
         Returns:
             外发流量时序数据更新响应
         """
-        logger.info(f"Outflow time series data update: {request.command_id}")
+        logger.info("Outflow time series data update: %s", request.command_id)
         return ResponseFactory.outflow_time_series_data_update_succeed(self, request)
 
     def on_time_series_calculation(self, request: TimeSeriesCalculationRequest):
@@ -252,7 +283,7 @@ class BaseHydroAgent(HydroAgentInstance, ABC):
         Args:
             request: 时序计算请求
         """
-        logger.info(f"Time series calculation: {request.command_id}")
+        logger.info("Time series calculation: %s", request.command_id)
 
     def on_outflow_time_series(self, request: OutflowTimeSeriesRequest):
         """
@@ -263,7 +294,7 @@ class BaseHydroAgent(HydroAgentInstance, ABC):
         Args:
             request: 外发流量时序请求
         """
-        logger.info(f"Outflow time series request: {request.command_id}")
+        logger.info("Outflow time series request: %s", request.command_id)
 
     def send_response(self, response):
         """
@@ -274,6 +305,17 @@ class BaseHydroAgent(HydroAgentInstance, ABC):
         """
         self.sim_coordination_client.enqueue(response)
 
+    def send_responses(self, responses: Iterable):
+        """
+        通过协调客户端一次性提交多条响应。
+
+        各响应仍逐条发布，合并的是 outbox 入队开销。
+
+        Args:
+            responses: 要发送的响应
+        """
+        self.sim_coordination_client.enqueue_many(responses)
+
     @property
     def runtime_context(self):
         """
@@ -283,8 +325,6 @@ class BaseHydroAgent(HydroAgentInstance, ABC):
         和 properties。较新的代码可以依赖这个更窄的上下文，便于逐步将
         运行时关注点和业务逻辑拆开。
         """
-        from hydros_agent_sdk.runtime.agent_context import AgentContext
-
         return AgentContext(
             client=self.sim_coordination_client,
             state_manager=self.state_manager,
@@ -313,6 +353,4 @@ class BaseHydroAgent(HydroAgentInstance, ABC):
             如果 agent_list 中没有找到当前智能体，本方法会跳过加载并静默返回，
             因为 SimTaskInitRequest 可能只初始化部分智能体。
         """
-        from hydros_agent_sdk.runtime.agent_configuration_service import AgentConfigurationService
-
         AgentConfigurationService().load_into(self, request)
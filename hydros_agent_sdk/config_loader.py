@@ -6,13 +6,29 @@ Hydros Agent SDK 配置加载器。
 
 import os
 import logging
-from typing import Dict, Optional
-from configparser import ConfigParser
+from threading import Lock
+from typing import Dict, Iterable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_ENV_FILE_NAME = "env.properties"
 
+# (env_file 参数, 当前工作目录) -> 已存在的配置文件路径，省去逐级向上查找
+_ENV_PATH_CACHE: Dict[Tuple[str, str], str] = {}
+# 配置文件路径 -> ((st_ino, st_mtime_ns, st_size), 解析并校验后的配置)
+_ENV_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int, int], Dict[str, str]]] = {}
+_ENV_CACHE_LOCK = Lock()
+
+# 必填属性：env.properties 要求非空，agent.properties 只要求存在
+_REQUIRED_ENV_PROPS = (
+    'mqtt_broker_url',
+    'mqtt_broker_port',
+    'mqtt_topic',
+    'hydros_cluster_id',
+    'hydros_node_id',
+)
+_REQUIRED_AGENT_PROPS = ('agent_code', 'agent_type', 'agent_name')
+
 
 def get_default_env_config_path() -> str:
     """返回当前工作目录下默认 env.properties 路径。"""
@@ -32,6 +48,45 @@ def _find_nearest_env_config(start_dir: str) -> Optional[str]:
         current_dir = parent_dir
 
 
+def clear_env_config_cache() -> None:
+    """
+    清空 load_env_config 的路径解析和文件内容缓存。
+
+    路径缓存按 (env_file, 当前工作目录) 记录已找到的文件；在更近的目录新建
+    env.properties 后需要调用本函数才能生效。
+    """
+    with _ENV_CACHE_LOCK:
+        _ENV_PATH_CACHE.clear()
+        _ENV_CONFIG_CACHE.clear()
+
+
+def _resolve_env_path(env_file: str) -> str:
+    if os.path.isabs(env_file):
+        return env_file
+
+    cache_key = (env_file, os.getcwd())
+    cached_path = _ENV_PATH_CACHE.get(cache_key)
+    if cached_path is not None and os.path.exists(cached_path):
+        return cached_path
+
+    requested_env_file = os.path.abspath(env_file)
+    is_default_request = os.path.normpath(env_file) == DEFAULT_ENV_FILE_NAME
+
+    if os.path.exists(requested_env_file):
+        resolved = requested_env_file
+    elif is_default_request:
+        resolved = _find_nearest_env_config(cache_key[1])
+    else:
+        resolved = None
+
+    # 只缓存确实存在的路径，文件之后创建时仍能被找到
+    if resolved is None:
+        return requested_env_file
+    with _ENV_CACHE_LOCK:
+        _ENV_PATH_CACHE[cache_key] = resolved
+    return resolved
+
+
 def load_env_config(env_file: str = "./env.properties") -> Dict[str, str]:
     """
     从 env.properties 文件加载环境配置。
@@ -49,46 +104,35 @@ def load_env_config(env_file: str = "./env.properties") -> Dict[str, str]:
         FileNotFoundError: env.properties 文件不存在时抛出
         ValueError: 缺少必填属性时抛出
     """
-    if not os.path.isabs(env_file):
-        requested_env_file = os.path.abspath(env_file)
-        is_default_request = os.path.normpath(env_file) == DEFAULT_ENV_FILE_NAME
-
-        if os.path.exists(requested_env_file):
-            env_file = requested_env_file
-        elif is_default_request:
-            nearest_env_file = _find_nearest_env_config(os.getcwd())
-            env_file = nearest_env_file or requested_env_file
-        else:
-            env_file = requested_env_file
-
-    # 检查文件是否存在
-    if not os.path.exists(env_file):
+    env_file = _resolve_env_path(env_file)
+
+    # 检查文件是否存在；文件未变化时直接复用上次解析结果
+    try:
+        stat_result = os.stat(env_file)
+    except OSError:
         raise FileNotFoundError(
             f"Environment configuration file not found: {env_file}\n"
             f"Please create env.properties in the current application directory or pass an absolute path."
-        )
+        ) from None
+    signature = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _ENV_CONFIG_CACHE.get(env_file)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
 
-    logger.info(f"Loading environment config from: {env_file}")
+    logger.info("Loading environment config from: %s", env_file)
 
     # 加载 properties
     config = load_properties_file(env_file)
 
     # 未提供 mqtt_topic 时根据 hydros_cluster_id 自动生成
-    if 'mqtt_topic' not in config or not config['mqtt_topic']:
-        if 'hydros_cluster_id' in config and config['hydros_cluster_id']:
-            config['mqtt_topic'] = f"/hydros/commands/coordination/{config['hydros_cluster_id']}"
-            logger.info(f"Auto-generated mqtt_topic: {config['mqtt_topic']}")
+    if not config.get('mqtt_topic'):
+        cluster_id = config.get('hydros_cluster_id')
+        if cluster_id:
+            config['mqtt_topic'] = f"/hydros/commands/coordination/{cluster_id}"
+            logger.info("Auto-generated mqtt_topic: %s", config['mqtt_topic'])
 
     # 校验必填属性
-    required_props = [
-        'mqtt_broker_url',
-        'mqtt_broker_port',
-        'mqtt_topic',
-        'hydros_cluster_id',
-        'hydros_node_id'
-    ]
-
-    missing_props = [prop for prop in required_props if prop not in config or not config[prop]]
+    missing_props = [prop for prop in _REQUIRED_ENV_PROPS if not config.get(prop)]
 
     if missing_props:
         raise ValueError(
@@ -104,9 +148,37 @@ def load_env_config(env_file: str = "./env.properties") -> Dict[str, str]:
             f"Note: mqtt_topic will be auto-generated as /hydros/commands/coordination/{{hydros_cluster_id}}\n"
         )
 
+    with _ENV_CACHE_LOCK:
+        _ENV_CONFIG_CACHE[env_file] = (signature, dict(config))
     return config
 
 
+def _parse_properties(lines: Iterable[str]) -> Dict[str, str]:
+    """
+    解析扁平的 key=value 属性行。
+
+    与此前的 ConfigParser 写法保持一致：支持 = 和 : 分隔符，# 和 ; 开头的注释行，
+    key 统一转小写，key 和 value 两端空白去除；无分隔符的行和重复 key 报错。
+    value 按字面保留，不做 % 插值。
+    """
+    result = {}
+    for line_number, raw_line in enumerate(lines, 1):
+        line = raw_line.strip()
+        if not line or line[0] in '#;':
+            continue
+        equals_index = line.find('=')
+        colon_index = line.find(':')
+        if equals_index < 0 or 0 <= colon_index < equals_index:
+            equals_index = colon_index
+        if equals_index < 0:
+            raise ValueError(f"line {line_number}: missing '=' or ':' in {line!r}")
+        key = line[:equals_index].rstrip().lower()
+        if key in result:
+            raise ValueError(f"line {line_number}: duplicate property {key!r}")
+        result[key] = line[equals_index + 1:].lstrip()
+    return result
+
+
 def load_properties_file(file_path: str) -> Dict[str, str]:
     """
     从 .properties 文件加载属性。
@@ -124,20 +196,12 @@ def load_properties_file(file_path: str) -> Dict[str, str]:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Properties file not found: {file_path}")
 
-    config = ConfigParser()
-
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            config_string = '[DEFAULT]\n' + f.read()
-        config.read_string(config_string)
+            properties = _parse_properties(f)
 
-        result = {}
-        # 从 DEFAULT 段加载全部属性
-        for key, value in config.items('DEFAULT'):
-            if value:
-                result[key] = value
-
-        return result
+        # 只保留非空属性
+        return {key: value for key, value in properties.items() if value}
 
     except Exception as e:
         logger.error(f"Error loading properties file {file_path}: {e}")
@@ -161,21 +225,13 @@ def load_agent_config(config_file: str) -> Dict[str, str]:
     if not os.path.exists(config_file):
         raise FileNotFoundError(f"Agent config file not found: {config_file}")
 
-    config = ConfigParser()
-
     try:
         # 读取 properties 文件
         with open(config_file, 'r', encoding='utf-8') as f:
-            config_string = '[DEFAULT]\n' + f.read()
-        config.read_string(config_string)
+            config = _parse_properties(f)
 
         # 必填属性
-        required_props = ['agent_code', 'agent_type', 'agent_name']
-        missing_props = []
-
-        for prop in required_props:
-            if not config.has_option('DEFAULT', prop):
-                missing_props.append(prop)
+        missing_props = [prop for prop in _REQUIRED_AGENT_PROPS if prop not in config]
 
         if missing_props:
             raise ValueError(
@@ -185,9 +241,9 @@ def load_agent_config(config_file: str) -> Dict[str, str]:
 
         # 加载配置
         return {
-            'agent_code': config.get('DEFAULT', 'agent_code'),
-            'agent_type': config.get('DEFAULT', 'agent_type'),
-            'agent_name': config.get('DEFAULT', 'agent_name'),
+            'agent_code': config['agent_code'],
+            'agent_type': config['agent_type'],
+            'agent_name': config['agent_name'],
         }
 
     except Exception as e:
@@ -302,7 +302,7 @@ class SimCoordinationCallback(ABC):
                     agent_instance.agent_code,
                     indexed_count,
                 )
-        logger.info(f"Sibling agent created: {response.source_agent_instance.agent_id}")
+        logger.info("Sibling agent created: %s", response.source_agent_instance.agent_id)
 
     def on_agent_instance_sibling_status_updated(self, report: AgentInstanceStatusReport):
         """
@@ -314,7 +314,9 @@ class SimCoordinationCallback(ABC):
             report: 远端智能体返回的状态报告
         """
         self._store_sibling_agent_instance(report.source_agent_instance)
-        logger.debug(f"Sibling agent status updated: {report.source_agent_instance.agent_id}")
+        # 状态上报频率高，DEBUG 关闭时连参数属性都不取
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sibling agent status updated: %s", report.source_agent_instance.agent_id)
 
     def on_mpc_prediction_result(self, report: MpcPredictionResultReport):
         """
@@ -388,7 +390,7 @@ class SimCoordinationCallback(ABC):
             request: 任务终止请求
         """
         self.clear_sibling_agent_instances(request.context.biz_scene_instance_id)
-        logger.info(f"Task termination requested: {request.reason}")
+        logger.info("Task termination requested: %s", request.reason)
 
     def on_monitor_rule_updated(self, request):
         """
@@ -7,10 +7,9 @@
 功能类似 Java 侧的 SimCoordinationSlave 类。
 """
 
-import json
 import logging
 import time
-from typing import Optional
+from typing import Iterable, Mapping, Optional, Union
 
 from hydros_agent_sdk.coordination_callback import SimCoordinationCallback
 from hydros_agent_sdk.state_manager import AgentStateManager
@@ -18,13 +17,14 @@ from hydros_agent_sdk.message_filter import MessageFilter
 from hydros_agent_sdk.topics import HydrosTopics
 from hydros_agent_sdk.protocol.commands import (
     SIMCMD_TASK_INIT_RESPONSE,
+    SIM_COMMAND_ADAPTER,
     SimCommand,
-    SimCommandEnvelope,
 )
 from hydros_agent_sdk.runtime.coordination_outbox import CoordinationOutboxPublisher
 from hydros_agent_sdk.runtime.task_runtime_registry import TaskRuntimeRegistry
 from hydros_agent_sdk.transport.base import Transport
 from hydros_agent_sdk.transport.mqtt_coordination import MqttCoordinationTransport
+from hydros_agent_sdk.utils.json_codec import loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +86,7 @@ class SimCoordinationClient:
         mqtt_password: Optional[str] = None,
         task_mailbox_size: int = 1000,
         transport: Optional[Transport] = None,
+        command_qos: Optional[Mapping[str, int]] = None,
     ):
         """
         初始化协调客户端。
@@ -103,6 +104,8 @@ class SimCoordinationClient:
             mqtt_username: 可选 MQTT 认证用户名；None 表示不启用认证
             mqtt_password: 可选 MQTT 认证密码；None 表示不启用认证
             task_mailbox_size: 单个任务指令邮箱的最大积压数量
+            command_qos: 可选的按 command_type 覆盖出站 QoS 的映射，
+                例如 {"report_agent_instance_status": 0}；未配置的类型使用 qos
         """
         self.broker_url = broker_url.replace("tcp://", "")
         self.broker_port = broker_port
@@ -153,6 +156,7 @@ class SimCoordinationClient:
             qos=self.qos,
             max_retry_count=self.max_retry_count,
             base_retry_delay_ms=self.base_retry_delay_ms,
+            command_qos=command_qos,
         )
         self._task_runtime_registry = TaskRuntimeRegistry(
             callback=self.sim_coordination_callback,
@@ -160,6 +164,7 @@ class SimCoordinationClient:
             outbound_submitter=self.outbox_publisher.enqueue,
             mailbox_size=task_mailbox_size,
             log=logger,
+            outbound_batch_submitter=self.outbox_publisher.enqueue_many,
         )
 
         logger.info(f"SimCoordinationClient initialized: client_id={self.client_id}, topic={self.topic}")
@@ -215,32 +220,40 @@ class SimCoordinationClient:
         """将本地产生的协调指令提交到 outbox。"""
         self.outbox_publisher.enqueue(command)
 
-    def _handle_transport_payload(self, topic: str, payload_str: str) -> None:
+    def enqueue_many(self, commands: Iterable[SimCommand]):
+        """将同一时刻产生的多条协调指令一次性提交到 outbox，逐条发布。"""
+        self.outbox_publisher.enqueue_many(commands)
+
+    def _handle_transport_payload(self, topic: str, payload: Union[str, bytes]) -> None:
         """解码、过滤传输层送达的一条 raw payload，并将其加入任务队列。"""
         data = None
+        # 每条 tick 都经过这里：DEBUG 关闭时不做 payload 截取和原始字段提取
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         try:
-            logger.debug("Received message on topic %s: %s...", topic, payload_str[:200])
+            if debug_enabled:
+                logger.debug("Received message on topic %s: %s...", topic, self._payload_prefix(payload, 200))
 
             # 解析 JSON
-            data = json.loads(payload_str)
-            logger.debug(
-                "MQTT command received: topic=%s, rawType=%s, commandId=%s, context=%s",
-                topic,
-                data.get("command_type") if isinstance(data, dict) else None,
-                data.get("command_id") if isinstance(data, dict) else None,
-                self._raw_context_id(data),
-            )
-            if self._should_ignore_raw_command(data):
+            data = loads_json(payload)
+            if debug_enabled:
                 logger.debug(
-                    "MQTT command ignored: type=%s, id=%s, context=%s, reason=not_consumed_by_client",
-                    data.get("command_type"),
-                    data.get("command_id"),
+                    "MQTT command received: topic=%s, rawType=%s, commandId=%s, context=%s",
+                    topic,
+                    data.get("command_type") if isinstance(data, dict) else None,
+                    data.get("command_id") if isinstance(data, dict) else None,
                     self._raw_context_id(data),
                 )
+            if self._should_ignore_raw_command(data):
+                if debug_enabled:
+                    logger.debug(
+                        "MQTT command ignored: type=%s, id=%s, context=%s, reason=not_consumed_by_client",
+                        data.get("command_type"),
+                        data.get("command_id"),
+                        self._raw_context_id(data),
+                    )
                 return
 
-            envelope = SimCommandEnvelope(command=data)
-            command = envelope.command
+            command = SIM_COMMAND_ADAPTER.validate_python(data)
             # 应用消息过滤器
             if not self.message_filter.should_process_message(command):
                 return
@@ -256,10 +269,17 @@ class SimCoordinationClient:
                 data.get("command_id") if isinstance(data, dict) else None,
                 self._raw_context_id(data),
                 e,
-                payload_str[:500] if payload_str else None,
+                self._payload_prefix(payload, 500) if payload else None,
                 exc_info=True,
             )
 
+    @staticmethod
+    def _payload_prefix(payload: Union[str, bytes], limit: int) -> str:
+        prefix = payload[:limit]
+        if isinstance(prefix, bytes):
+            return prefix.decode("utf-8", "replace")
+        return prefix
+
     @staticmethod
     def _raw_context_id(data):
         if not isinstance(data, dict):
@@ -45,6 +45,9 @@ class AgentExecutionContext:
     def send_response(self, response) -> None:
         self._client.enqueue(response)
 
+    def send_responses(self, responses) -> None:
+        self._client.enqueue_many(responses)
+
 
 class CustomAgent(ABC):
     """开发者实现的自定义 Agent 生命周期，不继承协议 DTO 或运行时实现。"""
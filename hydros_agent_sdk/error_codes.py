@@ -19,7 +19,10 @@ Java ErrorCodes 实现保持一致。
     )
 """
 
-from typing import Any
+from string import Formatter
+from typing import Any, Optional
+
+from hydros_agent_sdk.protocol.models import CommandStatus
 
 
 class ErrorCode:
@@ -33,6 +36,8 @@ class ErrorCode:
         message_template: 带占位符的消息模板（例如 "Error: {0}"）
     """
 
+    __slots__ = ('code', 'message_template', '_format', '_placeholder_count')
+
     def __init__(self, code: str, message_template: str):
         """
         初始化错误码。
@@ -43,6 +48,10 @@ class ErrorCode:
         """
         self.code = code
         self.message_template = message_template
+        # 模板在创建时解析一次：只含 {0}、{1} 等纯序号占位符时记录占位符个数，
+        # 格式化时直接调用预先绑定的 str.format；其他模板为 None，走逐个替换
+        self._format = message_template.format
+        self._placeholder_count = _indexed_placeholder_count(message_template)
 
     def format_message(self, *args: Any) -> str:
         """
@@ -61,11 +70,24 @@ class ErrorCode:
             >>> error.format_message("Connection failed", "Timeout")
             'Error: Connection failed, detail: Timeout'
         """
+        placeholder_count = self._placeholder_count
+        if placeholder_count == 0:
+            return self.message_template
+        if placeholder_count is not None:
+            # 单趟替换，多余参数忽略且不转为 str；用到的参数与逐个替换时一样先转为 str
+            if len(args) >= placeholder_count:
+                return self._format(*map(str, args[:placeholder_count]))
+            # 缺少参数的占位符原样保留
+            values = [str(arg) for arg in args]
+            values.extend(f"{{{i}}}" for i in range(len(args), placeholder_count))
+            return self._format(*values)
+        # 模板含其他花括号时逐个替换，不解析其余花括号
         try:
-            # 使用传入参数替换 {0}、{1} 等占位符
             message = self.message_template
             for i, arg in enumerate(args):
-                message = message.replace(f"{{{i}}}", str(arg))
+                placeholder = f"{{{i}}}"
+                if placeholder in message:
+                    message = message.replace(placeholder, str(arg))
             return message
         except Exception as e:
             # 兜底：返回带错误信息的模板
@@ -80,6 +102,23 @@ class ErrorCode:
         return f"ErrorCode(code='{self.code}', template='{self.message_template}')"
 
 
+def _indexed_placeholder_count(template: str) -> Optional[int]:
+    """返回模板中纯序号占位符的个数（最大序号 + 1）；模板不能直接用 str.format 时返回 None。"""
+    if "{{" in template or "}}" in template:
+        return None
+    count = 0
+    try:
+        for _literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is None:
+                continue
+            if not field_name.isdigit() or format_spec or conversion:
+                return None
+            count = max(count, int(field_name) + 1)
+    except ValueError:
+        return None
+    return count
+
+
 class ErrorCodes:
     """
     Hydros Agent SDK 错误码定义。
@@ -300,8 +339,6 @@ def create_error_response(
         ...     source_agent_instance=agent_instance
         ... )
     """
-    from hydros_agent_sdk.protocol.models import CommandStatus
-
     return response_class(
         command_status=CommandStatus.FAILED,
         error_code=error_code.code,
@@ -21,6 +21,13 @@ from functools import wraps
 from typing import Callable, TypeVar, Any, Optional
 
 from hydros_agent_sdk.error_codes import ErrorCode, ErrorCodes
+from hydros_agent_sdk.protocol.commands import (
+    SimTaskInitResponse,
+    TickCmdResponse,
+    SimTaskTerminateResponse,
+    TimeSeriesDataUpdateResponse,
+    TimeSeriesCalculationResponse,
+)
 from hydros_agent_sdk.protocol.models import CommandStatus
 
 logger = logging.getLogger(__name__)
@@ -28,6 +35,50 @@ logger = logging.getLogger(__name__)
 # 被装饰函数的类型变量
 F = TypeVar('F', bound=Callable[..., Any])
 
+# 错误响应的状态；Python 3.11 下每次访问枚举成员都要走 EnumType 的查找
+_FAILED = CommandStatus.FAILED
+# 请求上没有 context 属性时的占位值（与 context=None 区分）
+_NO_CONTEXT = object()
+
+
+class _LazyErrorDetail:
+    """
+    延迟格式化的错误详情：异常描述加 traceback。
+
+    只有消息模板用到详情占位符、format_message 把它转为 str 时才遍历调用栈
+    生成 traceback，结果缓存后复用。
+    """
+
+    __slots__ = ("_exc", "_text")
+
+    def __init__(self, exc: BaseException):
+        self._exc = exc
+        self._text: Optional[str] = None
+
+    @property
+    def rendered(self) -> bool:
+        """traceback 是否已被格式化（即已写入错误消息）。"""
+        return self._text is not None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            exc = self._exc
+            formatted = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+            self._text = f"{exc}\n{formatted}"
+        return self._text
+
+
+def _error_detail(exc: BaseException, include_traceback: bool) -> Any:
+    """构造传给 format_message 的错误详情；需要 traceback 时延迟到实际使用再格式化。"""
+    if include_traceback:
+        return _LazyErrorDetail(exc)
+    return str(exc)
+
+
+def _needs_exc_info(error_detail: Any) -> bool:
+    """错误消息里已带 traceback 时，日志不再通过 exc_info 重复格式化一遍。"""
+    return not (isinstance(error_detail, _LazyErrorDetail) and error_detail.rendered)
+
 
 def handle_agent_errors(
     error_code: ErrorCode,
@@ -60,6 +111,12 @@ def handle_agent_errors(
             pass
     """
     def decorator(func: F) -> F:
+        # 响应类只取决于方法名，装饰时解析一次
+        response_class = _get_response_class(func.__name__)
+        needs_init_fields = func.__name__ == "on_init" or (
+            response_class is not None and response_class.__name__ == "SimTaskInitResponse"
+        )
+
         @wraps(func)
         def wrapper(self, request, *args, **kwargs):
             try:
@@ -71,38 +128,40 @@ def handle_agent_errors(
                 agent_name = getattr(self, agent_name_attr, "UnknownAgent")
 
                 # 格式化错误消息
-                error_detail = str(e)
-                if include_traceback:
-                    error_detail = f"{error_detail}\n{traceback.format_exc()}"
-
+                error_detail = _error_detail(e, include_traceback)
                 error_message = error_code.format_message(agent_name, error_detail)
 
                 # 记录错误日志
                 logger.error(
-                    f"Error in {func.__name__} for agent {agent_name}: {error_message}",
-                    exc_info=True
+                    "Error in %s for agent %s: %s",
+                    func.__name__,
+                    agent_name,
+                    error_message,
+                    exc_info=_needs_exc_info(error_detail)
                 )
 
-                # 根据函数名判断响应类
-                response_class = _get_response_class(func.__name__)
-
                 if response_class is None:
                     # 如果无法判断响应类，则重新抛出
-                    logger.error(f"Cannot determine response class for {func.__name__}, re-raising exception")
+                    logger.error("Cannot determine response class for %s, re-raising exception", func.__name__)
                     raise
 
                 # 创建错误响应
                 try:
                     # 为特定响应类型预填必填字段，以通过 Pydantic 校验
                     extra_fields = {}
-                    if func.__name__ == "on_init" or response_class.__name__ == "SimTaskInitResponse":
+                    if needs_init_fields:
                         extra_fields["created_agent_instances"] = []
                         extra_fields["managed_top_objects"] = {}
 
+                    # 仅当请求没有 context 属性时才回退到智能体自身的 context
+                    context = getattr(request, "context", _NO_CONTEXT)
+                    if context is _NO_CONTEXT:
+                        context = getattr(self, "context", None)
+
                     response = response_class(
                         command_id=getattr(request, "command_id", "UNKNOWN"),
-                        context=getattr(request, "context", getattr(self, "context", None)),
-                        command_status=CommandStatus.FAILED,
+                        context=context,
+                        command_status=_FAILED,
                         error_code=error_code.code,
                         error_message=error_message,
                         source_agent_instance=self,
@@ -113,7 +172,8 @@ def handle_agent_errors(
 
                 except Exception as response_error:
                     logger.error(
-                        f"Failed to create error response: {response_error}",
+                        "Failed to create error response: %s",
+                        response_error,
                         exc_info=True
                     )
                     # 如果无法创建响应，则重新抛出原始异常
@@ -123,6 +183,17 @@ def handle_agent_errors(
     return decorator
 
 
+# 方法名到错误响应类的映射，模块加载时构建一次
+_RESPONSE_CLASSES = {
+    'on_init': SimTaskInitResponse,
+    'on_tick': TickCmdResponse,
+    'on_tick_simulation': TickCmdResponse,
+    'on_terminate': SimTaskTerminateResponse,
+    'on_time_series_data_update': TimeSeriesDataUpdateResponse,
+    'on_time_series_calculation': TimeSeriesCalculationResponse,
+}
+
+
 def _get_response_class(method_name: str):
     """
     根据方法名获取响应类。
@@ -133,24 +204,7 @@ def _get_response_class(method_name: str):
     Returns:
         响应类；未找到时返回 None
     """
-    from hydros_agent_sdk.protocol.commands import (
-        SimTaskInitResponse,
-        TickCmdResponse,
-        SimTaskTerminateResponse,
-        TimeSeriesDataUpdateResponse,
-        TimeSeriesCalculationResponse,
-    )
-
-    response_map = {
-        'on_init': SimTaskInitResponse,
-        'on_tick': TickCmdResponse,
-        'on_tick_simulation': TickCmdResponse,
-        'on_terminate': SimTaskTerminateResponse,
-        'on_time_series_data_update': TimeSeriesDataUpdateResponse,
-        'on_time_series_calculation': TimeSeriesCalculationResponse,
-    }
-
-    return response_map.get(method_name)
+    return _RESPONSE_CLASSES.get(method_name)
 
 
 def safe_execute(
@@ -195,12 +249,14 @@ def safe_execute(
         return True, result, None
 
     except Exception as e:
-        error_detail = f"{str(e)}\n{traceback.format_exc()}"
+        error_detail = _error_detail(e, True)
         error_message = error_code.format_message(agent_name, error_detail)
 
         logger.error(
-            f"Error in safe_execute for {agent_name}: {error_message}",
-            exc_info=True
+            "Error in safe_execute for %s: %s",
+            agent_name,
+            error_message,
+            exc_info=_needs_exc_info(error_detail)
         )
 
         return False, None, error_message
@@ -229,6 +285,15 @@ class AgentErrorContext:
             )
     """
 
+    __slots__ = (
+        'error_code',
+        'agent_name',
+        'include_traceback',
+        'has_error',
+        'error_message',
+        'exception',
+    )
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -262,10 +327,7 @@ class AgentErrorContext:
             self.exception = exc_val
 
             # 格式化错误消息
-            error_detail = str(exc_val)
-            if self.include_traceback:
-                error_detail = f"{error_detail}\n{traceback.format_exc()}"
-
+            error_detail = _error_detail(exc_val, self.include_traceback)
             self.error_message = self.error_code.format_message(
                 self.agent_name,
                 error_detail
@@ -273,8 +335,10 @@ class AgentErrorContext:
 
             # 记录错误日志
             logger.error(
-                f"Error in AgentErrorContext for {self.agent_name}: {self.error_message}",
-                exc_info=True
+                "Error in AgentErrorContext for %s: %s",
+                self.agent_name,
+                self.error_message,
+                exc_info=_needs_exc_info(error_detail)
             )
 
             # 抑制异常（返回 True）
@@ -316,16 +380,16 @@ def validate_request(
                 ...
             )
     """
-    missing_fields = []
+    # 缺失属性与值为 None 一样视为缺少，每个字段只做一次属性查找
+    missing_fields = [
+        field for field in required_fields
+        if getattr(request, field, None) is None
+    ]
 
-    for field in required_fields:
-        if not hasattr(request, field) or getattr(request, field) is None:
-            missing_fields.append(field)
+    if not missing_fields:
+        return True, None
 
-    if missing_fields:
-        error_message = ErrorCodes.MISSING_REQUIRED_FIELD.format_message(
-            f"{agent_name}: {', '.join(missing_fields)}"
-        )
-        return False, error_message
-
-    return True, None
+    error_message = ErrorCodes.MISSING_REQUIRED_FIELD.format_message(
+        f"{agent_name}: {', '.join(missing_fields)}"
+    )
+    return False, error_message
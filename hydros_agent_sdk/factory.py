@@ -6,9 +6,9 @@
 
 import os
 import logging
-from typing import Dict, Optional, Type, TypeVar, Generic, TYPE_CHECKING
-from configparser import ConfigParser
+from typing import Dict, Optional, Tuple, Type, TypeVar, Generic, TYPE_CHECKING
 
+from hydros_agent_sdk.config_loader import load_agent_config
 from hydros_agent_sdk.utils import generate_agent_instance_id
 from hydros_agent_sdk.protocol.models import SimulationContext
 from hydros_agent_sdk.agent_constants import (
@@ -59,6 +59,8 @@ class HydroAgentFactory(Generic[AgentType]):
         self.agent_class = agent_class
         self.config_file = config_file
         self.env_config = env_config
+        # ((路径, st_ino, st_mtime_ns, st_size), 解析并校验后的配置)；文件未变化时复用
+        self._config_cache: Optional[Tuple[Tuple[str, int, int, int], Dict[str, str]]] = None
         logger.info(f"{self.__class__.__name__} created with config: {config_file}")
 
     def create_agent(
@@ -125,42 +127,24 @@ class HydroAgentFactory(Generic[AgentType]):
             FileNotFoundError: 配置文件不存在时抛出
             ValueError: 缺少必填属性时抛出
         """
-        if not os.path.exists(config_file):
-            raise FileNotFoundError(f"Config file not found: {config_file}")
-
-        config = ConfigParser()
-
         try:
-            # 读取 properties 文件
-            with open(config_file, "r") as config_stream:
-                config_string = "[DEFAULT]\n" + config_stream.read()
-            config.read_string(config_string)
-
-            # 必填属性
-            required_props = ["agent_code", "agent_type", "agent_name"]
-            missing_props = []
-
-            for prop in required_props:
-                if not config.has_option("DEFAULT", prop):
-                    missing_props.append(prop)
-
-            if missing_props:
-                raise ValueError(
-                    f"Missing required properties in {config_file}: "
-                    f"{', '.join(missing_props)}"
-                )
-
-            # 加载配置
-            # 注意：hydros_cluster_id 和 hydros_node_id 不应放在 agent.properties 中，
-            # 它们从 env.properties 加载。
-            return {
-                "agent_code": config.get("DEFAULT", "agent_code"),
-                "agent_type": config.get("DEFAULT", "agent_type"),
-                "agent_name": config.get("DEFAULT", "agent_name"),
-            }
-        except Exception as error:
-            logger.error(f"Error loading config file: {error}")
-            raise
+            stat_result = os.stat(config_file)
+        except OSError:
+            raise FileNotFoundError(f"Config file not found: {config_file}") from None
+
+        # 同一文件未变化时直接复用上次解析结果，省去重复读取和解析
+        signature = (config_file, stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._config_cache
+        if cached is not None and cached[0] == signature:
+            return dict(cached[1])
+
+        # 解析和必填属性校验交给 load_agent_config
+        # 注意：hydros_cluster_id 和 hydros_node_id 不应放在 agent.properties 中，
+        # 它们从 env.properties 加载。
+        config = load_agent_config(config_file)
+
+        self._config_cache = (signature, config)
+        return dict(config)
 
 
 class CustomAgentFactory(HydroAgentFactory):
@@ -524,6 +524,10 @@ class LauncherLoggingConfigurator:
             "HYDROS_LOG_FILE_ENABLED",
             "true",
         ).strip().lower() in {"1", "true", "yes", "on"}
+        async_handlers = os.getenv(
+            "HYDROS_LOG_ASYNC",
+            "false",
+        ).strip().lower() in {"1", "true", "yes", "on"}
         setup_logging(
             level=logging.DEBUG if "--debug" in argv else logging.INFO,
             hydros_cluster_id=hydros_cluster_id,
@@ -534,6 +538,7 @@ class LauncherLoggingConfigurator:
             use_rolling=True,
             format_style=format_style,
             service_name=service_name,
+            async_handlers=async_handlers,
         )
 
     def _resolve_logging_context(self) -> Tuple[Optional[str], Optional[str]]:
@@ -22,13 +22,16 @@ Hydros Agent SDK 日志配置。
 - 消息正文
 """
 
+import atexit
+import copy
 import json
 import logging
 import os
 import sys
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from contextvars import ContextVar
-from typing import Any, Dict, Optional
+from queue import SimpleQueue
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 
 from hydros_agent_sdk.observability import resolve_resource_attributes
@@ -49,6 +52,12 @@ _LOG_RECORD_BUILTINS = set(logging.makeLogRecord({}).__dict__) | {
     "message",
 }
 
+# setup_logging(async_handlers=True) 启动的后台 listener
+_queue_listener: Optional[QueueListener] = None
+
+# (biz_scene_instance_id, biz_component, hydros_cluster_id, hydros_node_id)
+LogContextSnapshot = Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]
+
 
 class LogContext:
     """
@@ -71,19 +80,29 @@ class LogContext:
         self.hydros_cluster_id = hydros_cluster_id
         self.hydros_node_id = hydros_node_id
         self.tokens = []
+        # 进入时已是目标值、未调用 set 的字段及其原值，退出时若被块内改动则恢复
+        self._unchanged = []
 
     def __enter__(self):
-        if self.biz_scene_instance_id is not None:
-            self.tokens.append(_biz_scene_instance_id.set(self.biz_scene_instance_id))
-        if self.biz_component is not None:
-            self.tokens.append(_biz_component.set(self.biz_component))
-        if self.hydros_cluster_id is not None:
-            self.tokens.append(_hydros_cluster_id.set(self.hydros_cluster_id))
-        if self.hydros_node_id is not None:
-            self.tokens.append(_hydros_node_id.set(self.hydros_node_id))
+        # 与当前值相同的字段不再 set/reset，同一智能体连续 tick 时无需改动 ContextVar
+        for var, value in (
+            (_biz_scene_instance_id, self.biz_scene_instance_id),
+            (_biz_component, self.biz_component),
+            (_hydros_cluster_id, self.hydros_cluster_id),
+            (_hydros_node_id, self.hydros_node_id),
+        ):
+            if value is None:
+                continue
+            if var.get() != value:
+                self.tokens.append(var.set(value))
+            else:
+                self._unchanged.append((var, value))
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        for var, value in self._unchanged:
+            if var.get() != value:
+                var.set(value)
         for token in reversed(self.tokens):
             token.var.reset(token)
 
@@ -134,6 +153,43 @@ def get_hydros_node_id() -> Optional[str]:
     return _hydros_node_id.get()
 
 
+def _snapshot_log_context() -> LogContextSnapshot:
+    return (
+        _biz_scene_instance_id.get(),
+        _biz_component.get(),
+        _hydros_cluster_id.get(),
+        _hydros_node_id.get(),
+    )
+
+
+def _record_log_context(record: logging.LogRecord) -> LogContextSnapshot:
+    """优先使用入队时记录的日志上下文；同步输出时直接读取当前 ContextVar。"""
+    snapshot = getattr(record, "_hydros_log_context", None)
+    return snapshot if snapshot is not None else _snapshot_log_context()
+
+
+class HydrosQueueHandler(QueueHandler):
+    """
+    把日志记录放入队列，由后台 QueueListener 格式化并写出。
+
+    日志上下文存放在 ContextVar 中，只在调用线程可见，因此入队前先把上下文
+    （以及 JSON 格式需要的 trace 标识）快照到记录上，消息参数也在此时求值。
+    """
+
+    def __init__(self, log_queue, capture_trace: bool = False):
+        super().__init__(log_queue)
+        self.capture_trace = capture_trace
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._hydros_log_context = _snapshot_log_context()
+        if self.capture_trace:
+            record._hydros_trace_identifiers = _current_trace_identifiers()
+        return record
+
+
 class HydrosSimpleFormatter(logging.Formatter):
     """
     供本地开发使用的简化格式化器。
@@ -193,10 +249,10 @@ class HydrosFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """使用 Python 风格源码位置格式化日志记录。"""
         # 获取带默认值的上下文值
-        hydros_cluster_id = get_hydros_cluster_id() or self.default_hydros_cluster_id or "-"
-        hydros_node_id = get_hydros_node_id() or self.default_hydros_node_id or "-"
-        biz_scene_instance_id = get_biz_scene_instance_id()
-        biz_component = get_biz_component() or "Common"
+        biz_scene_instance_id, biz_component, hydros_cluster_id, hydros_node_id = _record_log_context(record)
+        hydros_cluster_id = hydros_cluster_id or self.default_hydros_cluster_id or "-"
+        hydros_node_id = hydros_node_id or self.default_hydros_node_id or "-"
+        biz_component = biz_component or "Common"
 
         # 格式化时间戳
         timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
@@ -294,18 +350,20 @@ class HydrosJsonFormatter(logging.Formatter):
         self._default_hydros_node_id = default_hydros_node_id
 
     def format(self, record: logging.LogRecord) -> str:
-        biz_scene_instance_id = get_biz_scene_instance_id()
-        biz_component = get_biz_component()
+        biz_scene_instance_id, biz_component, hydros_cluster_id, hydros_node_id = _record_log_context(record)
         hydros_cluster_id = (
-            get_hydros_cluster_id()
+            hydros_cluster_id
             or self._default_hydros_cluster_id
             or self._resource_attributes.get("k8s.cluster.name")
         )
         hydros_node_id = (
-            get_hydros_node_id()
+            hydros_node_id
             or self._default_hydros_node_id
             or self._resource_attributes.get("k8s.pod.name")
         )
+        trace_identifiers = getattr(record, "_hydros_trace_identifiers", None)
+        if trace_identifiers is None:
+            trace_identifiers = _current_trace_identifiers()
 
         payload: Dict[str, Any] = {
             "timestamp": datetime.fromtimestamp(
@@ -316,7 +374,7 @@ class HydrosJsonFormatter(logging.Formatter):
             "message": record.getMessage(),
             "logger": record.name,
             **self._resource_attributes,
-            **_current_trace_identifiers(),
+            **trace_identifiers,
             "source.file": record.filename,
             "source.function": record.funcName,
             "source.line": record.lineno,
@@ -369,6 +427,7 @@ def setup_logging(
     format_style: Optional[str] = None,
     service_name: str = "hydros-agent",
     replace_handlers: bool = True,
+    async_handlers: bool = False,
 ):
     """
     使用 Hydros 格式化器配置日志。
@@ -386,7 +445,11 @@ def setup_logging(
                       未提供时继续兼容 ``simple`` 参数。
         service_name: 未设置 ``OTEL_SERVICE_NAME`` 时写入 JSON 的应用名。
         replace_handlers: 是否移除调用方已有的 root handlers。默认保持历史行为。
+        async_handlers: 是否由后台线程格式化并写出日志（默认 False）。开启后 root 上
+                        只挂一个 HydrosQueueHandler，调用线程只做上下文快照和入队，
+                        控制台/文件 I/O 不再阻塞 tick 和 MQTT 回调；进程退出时排空队列。
     """
+    global _queue_listener
     # 按模式创建 formatter
     resolved_format = (format_style or ("simple" if simple else "full")).strip().lower()
     if resolved_format == "json":
@@ -412,6 +475,13 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
+    if _queue_listener is not None:
+        # 重新配置前先排空并停止上一次的后台 listener
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
     if replace_handlers:
         root_logger.handlers.clear()
     else:
@@ -420,6 +490,8 @@ def setup_logging(
                 root_logger.removeHandler(handler)
                 handler.close()
 
+    handlers = []
+
     # 添加控制台 handler
     if console:
         console_handler = logging.StreamHandler(
@@ -427,7 +499,7 @@ def setup_logging(
         )
         console_handler._hydros_sdk_handler = "console"  # type: ignore[attr-defined]
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # 如果指定了日志文件，则添加文件 handler
     if log_file:
@@ -448,4 +520,26 @@ def setup_logging(
 
         file_handler._hydros_sdk_handler = "file"  # type: ignore[attr-defined]
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if async_handlers and handlers:
+        log_queue = SimpleQueue()
+        queue_handler = HydrosQueueHandler(
+            log_queue,
+            capture_trace=isinstance(formatter, HydrosJsonFormatter),
+        )
+        queue_handler._hydros_sdk_handler = "queue"  # type: ignore[attr-defined]
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        root_logger.addHandler(queue_handler)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+
+
+def _stop_queue_listener() -> None:
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
+atexit.register(_stop_queue_listener)
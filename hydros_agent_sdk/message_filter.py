@@ -6,6 +6,8 @@ MQTT 指令分派器的消息过滤逻辑。
 """
 
 import logging
+from typing import Callable, Dict
+
 from hydros_agent_sdk.protocol.commands import (
     SimCommand,
     SimTaskInitRequest,
@@ -33,6 +35,11 @@ class MessageFilter:
 
     def __init__(self, context_manager: AgentStateManager):
         self.context_manager = context_manager
+        # 具体指令类型 -> is_received / 组合过滤的判定方法。Java instanceof 分支链
+        # 在某个类型的第一条入站消息上解析，之后每条消息只按 type() 查表
+        # （isinstance 的开销见 CoordinationOutboxPublisher._send_policies）。
+        self._receive_rules: Dict[type, Callable[[SimCommand], bool]] = {}
+        self._process_rules: Dict[type, Callable[[SimCommand], bool]] = {}
 
     def is_active_to_task_sim_command(self, sim_command: SimCommand) -> bool:
         """
@@ -60,9 +67,11 @@ class MessageFilter:
         Returns:
             指令应处理时返回 True，应过滤时返回 False
         """
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         # 始终接受任务初始化请求
         if isinstance(sim_command, SimTaskInitRequest):
-            logger.debug(f"Accepting SimTaskInitRequest: {sim_command.command_id}")
+            if debug_enabled:
+                logger.debug("Accepting SimTaskInitRequest: %s", sim_command.command_id)
             return True
 
         # edge 可能在本地 Agent 耗时初始化期间先返回初始化响应。
@@ -71,26 +80,29 @@ class MessageFilter:
             isinstance(sim_command, SimTaskInitResponse)
             and self.context_manager.has_initializing_context(sim_command.context)
         ):
-            logger.debug(
-                "Accepting SimTaskInitResponse for initializing context: %s",
-                sim_command.context.biz_scene_instance_id,
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Accepting SimTaskInitResponse for initializing context: %s",
+                    sim_command.context.biz_scene_instance_id,
+                )
             return True
 
         # 检查指令上下文是否处于活跃状态
         if hasattr(sim_command, 'context') and sim_command.context:
             has_context = self.context_manager.has_active_context(sim_command.context)
-            if has_context:
-                logger.debug(f"Accepting command {sim_command.command_type} for active context: "
-                           f"{sim_command.context.biz_scene_instance_id}")
-                return True
-            else:
-                logger.debug(f"Filtering out command {sim_command.command_type} for inactive context: "
-                           f"{sim_command.context.biz_scene_instance_id}")
-                return False
+            if debug_enabled:
+                logger.debug(
+                    "%s command %s for %s context: %s",
+                    "Accepting" if has_context else "Filtering out",
+                    sim_command.command_type,
+                    "active" if has_context else "inactive",
+                    sim_command.context.biz_scene_instance_id,
+                )
+            return has_context
 
         # 没有上下文或上下文不活跃
-        logger.debug(f"Filtering out command {sim_command.command_type}: no active context")
+        if debug_enabled:
+            logger.debug("Filtering out command %s: no active context", sim_command.command_type)
         return False
 
     def is_received(self, sim_command: SimCommand) -> bool:
@@ -122,38 +134,65 @@ class MessageFilter:
         Returns:
             消息应处理时返回 True，否则返回 False
         """
-        # 始终接收请求
-        if isinstance(sim_command, SimCoordinationRequest):
-            logger.debug(f"Receiving request: {sim_command.command_type}")
-            return True
+        return self._receive_rule(type(sim_command))(sim_command)
 
-        # 显式报告只接收远端智能体发出的消息
-        if isinstance(
-            sim_command,
-            (AgentInstanceStatusReport, MpcPredictionResultReport, MpcExecutionStatusReport),
-        ):
-            is_remote = self.context_manager.is_remote_agent(sim_command.source_agent_instance)
-            if is_remote:
-                logger.debug(f"Receiving report from remote agent: {sim_command.command_type}")
-                return True
-            else:
-                logger.debug(f"Filtering out report from local agent: {sim_command.command_type}")
-                return False
-
-        # 任务初始化响应只接收远端智能体发出的消息
-        if isinstance(sim_command, SimTaskInitResponse):
-            is_remote = self.context_manager.is_remote_agent(sim_command.source_agent_instance)
-            if is_remote:
-                logger.debug(f"Receiving SimTaskInitResponse from remote agent: {sim_command.command_type}")
-                return True
-            else:
-                logger.debug(f"Filtering out SimTaskInitResponse from local agent: {sim_command.command_type}")
-                return False
+    def _receive_rule(self, command_class: type) -> Callable[[SimCommand], bool]:
+        rule = self._receive_rules.get(command_class)
+        if rule is None:
+            rule = self._receive_rules[command_class] = self._resolve_receive_rule(command_class)
+        return rule
 
+    def _resolve_receive_rule(self, command_class: type) -> Callable[[SimCommand], bool]:
+        """按指令类型选出 is_received 的判定方法，分支顺序与 Java instanceof 一致。"""
+        # 始终接收请求
+        if issubclass(command_class, SimCoordinationRequest):
+            return self._receive_request
+        # 显式报告和任务初始化响应只接收远端智能体发出的消息
+        if issubclass(
+            command_class,
+            (AgentInstanceStatusReport, MpcPredictionResultReport, MpcExecutionStatusReport, SimTaskInitResponse),
+        ):
+            return self._receive_from_remote_agent
         # 默认不接收其他消息类型
-        logger.debug(f"Filtering out message (not in receive list): {sim_command.command_type}")
+        return self._receive_nothing
+
+    def _receive_request(self, sim_command: SimCommand) -> bool:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Receiving request: %s", sim_command.command_type)
+        return True
+
+    def _receive_from_remote_agent(self, sim_command: SimCommand) -> bool:
+        is_remote = self.context_manager.is_remote_agent(sim_command.source_agent_instance)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s from %s agent: %s",
+                "Receiving" if is_remote else "Filtering out",
+                "remote" if is_remote else "local",
+                sim_command.command_type,
+            )
+        return is_remote
+
+    def _receive_nothing(self, sim_command: SimCommand) -> bool:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Filtering out message (not in receive list): %s", sim_command.command_type)
         return False
 
+    def _process_rule(self, command_class: type) -> Callable[[SimCommand], bool]:
+        rule = self._process_rules.get(command_class)
+        if rule is None:
+            if issubclass(command_class, EdgeControlExecutionReport):
+                rule = self._process_edge_control_execution
+            else:
+                rule = self._receive_rule(command_class)
+            self._process_rules[command_class] = rule
+        return rule
+
+    def _process_edge_control_execution(self, sim_command: EdgeControlExecutionReport) -> bool:
+        if not self.context_manager.is_remote_agent(sim_command.source_agent_instance):
+            return False
+        target = sim_command.target_agent_instance
+        return target is None or self.context_manager.is_local_agent(target)
+
     def should_process_message(self, sim_command: SimCommand) -> bool:
         """
         组合过滤：同时检查活跃上下文过滤和接收过滤。
@@ -170,22 +209,21 @@ class MessageFilter:
         """
         # 第一层过滤：检查是否属于活跃任务
         if not self.is_active_to_task_sim_command(sim_command):
-            logger.debug(f"Message filtered (inactive context): {sim_command.command_type}, "
-                         f"command_id={sim_command.command_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Message filtered (inactive context): %s, command_id=%s",
+                    sim_command.command_type,
+                    sim_command.command_id,
+                )
             return False
 
-        if isinstance(sim_command, EdgeControlExecutionReport):
-            if not self.context_manager.is_remote_agent(sim_command.source_agent_instance):
-                return False
-            target = sim_command.target_agent_instance
-            return target is None or self.context_manager.is_local_agent(target)
-
-        # 第二层过滤：检查是否应接收
-        if not self.is_received(sim_command):
-            logger.debug(f"Message filtered (local source): {sim_command.command_type}, "
-                         f"command_id={sim_command.command_id}")
-            return False
-
-        # 通过两层过滤
-        logger.debug(f"Message accepted: {sim_command.command_type}, command_id={sim_command.command_id}")
-        return True
+        # 第二层过滤：检查是否应接收；边缘控制执行报告另需校验目标智能体在本地
+        accepted = self._process_rule(type(sim_command))(sim_command)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Message %s: %s, command_id=%s",
+                "accepted" if accepted else "filtered (local source)",
+                sim_command.command_type,
+                sim_command.command_id,
+            )
+        return accepted
@@ -451,6 +451,14 @@ class MultiAgentCallback(SimCoordinationCallback):
                 logger.error(f"Error in tick for {agent_code}: {e}", exc_info=True)
         return responses
 
+    @staticmethod
+    def _flush_agent_metrics(agent: Any) -> None:
+        flush_metrics = getattr(agent, "flush_metrics", None)
+        if flush_metrics is None:
+            return
+        if not flush_metrics():
+            logger.warning("Timed out draining metrics for agent: %s", getattr(agent, "agent_code", agent))
+
     @staticmethod
     def _supports_tick_command(agent: Any) -> bool:
         supports_tick_command = getattr(agent, "supports_tick_command", None)
@@ -495,7 +503,11 @@ class MultiAgentCallback(SimCoordinationCallback):
                             "reason": request.reason,
                         },
                     ):
-                        response = agent.on_terminate(request)
+                        try:
+                            response = agent.on_terminate(request)
+                        finally:
+                            # on_terminate 抛异常时也要排空已入队的指标
+                            self._flush_agent_metrics(agent)
                 if response:
                     responses.append(response)
                 terminal_status = (
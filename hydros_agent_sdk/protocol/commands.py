@@ -1,7 +1,7 @@
 from __future__ import annotations
 from enum import Enum
-from typing import List, Optional, Dict, Any, Union, Literal
-from pydantic import ConfigDict, Field, AliasChoices
+from typing import Annotated, List, Optional, Dict, Any, Union, Literal
+from pydantic import ConfigDict, Field, AliasChoices, PrivateAttr, TypeAdapter
 from .models import (
     AgentInstanceStatus,
     SimulationContext,
@@ -95,6 +95,23 @@ class SimTaskInitRequest(SimCoordinationRequest):
         validation_alias=AliasChoices("sim_agent_properties", "simAgentProperties"),
     )
 
+    # agent_code -> HydroAgent 索引，连同建立索引时的 agent_list 一起缓存
+    _agent_index: Optional[tuple] = PrivateAttr(default=None)
+
+    def find_agent(self, agent_code: str) -> Optional[HydroAgent]:
+        """按 agent_code 查找 agent_list 中第一个匹配的智能体。
+
+        同一请求会被任务内每个智能体各查一次，索引在首次查找时建立；
+        agent_list 被整体替换或增删元素后自动重建。
+        """
+        cached = self._agent_index
+        if cached is None or cached[0] is not self.agent_list or cached[1] != len(self.agent_list):
+            index: Dict[str, HydroAgent] = {}
+            for agent in self.agent_list:
+                index.setdefault(agent.agent_code, agent)
+            cached = self._agent_index = (self.agent_list, len(self.agent_list), index)
+        return cached[2].get(agent_code)
+
 class SimTaskInitResponse(SimCoordinationResponse):
     command_type: Literal["task_init_response"] = SIMCMD_TASK_INIT_RESPONSE
     created_agent_instances: List[HydroAgentInstance]
@@ -339,3 +356,10 @@ class SimCommandEnvelope(HydroBaseModel):
     基于 command_type 处理多态反序列化的包装对象。
     """
     command: CommandUnion = Field(discriminator='command_type')
+
+
+# 与 SimCommandEnvelope 相同的按 command_type 多态解析，但不构造外层包装模型；
+# 入站报文每条都要解析一次，直接用它取得指令对象。
+SIM_COMMAND_ADAPTER: TypeAdapter = TypeAdapter(
+    Annotated[CommandUnion, Field(discriminator='command_type')]
+)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 from urllib.parse import urlparse
 
@@ -21,21 +22,22 @@ class AgentConfigurationService:
         matching_agent = self._find_matching_agent(agent, request)
         if matching_agent is None:
             logger.info(
-                f"Agent '{agent.agent_code}' not found in SimTaskInitRequest.agent_list, "
-                f"skipping configuration loading (this is normal if only initializing a subset of agents)"
+                "Agent '%s' not found in SimTaskInitRequest.agent_list, skipping configuration loading "
+                "(this is normal if only initializing a subset of agents)",
+                agent.agent_code,
             )
             return
 
         self._apply_request_properties(agent, matching_agent, request)
 
         if not matching_agent.agent_configuration_url:
-            logger.warning(f"No agent_configuration_url provided for agent '{agent.agent_code}'")
+            logger.warning("No agent_configuration_url provided for agent '%s'", agent.agent_code)
             return
 
         agent_config_url = AgentConfigLoader.normalize_legacy_public_s3_url(
             matching_agent.agent_configuration_url
         )
-        logger.info(f"Loading agent configuration from: {agent_config_url}")
+        logger.info("Loading agent configuration from: %s", agent_config_url)
 
         if self._apply_specialized_config_url(agent, matching_agent, agent_config_url):
             object.__setattr__(agent, "agent_configuration_url", agent_config_url)
@@ -47,9 +49,16 @@ class AgentConfigurationService:
             self._apply_properties(agent, agent_config)
             object.__setattr__(agent, "agent_configuration_url", agent_config_url)
         except Exception as exc:
-            logger.error(f"Failed to load agent configuration from {agent_config_url}: {exc}")
+            logger.error("Failed to load agent configuration from %s: %s", agent_config_url, exc)
             raise
 
+        logger.info(
+            "Loaded %s properties for agent '%s' (YAML agent_code: '%s')",
+            len(agent.properties),
+            agent.agent_code,
+            agent_config.agent_code,
+        )
+
     @staticmethod
     def _apply_request_properties(agent, matching_agent, request) -> None:
         config_params = getattr(request, "agent_config_params", None) or {}
@@ -72,9 +81,9 @@ class AgentConfigurationService:
             )
 
     def _find_matching_agent(self, agent, request):
-        for requested_agent in request.agent_list:
-            if requested_agent.agent_code == agent.agent_code:
-                return requested_agent
+        requested_agent = request.find_agent(agent.agent_code)
+        if requested_agent is not None:
+            return requested_agent
 
         if self._is_system_default_central_scheduling_agent(agent):
             central_agents = [
@@ -152,22 +161,12 @@ class AgentConfigurationService:
                 f"Please check the agent_configuration_url: {agent_config_url}"
             )
 
-        logger.info(
-            f"Agent configuration validated successfully for '{agent.agent_code}' "
-            f"(YAML agent_code: '{agent_config.agent_code}')"
-        )
-
     @staticmethod
     def _apply_properties(agent, agent_config) -> None:
-        if agent_config.properties:
-            properties_dict = agent_config.properties.model_dump(exclude_none=True)
-            agent.properties.update(properties_dict)
-
-        for component in agent_config.components or []:
-            if not component.enabled or not component.properties:
-                continue
-            component_properties = component.properties.model_dump(exclude_none=True)
-            agent.properties.update(component_properties)
-
-        logger.info(f"Loaded {len(agent.properties)} properties from configuration")
-        logger.debug(f"Properties: {list(agent.properties.keys())}")
+        # 合并结果缓存在配置对象上，条件请求命中缓存时不再重新合并；
+        # 缓存的配置在加载同一 URL 的智能体之间共享，每个智能体拿一份深拷贝，
+        # 修改嵌套的 list/dict 属性不会影响其他智能体和缓存
+        agent.properties.update(copy.deepcopy(agent_config.merged_properties()))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Properties: %s", list(agent.properties.keys()))
@@ -52,3 +52,7 @@ class AgentContext:
     def send_response(self, response) -> None:
         """通过协调客户端队列发送响应。"""
         self.client.enqueue(response)
+
+    def send_responses(self, responses) -> None:
+        """通过协调客户端队列一次性提交多条响应。"""
+        self.client.enqueue_many(responses)
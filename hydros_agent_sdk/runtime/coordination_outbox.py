@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import json
 import logging
 import time
-from queue import Empty, Queue
+from queue import Empty, SimpleQueue
 from threading import Event, Thread
-from typing import Optional
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from hydros_agent_sdk.protocol.commands import (
     AgentInstanceStatusReport,
@@ -27,7 +29,21 @@ logger = logging.getLogger(__name__)
 
 
 class CoordinationOutboxPublisher:
-    """判断哪些协调指令需要离开当前节点，并负责发布。"""
+    """判断哪些协调指令需要离开当前节点，并负责发布。
+
+    command_qos 按 command_type 覆盖默认 qos。QoS 1/2 每条消息都要等待
+    broker 确认（PUBACK 或 PUBREC/PUBREL/PUBCOMP 往返），在受限链路上吞吐
+    可能只有 QoS 0 的几十分之一；对会被下一条同类指令取代、丢失可容忍的
+    指令可按类型降为 0。tick 响应等协调方需要逐条收齐的指令应保持默认 qos。
+
+    是否发布在 enqueue 时判定，不离开本节点的指令不进入队列，worker 只负责
+    发布。worker 每次唤醒最多取出 MAX_DRAIN_ITEMS 个队列项；transport 提供
+    publish_many 时，多条待发指令先连续发出再统一等待确认，确认往返不再
+    逐条串行。发布失败的指令按指数退避排入重试堆，到期后由 worker 重发，
+    退避等待期间 worker 继续发布后续指令，单条失败不会阻塞整个队列。
+    """
+
+    MAX_DRAIN_ITEMS = 64
 
     def __init__(
         self,
@@ -38,15 +54,26 @@ class CoordinationOutboxPublisher:
         max_retry_count: int = 5,
         base_retry_delay_ms: int = 1000,
         log: Optional[logging.Logger] = None,
+        command_qos: Optional[Mapping[str, int]] = None,
     ) -> None:
         self.transport = transport
         self.state_manager = state_manager
         self.topic = topic
         self.qos = qos
+        self.command_qos: Dict[str, int] = self._validate_command_qos(command_qos)
         self.max_retry_count = max_retry_count
         self.base_retry_delay_ms = base_retry_delay_ms
         self.logger = log or logger
-        self._queue: Queue[SimCommand] = Queue()
+        # 出站队列只有 put/get，不需要 task_done/join：SimpleQueue 由 C 实现，
+        # 入队和取出都不经过 Queue 的 Python 层锁与条件变量
+        self._queue: SimpleQueue[Union[SimCommand, List[SimCommand]]] = SimpleQueue()
+        # 具体指令类型 -> 发布判定方法。Pydantic 模型的元类继承自 ABCMeta，
+        # isinstance 每次都走 ABCMeta.__instancecheck__，按类型解析一次后缓存。
+        self._send_policies: Dict[type, Callable[[SimCommand], bool]] = {}
+        # 待重试指令：(到期时间, 序号, 指令, 报文, 已失败次数)，按 time.monotonic()
+        # 到期排序，序号保证同一时刻到期的指令按入堆顺序重发。只由 worker 线程访问。
+        self._retry_heap: List[Tuple[float, int, SimCommand, str, int]] = []
+        self._retry_sequence = itertools.count()
         self._running = Event()
         self._worker: Optional[Thread] = None
 
@@ -72,82 +99,265 @@ class CoordinationOutboxPublisher:
         self._worker = None
 
     def enqueue(self, command: SimCommand) -> None:
-        """将一条指令加入出站过滤和发布队列。"""
+        """判定一条指令是否需要发布，需要时加入出站发布队列。"""
+        if not self._accept(command):
+            return
         self._queue.put(command)
-        self.logger.info("Enqueued command: %s", self.format_command_for_log(command))
+        # 每条出站指令都经过这里，只在 DEBUG 记录；日志内容需要完整序列化指令，
+        # DEBUG 关闭时不做这次序列化
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Enqueued command: %s", self.format_command_for_log(command))
+
+    def enqueue_many(self, commands: Iterable[SimCommand]) -> None:
+        """将同一时刻产生的多条指令作为一个队列项加入 outbox。
+
+        入队前逐条判定是否发布，worker 按原顺序逐条发布，每条仍是一条独立的
+        MQTT 消息；合并的只是入队、唤醒和日志开销。
+        """
+        batch = [command for command in commands if self._accept(command)]
+        if not batch:
+            return
+        if len(batch) == 1:
+            self._queue.put(batch[0])
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Enqueued command: %s", self.format_command_for_log(batch[0]))
+            return
+        self._queue.put(batch)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Enqueued %s commands: %s",
+                len(batch),
+                ", ".join(self.format_command_for_log(command) for command in batch),
+            )
+
+    def _accept(self, command: SimCommand) -> bool:
+        """入队前判定指令是否需要发布；判定失败按不发布处理并记录错误。"""
+        try:
+            if self.should_send(command):
+                return True
+        except Exception:
+            self.logger.error(
+                "Error publishing outbound command: id=%s",
+                command.command_id,
+                exc_info=True,
+            )
+            return False
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Outbound command stays local: type=%s, id=%s",
+                command.command_type,
+                command.command_id,
+            )
+        return False
 
     def _run(self) -> None:
         self.logger.info("Coordination outbox publisher started")
-        while self._running.is_set() or not self._queue.empty():
+        while self._running.is_set() or not self._queue.empty() or self._retry_heap:
+            self._publish_due_retries()
             try:
-                command = self._queue.get(timeout=0.1)
+                item = self._queue.get(timeout=self._next_wait_seconds())
             except Empty:
                 continue
 
+            items = [item]
+            while len(items) < self.MAX_DRAIN_ITEMS:
+                try:
+                    items.append(self._queue.get_nowait())
+                except Empty:
+                    break
+
+            commands = [
+                command
+                for queued in items
+                for command in (queued if isinstance(queued, list) else (queued,))
+            ]
+            self._publish_outbound_batch(commands)
+        self.logger.info("Coordination outbox publisher stopped")
+
+    def _publish_outbound_batch(self, commands: List[SimCommand]) -> None:
+        publish_many = getattr(self.transport, "publish_many", None)
+        if publish_many is None or len(commands) == 1:
+            for command in commands:
+                self._publish_outbound(command)
+            return
+
+        outbound = []
+        for command in commands:
             try:
-                if self.should_send(command):
-                    self.send_with_retry(command)
+                outbound.append((command, self.serialize(command), self.qos_for(command)))
             except Exception:
                 self.logger.error(
                     "Error publishing outbound command: id=%s",
                     command.command_id,
                     exc_info=True,
                 )
-            finally:
-                self._queue.task_done()
-        self.logger.info("Coordination outbox publisher stopped")
+        if not outbound:
+            return
 
-    def should_send(self, command: SimCommand) -> bool:
-        """判断一条出站协调指令是否应当发布。"""
-        if isinstance(command, SimCoordinationRequest):
-            return False
+        try:
+            errors = publish_many(self.topic, [(payload, qos) for _, payload, qos in outbound])
+        except Exception as error:
+            errors = [error] * len(outbound)
+        for (command, payload, _qos), error in zip(outbound, errors):
+            if error is None:
+                self._log_published(command)
+                continue
+            self.logger.warning(
+                "Pipelined publish failed, retrying individually: id=%s: %s",
+                command.command_id,
+                error,
+            )
+            self._attempt_publish(command, payload, 0)
 
-        if isinstance(command, SimCoordinationResponse):
-            if isinstance(command, SimTaskTerminateResponse):
-                node_id = self.state_manager.get_node_id()
-                if node_id and command.source_agent_instance.hydros_node_id == node_id:
-                    return True
-            return self.state_manager.is_local_agent(command.source_agent_instance)
+    def _publish_outbound(self, command: SimCommand) -> None:
+        try:
+            payload = self.serialize(command)
+        except Exception:
+            self.logger.error(
+                "Error publishing outbound command: id=%s",
+                command.command_id,
+                exc_info=True,
+            )
+            return
+        self._attempt_publish(command, payload, 0)
 
-        if isinstance(command, AgentInstanceStatusReport):
-            if self.state_manager.is_local_agent(command.source_agent_instance):
-                return True
-            node_id = self.state_manager.get_node_id()
-            return bool(node_id and command.source_agent_instance.hydros_node_id == node_id)
+    def _attempt_publish(self, command: SimCommand, payload: str, attempt: int) -> None:
+        """发布一次；失败时把下一次重试排入重试堆后立即返回，不阻塞 worker。"""
+        try:
+            self.transport.publish(self.topic, payload, qos=self.qos_for(command))
+        except Exception as exc:
+            self._schedule_retry(command, payload, attempt, exc)
+            return
+        self._log_published(command)
+
+    def _schedule_retry(self, command: SimCommand, payload: str, attempt: int, error: Exception) -> None:
+        self.logger.error(
+            "Failed to send command: id=%s, attempt=%s/%s: %s",
+            command.command_id,
+            attempt,
+            self.max_retry_count,
+            error,
+        )
+        attempt += 1
+        if attempt > self.max_retry_count:
+            self.logger.error("Max retry count exceeded for command: id=%s", command.command_id)
+            return
+
+        delay_ms = self.base_retry_delay_ms * (2 ** attempt)
+        self.logger.info(
+            "Retrying after %sms... (attempt %s/%s)",
+            delay_ms,
+            attempt,
+            self.max_retry_count,
+        )
+        heapq.heappush(
+            self._retry_heap,
+            (time.monotonic() + delay_ms / 1000.0, next(self._retry_sequence), command, payload, attempt),
+        )
+
+    def _publish_due_retries(self) -> None:
+        retry_heap = self._retry_heap
+        now = time.monotonic()
+        while retry_heap and retry_heap[0][0] <= now:
+            _due, _sequence, command, payload, attempt = heapq.heappop(retry_heap)
+            self._attempt_publish(command, payload, attempt)
+
+    def _next_wait_seconds(self) -> float:
+        """队列阻塞等待的时长：有待重试指令时不晚于最早一条的到期时间醒来。"""
+        if not self._retry_heap:
+            return 0.1
+        return min(0.1, max(0.0, self._retry_heap[0][0] - time.monotonic()))
+
+    def should_send(self, command: SimCommand) -> bool:
+        """判断一条出站协调指令是否应当发布。"""
+        command_class = type(command)
+        policy = self._send_policies.get(command_class)
+        if policy is None:
+            policy = self._send_policies[command_class] = self._resolve_send_policy(command_class)
+        return policy(command)
 
-        if isinstance(
-            command,
-            (MpcPredictionResultReport, MpcExecutionStatusReport, EdgeControlExecutionReport),
+    def _resolve_send_policy(self, command_class: type) -> Callable[[SimCommand], bool]:
+        """按指令类型选出发布判定方法；请求类型优先，终止响应先于一般响应。"""
+        if issubclass(command_class, SimCoordinationRequest):
+            return self._never_send
+        if issubclass(command_class, SimTaskTerminateResponse):
+            return self._should_send_terminate_response
+        if issubclass(command_class, SimCoordinationResponse):
+            return self._should_send_response
+        if issubclass(
+            command_class,
+            (
+                AgentInstanceStatusReport,
+                MpcPredictionResultReport,
+                MpcExecutionStatusReport,
+                EdgeControlExecutionReport,
+            ),
         ):
-            return self._is_local_source(command.source_agent_instance)
+            return self._should_send_local_source
+        return self._never_send
 
+    def _never_send(self, command: SimCommand) -> bool:
         return False
 
+    def _should_send_terminate_response(self, command: SimCommand) -> bool:
+        state_manager = self.state_manager
+        source_agent_instance = command.source_agent_instance
+        node_id = state_manager.get_node_id()
+        if node_id and source_agent_instance.hydros_node_id == node_id:
+            return True
+        return state_manager.is_local_agent(source_agent_instance)
+
+    def _should_send_response(self, command: SimCommand) -> bool:
+        return self.state_manager.is_local_agent(command.source_agent_instance)
+
+    def _should_send_local_source(self, command: SimCommand) -> bool:
+        return self._is_local_source(command.source_agent_instance)
+
     def _is_local_source(self, source_agent_instance) -> bool:
-        if self.state_manager.is_local_agent(source_agent_instance):
+        state_manager = self.state_manager
+        if state_manager.is_local_agent(source_agent_instance):
             return True
-        node_id = self.state_manager.get_node_id()
+        node_id = state_manager.get_node_id()
         return bool(node_id and source_agent_instance.hydros_node_id == node_id)
 
-    def send_with_retry(self, command: SimCommand) -> None:
-        """通过带重试和退避的方式向 MQTT 发布协调指令。"""
+    @staticmethod
+    def _validate_command_qos(command_qos: Optional[Mapping[str, int]]) -> Dict[str, int]:
+        validated = {}
+        for command_type, qos in (command_qos or {}).items():
+            if qos not in (0, 1, 2):
+                raise ValueError(f"invalid qos for {command_type}: {qos}")
+            validated[str(command_type)] = qos
+        return validated
+
+    def qos_for(self, command: SimCommand) -> int:
+        """返回指令使用的 QoS：按 command_type 覆盖，未配置时使用默认 qos。"""
+        if not self.command_qos:
+            return self.qos
+        return self.command_qos.get(command.command_type, self.qos)
+
+    @staticmethod
+    def serialize(command: SimCommand) -> str:
+        """把协调指令序列化为 JSON 报文。"""
+        return command.model_dump_json(by_alias=True)
+
+    def send_with_retry(self, command: SimCommand, payload: Optional[str] = None) -> None:
+        """通过带重试和退避的方式向 MQTT 同步发布协调指令。
+
+        供直接调用方使用，退避期间阻塞当前线程，重试耗尽后抛出最后一次异常；
+        outbox worker 不经过这里，失败指令排入重试堆。payload 为已序列化的
+        报文时直接复用。
+        """
         attempt = 0
         command_id = command.command_id
+        qos = self.qos_for(command)
+        # 指令发出后不再修改，重试时复用同一份报文
+        if payload is None:
+            payload = self.serialize(command)
 
         while attempt <= self.max_retry_count:
             try:
-                payload = command.model_dump_json(by_alias=True)
-                self.transport.publish(self.topic, payload, qos=self.qos)
-
-                if isinstance(command, MpcPredictionResultReport):
-                    self.logger.info(
-                        "MPC prediction result report sent to coordinator: topic=%s, command_id=%s, "
-                        "result_count=%s, detail_count=%s",
-                        self.topic,
-                        command_id,
-                        len(command.mpc_prediction_results or []),
-                        self.count_mpc_prediction_result_details(command),
-                    )
+                self.transport.publish(self.topic, payload, qos=qos)
+                self._log_published(command)
                 return
 
             except Exception as exc:
@@ -173,6 +383,17 @@ class CoordinationOutboxPublisher:
                 )
                 time.sleep(delay_ms / 1000.0)
 
+    def _log_published(self, command: SimCommand) -> None:
+        if isinstance(command, MpcPredictionResultReport):
+            self.logger.info(
+                "MPC prediction result report sent to coordinator: topic=%s, command_id=%s, "
+                "result_count=%s, detail_count=%s",
+                self.topic,
+                command.command_id,
+                len(command.mpc_prediction_results or []),
+                self.count_mpc_prediction_result_details(command),
+            )
+
     @classmethod
     def format_command_for_log(cls, command: SimCommand) -> str:
         if isinstance(command, MpcPredictionResultReport):
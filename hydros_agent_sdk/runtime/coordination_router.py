@@ -63,23 +63,28 @@ class CoordinationCommandRouter:
         self.context_id_getter = context_id_getter or (lambda _command: None)
         self.event_type_getter = event_type_getter or (lambda _command: None)
         self.logger = log or logger
+        consumer = getattr(callback, "consume_pending_status_reports", None)
+        self._pending_reports_consumer = consumer if callable(consumer) else None
         self.handlers: Dict[str, Callable[[SimCommand], object]] = self._build_handlers()
 
     def _build_handlers(self) -> Dict[str, Callable[[SimCommand], object]]:
+        # 只做透传的指令直接绑定回调的 bound method，分派时一次字典查找加一次调用，
+        # 不再经过 handle_* 包装层；command_type 到请求类型的对应由解析阶段保证。
+        callback = self.callback
         return {
-            SIMCMD_TASK_INIT_REQUEST: self.handle_task_init,
+            SIMCMD_TASK_INIT_REQUEST: callback.on_sim_task_init,
             SIMCMD_TASK_INIT_RESPONSE: self.handle_task_init_response,
-            SIMCMD_TICK_CMD_REQUEST: self.handle_tick,
-            SIMCMD_TASK_TERMINATE_REQUEST: self.handle_task_terminate,
-            SIMCMD_TIME_SERIES_DATA_UPDATE_REQUEST: self.handle_time_series_data_update,
+            SIMCMD_TICK_CMD_REQUEST: callback.on_tick,
+            SIMCMD_TASK_TERMINATE_REQUEST: callback.on_task_terminate,
+            SIMCMD_TIME_SERIES_DATA_UPDATE_REQUEST: callback.on_time_series_data_update,
             SIMCMD_HYDRO_EVENT_COMMAND: self.handle_hydro_event_command,
-            SIMCMD_TIME_SERIES_CALCULATION_REQUEST: self.handle_time_series_calculation,
+            SIMCMD_TIME_SERIES_CALCULATION_REQUEST: callback.on_time_series_calculation,
             SIMCMD_AGENT_INSTANCE_STATUS_REPORT: self.handle_agent_status_report,
             SIMCMD_MPC_PREDICTION_RESULT_REPORT: self.handle_mpc_prediction_result_report,
             SIMCMD_MPC_EXECUTION_STATUS_REPORT: self.handle_mpc_execution_status_report,
             SIMCMD_EDGE_CONTROL_EXECUTION_REPORT: self.handle_station_control_execution_report,
-            SIMCMD_OUTFLOW_TIME_SERIES_REQUEST: self.handle_outflow_time_series_request,
-            SIMCMD_OUTFLOW_TIME_SERIES_DATA_UPDATE_REQUEST: self.handle_outflow_time_series_data_update,
+            SIMCMD_OUTFLOW_TIME_SERIES_REQUEST: callback.on_outflow_time_series,
+            SIMCMD_OUTFLOW_TIME_SERIES_DATA_UPDATE_REQUEST: callback.on_outflow_time_series_data_update,
         }
 
     def dispatch(self, command: SimCommand):
@@ -88,15 +93,18 @@ class CoordinationCommandRouter:
             self.logger.warning("No handler registered for command type: %s", command.command_type)
             return None
 
-        self.logger.debug(
-            "MQTT command accepted: type=%s, id=%s, context=%s, eventType=%s, handler=%s",
-            command.command_type,
-            command.command_id,
-            self.context_id_getter(command),
-            self.event_type_getter(command),
-            getattr(handler, "__name__", str(handler)),
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "MQTT command accepted: type=%s, id=%s, context=%s, eventType=%s, handler=%s",
+                command.command_type,
+                command.command_id,
+                self.context_id_getter(command),
+                self.event_type_getter(command),
+                getattr(handler, "__name__", str(handler)),
+            )
         result = handler(command)
+        if self._pending_reports_consumer is None:
+            return result
         pending_reports = self._consume_callback_pending_reports(
             self.context_id_getter(command)
         )
@@ -111,42 +119,30 @@ class CoordinationCommandRouter:
         return [result, *pending_reports]
 
     def _consume_callback_pending_reports(self, context_id: Optional[str]):
-        consumer = getattr(self.callback, "consume_pending_status_reports", None)
-        if not callable(consumer) or not context_id:
+        consumer = self._pending_reports_consumer
+        if consumer is None or not context_id:
             return []
         reports = consumer(context_id)
         return list(reports or [])
 
-    def handle_task_init(self, command: SimCommand):
-        request = command
-        assert isinstance(request, SimTaskInitRequest)
+    def handle_task_init(self, request: SimTaskInitRequest):
         return self.callback.on_sim_task_init(request)
 
-    def handle_task_init_response(self, command: SimCommand):
-        response = command
-        assert isinstance(response, SimTaskInitResponse)
+    def handle_task_init_response(self, response: SimTaskInitResponse):
         if self.callback.is_remote_agent(response.source_agent_instance):
             return self.callback.on_agent_instance_sibling_created(response)
         return None
 
-    def handle_tick(self, command: SimCommand):
-        request = command
-        assert isinstance(request, TickCmdRequest)
+    def handle_tick(self, request: TickCmdRequest):
         return self.callback.on_tick(request)
 
-    def handle_task_terminate(self, command: SimCommand):
-        request = command
-        assert isinstance(request, SimTaskTerminateRequest)
+    def handle_task_terminate(self, request: SimTaskTerminateRequest):
         return self.callback.on_task_terminate(request)
 
-    def handle_time_series_data_update(self, command: SimCommand):
-        request = command
-        assert isinstance(request, TimeSeriesDataUpdateRequest)
+    def handle_time_series_data_update(self, request: TimeSeriesDataUpdateRequest):
         return self.callback.on_time_series_data_update(request)
 
-    def handle_hydro_event_command(self, command: SimCommand):
-        request = command
-        assert isinstance(request, HydroEventCommand)
+    def handle_hydro_event_command(self, request: HydroEventCommand):
         payload = request.payload
 
         if isinstance(payload, TimeSeriesDataChangedEvent):
@@ -228,45 +224,31 @@ class CoordinationCommandRouter:
             error_message=response.error_message,
         )
 
-    def handle_outflow_time_series_data_update(self, command: SimCommand):
-        request = command
-        assert isinstance(request, OutflowTimeSeriesDataUpdateRequest)
+    def handle_outflow_time_series_data_update(self, request: OutflowTimeSeriesDataUpdateRequest):
         return self.callback.on_outflow_time_series_data_update(request)
 
-    def handle_time_series_calculation(self, command: SimCommand):
-        request = command
-        assert isinstance(request, TimeSeriesCalculationRequest)
+    def handle_time_series_calculation(self, request: TimeSeriesCalculationRequest):
         return self.callback.on_time_series_calculation(request)
 
-    def handle_agent_status_report(self, command: SimCommand):
-        report = command
-        assert isinstance(report, AgentInstanceStatusReport)
+    def handle_agent_status_report(self, report: AgentInstanceStatusReport):
         if self.callback.is_remote_agent(report.source_agent_instance):
             return self.callback.on_agent_instance_sibling_status_updated(report)
         return None
 
-    def handle_mpc_prediction_result_report(self, command: SimCommand):
-        report = command
-        assert isinstance(report, MpcPredictionResultReport)
+    def handle_mpc_prediction_result_report(self, report: MpcPredictionResultReport):
         if self.callback.is_remote_agent(report.source_agent_instance):
             return self.callback.on_mpc_prediction_result(report)
         return None
 
-    def handle_mpc_execution_status_report(self, command: SimCommand):
-        report = command
-        assert isinstance(report, MpcExecutionStatusReport)
+    def handle_mpc_execution_status_report(self, report: MpcExecutionStatusReport):
         if self.callback.is_remote_agent(report.source_agent_instance):
             return self.callback.on_mpc_execution_status(report)
         return None
 
-    def handle_station_control_execution_report(self, command: SimCommand):
-        report = command
-        assert isinstance(report, EdgeControlExecutionReport)
+    def handle_station_control_execution_report(self, report: EdgeControlExecutionReport):
         if self.callback.is_remote_agent(report.source_agent_instance):
             return self.callback.on_station_control_execution(report)
         return None
 
-    def handle_outflow_time_series_request(self, command: SimCommand):
-        request = command
-        assert isinstance(request, OutflowTimeSeriesRequest)
+    def handle_outflow_time_series_request(self, request: OutflowTimeSeriesRequest):
         return self.callback.on_outflow_time_series(request)
@@ -31,6 +31,13 @@ def _first_value(*values: Optional[str]) -> Optional[str]:
     return None
 
 
+def _first_bool(*values: Optional[str], default: bool = False) -> bool:
+    value = _first_value(*values)
+    if value is None:
+        return default
+    return value.lower() in ("true", "yes", "1", "on")
+
+
 def _first_float(*values: Optional[str]) -> Optional[float]:
     value = _first_value(*values)
     if value is None:
@@ -49,6 +56,9 @@ class RuntimeEnvSettings:
     mqtt_broker_port: Optional[str] = None
     mqtt_topic: Optional[str] = None
     metrics_topic: Optional[str] = None
+    metrics_batch_payloads: bool = False
+    metrics_write_and_flush: bool = True
+    metrics_payload_format: str = "json"
     mpc_service_base_url: Optional[str] = None
     mpc_request_timeout_seconds: Optional[float] = None
 
@@ -75,6 +85,22 @@ class RuntimeEnvSettings:
             mqtt_broker_port=_first_value(os.getenv("MQTT_BROKER_PORT"), config.get("mqtt_broker_port")),
             mqtt_topic=mqtt_topic,
             metrics_topic=metrics_topic,
+            metrics_batch_payloads=_first_bool(
+                os.getenv("HYDROS_METRICS_BATCH_PAYLOADS"),
+                config.get("metrics_batch_payloads"),
+            ),
+            metrics_write_and_flush=_first_bool(
+                os.getenv("HYDROS_METRICS_WRITE_AND_FLUSH"),
+                config.get("metrics_write_and_flush"),
+                default=True,
+            ),
+            metrics_payload_format=(
+                _first_value(
+                    os.getenv("HYDROS_METRICS_PAYLOAD_FORMAT"),
+                    config.get("metrics_payload_format"),
+                )
+                or "json"
+            ).lower(),
             mpc_service_base_url=_first_value(
                 os.getenv("HYDROS_MPC_SERVICE_BASE_URL"),
                 os.getenv("MPC_SERVICE_BASE_URL"),
@@ -7,7 +7,7 @@ import time
 from dataclasses import dataclass
 from queue import Empty, Full, Queue
 from threading import Event, Thread, current_thread
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 from hydros_agent_sdk.coordination_callback import SimCoordinationCallback
 from hydros_agent_sdk.logging_config import (
@@ -50,6 +50,7 @@ class TaskRuntime:
         mailbox_size: int = 1000,
         on_closed: Optional[Callable[[str, "TaskRuntime"], None]] = None,
         log: Optional[logging.Logger] = None,
+        outbound_batch_submitter: Optional[Callable[[List[SimCommand]], None]] = None,
     ) -> None:
         if not context_id:
             raise ValueError("context_id is required")
@@ -58,6 +59,8 @@ class TaskRuntime:
         self.callback = callback
         self.state_manager = state_manager
         self.outbound_submitter = outbound_submitter
+        # 一次回调产生多条指令（如多智能体 tick 的各自响应）时整批提交，未配置时逐条提交
+        self.outbound_batch_submitter = outbound_batch_submitter
         self.on_closed = on_closed
         self.logger = log or logger
         self.running = Event()
@@ -123,14 +126,16 @@ class TaskRuntime:
                 f"capacity={mailbox.maxsize}"
             ) from error
 
-        self.logger.debug(
-            "Task command enqueued: type=%s, id=%s, context=%s, lane=%s, queueSize=%s",
-            command.command_type,
-            command.command_id,
-            self.context_id,
-            lane,
-            mailbox.qsize(),
-        )
+        # qsize() 需要获取队列锁，DEBUG 关闭时不取
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Task command enqueued: type=%s, id=%s, context=%s, lane=%s, queueSize=%s",
+                command.command_type,
+                command.command_id,
+                self.context_id,
+                lane,
+                mailbox.qsize(),
+            )
 
     def handle(self, command: SimCommand) -> None:
         """分发一条指令，并将回调异常转换为失败响应。"""
@@ -244,11 +249,26 @@ class TaskRuntime:
             self.outbound_submitter(result)
             return
         if isinstance(result, (list, tuple)):
-            for item in result:
-                self._submit_result(item)
+            commands: List[SimCommand] = []
+            self._collect_commands(result, commands)
+            if len(commands) > 1 and self.outbound_batch_submitter is not None:
+                self.outbound_batch_submitter(commands)
+                return
+            for command in commands:
+                self.outbound_submitter(command)
             return
         self.logger.debug("Ignoring unsupported callback result type: %s", type(result).__name__)
 
+    def _collect_commands(self, result, commands: List[SimCommand]) -> None:
+        """按原顺序展开嵌套的回调结果，只保留协调指令。"""
+        for item in result:
+            if isinstance(item, SimCommand):
+                commands.append(item)
+            elif isinstance(item, (list, tuple)):
+                self._collect_commands(item, commands)
+            elif item is not None:
+                self.logger.debug("Ignoring unsupported callback result type: %s", type(item).__name__)
+
     def _set_logging_context(self) -> None:
         cluster_id = self.state_manager.get_cluster_id()
         if cluster_id:
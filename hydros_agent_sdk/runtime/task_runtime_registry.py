@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from threading import Event, RLock
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 from hydros_agent_sdk.coordination_callback import SimCoordinationCallback
 from hydros_agent_sdk.protocol.commands import SimCommand, SimTaskInitRequest
@@ -26,10 +26,12 @@ class TaskRuntimeRegistry:
         outbound_submitter: Callable[[SimCommand], None],
         mailbox_size: int = 1000,
         log: Optional[logging.Logger] = None,
+        outbound_batch_submitter: Optional[Callable[[List[SimCommand]], None]] = None,
     ) -> None:
         self.callback = callback
         self.state_manager = state_manager
         self.outbound_submitter = outbound_submitter
+        self.outbound_batch_submitter = outbound_batch_submitter
         self.mailbox_size = mailbox_size
         self.logger = log or logger
         self.running = Event()
@@ -88,6 +90,7 @@ class TaskRuntimeRegistry:
                 mailbox_size=self.mailbox_size,
                 on_closed=self._remove_closed,
                 log=self.logger,
+                outbound_batch_submitter=self.outbound_batch_submitter,
             )
             self._runtimes[context_id] = runtime
 
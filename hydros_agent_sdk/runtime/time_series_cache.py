@@ -2,31 +2,81 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import math
+import sys
+from array import array
+from typing import Dict, Optional, Tuple
 
 from hydros_agent_sdk.protocol.models import ObjectTimeSeries
 
 
+CacheKey = Tuple[int, str]
+
+
 class TimeSeriesCache:
-    """按对象和指标缓存 ObjectTimeSeries，并提供按 step 查询。"""
+    """按对象和指标缓存 ObjectTimeSeries，并提供按 step 查询。
+
+    每条序列在入库时建立 step -> value 索引，按 step 查询为 O(1)。
+    store 仍可被直接写入；索引与 store 中的序列对象不一致时会按需重建。
+    删除序列请用 remove / clear，它们会同时清理索引；直接从 store 删除的键，
+    其索引在下次查询该键时丢弃。
+    get_step_arrays 另外提供按 step 升序的平行数组（SoA），供批量数值计算使用。
+
+    values_typecode="f" 时平行数组中的值以 FP32 存储，内存和扫描带宽减半。
+    FP32 约 7 位有效数字：1000 m 量级水位的量化误差约 6e-5 m，
+    10000 m³/s 量级流量约 1e-3 m³/s，均远小于常见传感器分辨率。
+    get_value 始终返回入库时的原始 Python float，不受该设置影响。
+
+    缓存键为 (object_id, metrics_code) 元组，查询时无需拼接字符串。
+    查询时 object_id 统一经 int() 归一化，"1" 与 1 命中同一条序列。
+    """
+
+    _VALUE_TYPECODES = ("d", "f")
 
-    def __init__(self):
-        self.store: Dict[str, ObjectTimeSeries] = {}
+    def __init__(self, values_typecode: str = "d"):
+        if values_typecode not in self._VALUE_TYPECODES:
+            raise ValueError(f"values_typecode must be one of {self._VALUE_TYPECODES}: {values_typecode}")
+        self.values_typecode = values_typecode
+        self.store: Dict[CacheKey, ObjectTimeSeries] = {}
+        self._step_index: Dict[CacheKey, Tuple[ObjectTimeSeries, Dict[int, Optional[float]]]] = {}
+        self._step_arrays: Dict[CacheKey, Tuple[ObjectTimeSeries, array, array]] = {}
 
     @staticmethod
-    def build_key(object_id: int, metrics_code: str) -> str:
-        return f"{object_id}_{metrics_code}"
+    def build_key(object_id: int, metrics_code: str) -> CacheKey:
+        return (int(object_id), metrics_code)
 
     def update(self, object_time_series: ObjectTimeSeries) -> None:
-        self.store[
-            self.build_key(
-                object_time_series.object_id,
-                object_time_series.metrics_code,
-            )
-        ] = object_time_series
+        # 入库时驻留指标编码，同一指标的全部缓存键共享一个字符串对象
+        metrics_code = object_time_series.metrics_code
+        if metrics_code is not None:
+            metrics_code = sys.intern(metrics_code)
+        # ObjectTimeSeries 已由 pydantic 把 object_id 校验为 int
+        key = (object_time_series.object_id, metrics_code)
+        self.store[key] = object_time_series
+        self._step_index[key] = (object_time_series, self._index_steps(object_time_series))
+
+    @staticmethod
+    def _index_steps(object_time_series: ObjectTimeSeries) -> Dict[int, Optional[float]]:
+        # 逆序写入，重复 step 时保留序列中第一次出现的值，与逐项扫描语义一致。
+        return {
+            ts_value.step: ts_value.value
+            for ts_value in reversed(object_time_series.time_series or ())
+        }
 
     def get(self, object_id: int, metrics_code: str) -> Optional[ObjectTimeSeries]:
-        return self.store.get(self.build_key(object_id, metrics_code))
+        return self.store.get((int(object_id), metrics_code))
+
+    def remove(self, object_id: int, metrics_code: str) -> Optional[ObjectTimeSeries]:
+        """删除一条序列及其索引，返回被删除的序列；不存在时返回 None。"""
+        key = (int(object_id), metrics_code)
+        self._discard_index(key)
+        return self.store.pop(key, None)
+
+    def clear(self) -> None:
+        """清空全部序列及索引。"""
+        self.store.clear()
+        self._step_index.clear()
+        self._step_arrays.clear()
 
     def get_value(
         self,
@@ -34,11 +84,58 @@ class TimeSeriesCache:
         metrics_code: str,
         step: int,
     ) -> Optional[float]:
-        time_series = self.get(object_id, metrics_code)
-        if not time_series or not time_series.time_series:
+        key = (int(object_id), metrics_code)
+        time_series = self.store.get(key)
+        if time_series is None:
+            self._discard_index(key)
             return None
+        # 常见情况：索引与 store 一致，直接查 step；否则按需重建
+        indexed = self._step_index.get(key)
+        if indexed is not None and indexed[0] is time_series:
+            return indexed[1].get(step)
+        return self._get_step_index(key, time_series).get(step)
+
+    def get_step_arrays(
+        self,
+        object_id: int,
+        metrics_code: str,
+    ) -> Optional[Tuple[array, array]]:
+        """
+        返回按 step 升序排列的 (steps, values) 平行数组。
+
+        steps 为 int64（array 'q'），values 按 values_typecode 为 float64 或 float32，缺失值记为 NaN；
+        两者都支持 buffer 协议，可用 numpy.frombuffer 零拷贝转换后做向量化切片。
+        """
+        key = self.build_key(object_id, metrics_code)
+        time_series = self.store.get(key)
+        if time_series is None:
+            self._discard_index(key)
+            return None
+
+        cached = self._step_arrays.get(key)
+        if cached is None or cached[0] is not time_series:
+            step_index = self._get_step_index(key, time_series)
+            steps = array("q", sorted(step for step in step_index if step is not None))
+            values = array(
+                self.values_typecode,
+                (math.nan if step_index[step] is None else step_index[step] for step in steps),
+            )
+            cached = (time_series, steps, values)
+            self._step_arrays[key] = cached
+        return cached[1], cached[2]
+
+    def _get_step_index(
+        self,
+        key: CacheKey,
+        time_series: ObjectTimeSeries,
+    ) -> Dict[int, Optional[float]]:
+        indexed = self._step_index.get(key)
+        if indexed is None or indexed[0] is not time_series:
+            indexed = (time_series, self._index_steps(time_series))
+            self._step_index[key] = indexed
+        return indexed[1]
 
-        for ts_value in time_series.time_series:
-            if ts_value.step == step:
-                return ts_value.value
-        return None
+    def _discard_index(self, key: CacheKey) -> None:
+        # 序列已不在 store 中时，丢弃为它建立的索引，避免残留引用整条旧序列
+        self._step_index.pop(key, None)
+        self._step_arrays.pop(key, None)
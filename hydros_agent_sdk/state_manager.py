@@ -98,7 +98,9 @@ class AgentStateManager:
         with self._lock:
             task_state = self._task_states.get(context.biz_scene_instance_id)
             is_active = task_state is not None and task_state.status == TaskStatus.ACTIVE
-        logger.debug(f"Context {context.biz_scene_instance_id} active: {is_active}")
+        # 每条入站指令的过滤都会经过这里，DEBUG 关闭时不构造日志参数
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Context %s active: %s", context.biz_scene_instance_id, is_active)
         return is_active
 
     def begin_task_initialization(self, context: SimulationContext):
@@ -5,10 +5,11 @@ SDK 消息投递的传输接口。
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Protocol
+from typing import Callable, Protocol, Union
 
 
-MessageHandler = Callable[[str, str], None]
+# payload 为收到的原始报文：MQTT 传输直接交出 bytes，不预先做 UTF-8 解码
+MessageHandler = Callable[[str, Union[str, bytes]], None]
 
 
 @dataclass(frozen=True)
@@ -35,6 +36,6 @@ class Transport(Protocol):
         """把处理器订阅到指定 topic。"""
         ...
 
-    def publish(self, topic: str, payload: str, qos: int = 1) -> None:
-        """向指定 topic 发布 payload。"""
+    def publish(self, topic: str, payload: Union[str, bytes], qos: int = 1) -> None:
+        """向指定 topic 发布 payload；二进制报文（如 MessagePack 指标）以 bytes 传入。"""
         ...
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import logging
 import socket
+from collections import deque
 from threading import Event
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import paho.mqtt.client as mqtt
 
@@ -28,12 +29,18 @@ class MqttCoordinationTransport:
         qos: int = 1,
         mqtt_username: Optional[str] = None,
         mqtt_password: Optional[str] = None,
+        publish_timeout_seconds: float = 10.0,
+        max_inflight_messages: int = 20,
     ) -> None:
         self.broker_url = broker_url.replace("tcp://", "")
         self.broker_port = broker_port
         self.client_id = client_id
         self.topic = topic
         self.qos = qos
+        self.publish_timeout_seconds = publish_timeout_seconds
+        if max_inflight_messages < 1:
+            raise ValueError(f"max_inflight_messages must be positive: {max_inflight_messages}")
+        self.max_inflight_messages = max_inflight_messages
         self._subscriptions: Dict[str, Tuple[MessageHandler, int]] = {}
         self.connected = Event()
         self._intentional_disconnect = False
@@ -46,6 +53,8 @@ class MqttCoordinationTransport:
         self.mqtt_client.on_disconnect = self._on_disconnect
         self.mqtt_client.on_message = self._on_message
         self.mqtt_client.reconnect_delay_set(min_delay=1, max_delay=120)
+        # 与 publish_many 的确认窗口一致，超出窗口的报文不会在 Paho 内部排队
+        self.mqtt_client.max_inflight_messages_set(max_inflight_messages)
         if mqtt_username:
             self.mqtt_client.username_pw_set(mqtt_username, mqtt_password)
         self.subscribe(topic, handler, qos=qos)
@@ -68,9 +77,57 @@ class MqttCoordinationTransport:
         finally:
             self.mqtt_client.disconnect()
 
-    def publish(self, topic: str, payload: str, qos: int = 1) -> None:
+    def publish(self, topic: str, payload: Union[str, bytes], qos: int = 1) -> None:
         result = self.mqtt_client.publish(topic, payload, qos=qos)
-        result.wait_for_publish()
+        error = self._await_publish(topic, result, qos)
+        if error is not None:
+            raise error
+
+    def publish_many(
+        self,
+        topic: str,
+        messages: Sequence[Tuple[Union[str, bytes], int]],
+    ) -> List[Optional[Exception]]:
+        """
+        以滑动确认窗口连续发布多条报文。
+
+        逐条 publish 时每条 QoS 1/2 报文都要等完确认往返才能发下一条；这里最多
+        保持 max_inflight_messages 条报文等待 broker 确认，窗口满时先等最早一条
+        确认再发下一条，吞吐由 1/RTT 提升到 窗口大小/RTT。
+        单条失败不影响其余报文，返回值与 messages 一一对应，成功为 None，
+        失败为对应异常，由调用方决定是否重试。
+        """
+        errors: List[Optional[Exception]] = [None] * len(messages)
+        inflight = deque()
+        for index, (payload, qos) in enumerate(messages):
+            if len(inflight) >= self.max_inflight_messages:
+                self._settle(topic, inflight.popleft(), errors)
+            try:
+                inflight.append((index, self.mqtt_client.publish(topic, payload, qos=qos), qos))
+            except Exception as error:
+                errors[index] = error
+        while inflight:
+            self._settle(topic, inflight.popleft(), errors)
+        return errors
+
+    def _settle(self, topic: str, inflight_entry, errors: List[Optional[Exception]]) -> None:
+        index, result, qos = inflight_entry
+        try:
+            errors[index] = self._await_publish(topic, result, qos)
+        except Exception as error:
+            errors[index] = error
+
+    def _await_publish(self, topic: str, result, qos: int) -> Optional[Exception]:
+        """等待一条报文发布完成，返回失败原因；成功返回 None。"""
+        if qos == 0:
+            # QoS 0 没有 broker 确认，入队成功即返回，由网络线程异步写出
+            return RuntimeError(f"MQTT publish failed: rc={result.rc}") if result.rc > 0 else None
+        result.wait_for_publish(timeout=self.publish_timeout_seconds)
+        if result.is_published():
+            return None
+        return TimeoutError(
+            f"MQTT publish not acknowledged within {self.publish_timeout_seconds}s: topic={topic}"
+        )
 
     def subscribe(self, topic: str, handler: MessageHandler, qos: int = 1) -> None:
         """在共享 Paho client 上登记 raw payload handler。"""
@@ -89,11 +146,22 @@ class MqttCoordinationTransport:
         if reason_code.value != 0:
             logger.error("Failed to connect to MQTT broker: rc=%s", reason_code.value)
             return
+        self._enable_tcp_nodelay()
         for topic, (_handler, qos) in self._subscriptions.items():
             self.mqtt_client.subscribe(topic, qos=qos)
         self.connected.set()
         logger.info("Coordination MQTT connected and subscribed: topic=%s", self.topic)
 
+    def _enable_tcp_nodelay(self) -> None:
+        """关闭 Nagle 算法，避免小的协调报文被延迟合并；每次重连后重新设置。"""
+        sock = self.mqtt_client.socket()
+        if sock is None or not hasattr(sock, "setsockopt"):
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as error:
+            logger.debug("Unable to enable TCP_NODELAY on MQTT socket: %s", error)
+
     def _on_disconnect(self, _client, _userdata, _disconnect_flags=None, reason_code=0, _properties=None) -> None:
         self.connected.clear()
         if reason_code.value == 0 or self._intentional_disconnect:
@@ -107,4 +175,5 @@ class MqttCoordinationTransport:
             logger.debug("Ignoring MQTT message without registered handler: topic=%s", message.topic)
             return
         handler, _qos = subscription
-        handler(message.topic, message.payload.decode("utf-8"))
+        # json.loads/orjson 直接接受 bytes，不在网络线程上为每条报文做一次 UTF-8 解码
+        handler(message.topic, message.payload)
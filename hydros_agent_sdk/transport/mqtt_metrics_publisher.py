@@ -2,14 +2,58 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+import logging
+import time
+from queue import Empty, Queue
+from threading import Event, Lock, Thread
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 
-from hydros_agent_sdk.runtime.env_settings import DEFAULT_METRICS_TOPIC, load_runtime_env_settings
-from hydros_agent_sdk.utils.mqtt_metrics import MqttMetrics, send_metrics_batch
+from hydros_agent_sdk.runtime.env_settings import (
+    DEFAULT_METRICS_TOPIC,
+    RuntimeEnvSettings,
+    load_runtime_env_settings,
+)
+from hydros_agent_sdk.utils.mqtt_metrics import (
+    DEFAULT_MAX_BATCH_BYTES,
+    METRICS_PAYLOAD_FORMATS,
+    MetricsColumns,
+    MqttMetrics,
+    _encode_metrics_columns,
+    _send_encoded_metrics,
+    load_msgpack,
+    send_metrics_array,
+    send_metrics_batch,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFERED_MSG_COUNT = 256
+DEFAULT_IDLE_FLUSH_TIMEOUT_MS = 50
+
+
+class _ColumnBatch(NamedTuple):
+    """writer 队列中的一批按列指标及其共享字段。"""
+    columns: MetricsColumns
+    shared_fields: Dict[str, Any]
 
 
 class MqttMetricsPublisher:
-    """封装指标上报的 MQTT topic 和 publish 细节。"""
+    """封装指标上报的 MQTT topic 和 publish 细节。
+
+    默认每条指标单独发布一条 MQTT 消息，与 Java 消费端保持一致；
+    batch_payloads=True 时每批指标合并为 JSON 数组报文，按 max_batch_bytes 拆分。
+    payload_format="msgpack" 时总是按数组报文发送，编码为更紧凑的 MessagePack，
+    仅适用于消费端支持 MessagePack 的部署（需安装 msgpack）。
+
+    write_and_flush=True（默认）时 publish_batch 在调用线程内同步发布；
+    为 False 时只做上下文校验后入队，由单个后台 writer 线程发布。writer 累计到
+    buffered_msg_count 条指标或空闲 idle_flush_timeout_ms 毫秒后刷出，
+    调用方通过 flush()/close() 保证已入队指标最终送达。
+
+    publish_columns 接受按列组织的 MetricsColumns，直接由列数据编码报文，
+    不为每条指标构造 MqttMetrics。
+    """
 
     def __init__(
         self,
@@ -18,16 +62,44 @@ class MqttMetricsPublisher:
         qos: int = 0,
         biz_scene_instance_id: Optional[str] = None,
         edge_node_code: Optional[str] = None,
+        batch_payloads: bool = False,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        write_and_flush: bool = True,
+        buffered_msg_count: int = DEFAULT_BUFFERED_MSG_COUNT,
+        idle_flush_timeout_ms: int = DEFAULT_IDLE_FLUSH_TIMEOUT_MS,
+        payload_format: str = "json",
     ):
         if transport is None:
             raise ValueError("transport is required")
         if not topic:
             raise ValueError("topic is required")
+        if max_batch_bytes <= 0:
+            raise ValueError("max_batch_bytes must be positive")
+        if buffered_msg_count <= 0:
+            raise ValueError("buffered_msg_count must be positive")
+        if idle_flush_timeout_ms <= 0:
+            raise ValueError("idle_flush_timeout_ms must be positive")
+        if payload_format not in METRICS_PAYLOAD_FORMATS:
+            raise ValueError(f"unsupported metrics payload format: {payload_format}")
+        if payload_format == "msgpack":
+            # 构造时即校验可选依赖，避免首次发布时才失败
+            load_msgpack()
         self.transport = transport
         self.topic = topic
         self.qos = qos
         self.biz_scene_instance_id = biz_scene_instance_id
         self.edge_node_code = edge_node_code
+        self.payload_format = payload_format
+        self.batch_payloads = batch_payloads or payload_format == "msgpack"
+        self.max_batch_bytes = max_batch_bytes
+        self.write_and_flush = write_and_flush
+        self.buffered_msg_count = buffered_msg_count
+        self.idle_flush_timeout_ms = idle_flush_timeout_ms
+        # 每个 writer 线程独占一个队列；_writer_lock 保护 writer 的启停和入队，
+        # close 放入停止信号后不会再有指标排到它后面
+        self._queue: Queue[Union[List[MqttMetrics], _ColumnBatch, Event, None]] = Queue()
+        self._writer: Optional[Thread] = None
+        self._writer_lock = Lock()
 
     @classmethod
     def from_coordination_client(
@@ -38,12 +110,26 @@ class MqttMetricsPublisher:
         biz_scene_instance_id: Optional[str] = None,
         cluster_id: Optional[str] = None,
         edge_node_code: Optional[str] = None,
+        batch_payloads: Optional[bool] = None,
+        write_and_flush: Optional[bool] = None,
+        payload_format: Optional[str] = None,
     ) -> "MqttMetricsPublisher":
+        # 运行时设置要读取环境变量并查找 env.properties，每个智能体构造时只加载一次
+        settings = None
+        if batch_payloads is None or write_and_flush is None or payload_format is None:
+            settings = load_runtime_env_settings()
+            if batch_payloads is None:
+                batch_payloads = settings.metrics_batch_payloads
+            if write_and_flush is None:
+                write_and_flush = settings.metrics_write_and_flush
+            if payload_format is None:
+                payload_format = settings.metrics_payload_format
         resolved_cluster_id = cluster_id or cls._resolve_cluster_id(coordination_client)
         topic = metrics_topic or cls.default_metrics_topic(
             coordination_client.topic,
             biz_scene_instance_id=biz_scene_instance_id,
             cluster_id=resolved_cluster_id,
+            settings=settings,
         )
         return cls(
             transport=coordination_client.transport,
@@ -51,6 +137,9 @@ class MqttMetricsPublisher:
             qos=qos,
             biz_scene_instance_id=biz_scene_instance_id,
             edge_node_code=edge_node_code,
+            batch_payloads=batch_payloads,
+            write_and_flush=write_and_flush,
+            payload_format=payload_format,
         )
 
     @staticmethod
@@ -58,9 +147,11 @@ class MqttMetricsPublisher:
         coordination_topic: str,
         biz_scene_instance_id: Optional[str] = None,
         cluster_id: Optional[str] = None,
+        settings: Optional[RuntimeEnvSettings] = None,
     ) -> str:
         if biz_scene_instance_id:
-            settings = load_runtime_env_settings()
+            if settings is None:
+                settings = load_runtime_env_settings()
             base_topic = settings.render_topic(
                 settings.metrics_topic or DEFAULT_METRICS_TOPIC,
                 cluster_id=cluster_id,
@@ -70,7 +161,158 @@ class MqttMetricsPublisher:
         return f"{coordination_topic}/metrics"
 
     def publish_batch(self, metrics_list: List[MqttMetrics]) -> int:
+        """发布一批指标；异步模式下返回入队条数。"""
         normalized_metrics = [self._with_context(metrics) for metrics in metrics_list]
+        if self.write_and_flush:
+            return self._send(normalized_metrics)
+        if normalized_metrics:
+            self._enqueue(normalized_metrics)
+        return len(normalized_metrics)
+
+    def publish_columns(
+        self,
+        columns: MetricsColumns,
+        step_index: Optional[int] = None,
+        source_id: Optional[str] = None,
+        source_timestamp_ms: Optional[int] = None,
+        biz_scene_instance_id: Optional[str] = None,
+    ) -> int:
+        """
+        发布一批按列组织的同一步指标；异步模式下返回入队条数。
+
+        biz_scene_instance_id 为指标所属任务，与逐条发布时 MqttMetrics 上的任务 ID
+        做同样的一致性校验，未提供时取发布器上下文；edge_node_code 取自发布器。
+        """
+        size = len(columns.object_ids)
+        if not (len(columns.object_names) == len(columns.metrics_codes) == len(columns.values) == size):
+            raise ValueError("metrics columns must have the same length")
+        context_id = self._resolve_context_id(biz_scene_instance_id, None)
+        if size == 0:
+            return 0
+        batch = _ColumnBatch(
+            columns,
+            {
+                "source_id": source_id,
+                "biz_scene_instance_id": context_id,
+                "job_instance_id": context_id,
+                "edge_node_code": self.edge_node_code,
+                "step_index": step_index,
+                "source_timestamp_ms": (
+                    source_timestamp_ms if source_timestamp_ms is not None else int(time.time() * 1000)
+                ),
+            },
+        )
+        if self.write_and_flush:
+            return self._send_columns(batch)
+        self._enqueue(batch)
+        return size
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """等待此前入队的指标全部发布完成；同步模式下直接返回 True。"""
+        with self._writer_lock:
+            if self._writer is None:
+                return True
+            done = Event()
+            self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        刷出已入队指标并停止 writer 线程，之后仍可再次发布。
+
+        writer 在锁内摘下后才放入停止信号，此后的发布会启动新的 writer 和队列；
+        超时返回 False 时旧 writer 仍会在后台把剩余指标发完。
+        """
+        with self._writer_lock:
+            writer = self._writer
+            if writer is None:
+                return True
+            self._writer = None
+            self._queue.put(None)
+        writer.join(timeout)
+        return not writer.is_alive()
+
+    def _enqueue(self, item: Union[List[MqttMetrics], _ColumnBatch]) -> None:
+        """按需启动 writer 并入队；与 close 在同一把锁内，指标不会排到停止信号之后。"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._queue = Queue()
+                self._writer = Thread(
+                    target=self._run_writer,
+                    args=(self._queue,),
+                    daemon=True,
+                    name="MqttMetricsWriter",
+                )
+                self._writer.start()
+            self._queue.put(item)
+
+    def _run_writer(self, queue: Queue[Union[List[MqttMetrics], _ColumnBatch, Event, None]]) -> None:
+        idle_timeout = self.idle_flush_timeout_ms / 1000.0
+        pending: List[Union[List[MqttMetrics], _ColumnBatch]] = []
+        pending_count = 0
+        while True:
+            try:
+                item = queue.get(timeout=idle_timeout if pending else None)
+            except Empty:
+                # 空闲超时：刷出已累计的指标
+                self._drain_pending(pending)
+                pending_count = 0
+                continue
+            if isinstance(item, _ColumnBatch):
+                pending.append(item)
+                pending_count += len(item.columns.object_ids)
+            elif isinstance(item, list):
+                pending.append(item)
+                pending_count += len(item)
+            else:
+                self._drain_pending(pending)
+                pending_count = 0
+                if item is None:
+                    return
+                item.set()
+                continue
+            if pending_count >= self.buffered_msg_count:
+                self._drain_pending(pending)
+                pending_count = 0
+
+    def _drain_pending(self, pending: List[Union[List[MqttMetrics], _ColumnBatch]]) -> None:
+        if not pending:
+            return
+        metrics_list: List[MqttMetrics] = []
+        try:
+            for batch in pending:
+                if isinstance(batch, _ColumnBatch):
+                    self._send_columns(batch)
+                else:
+                    metrics_list.extend(batch)
+            if metrics_list:
+                self._send(metrics_list)
+        except Exception:
+            logger.error("Error publishing buffered metrics to %s", self.topic, exc_info=True)
+        finally:
+            pending.clear()
+
+    def _send_columns(self, batch: _ColumnBatch) -> int:
+        return _send_encoded_metrics(
+            transport=self.transport,
+            topic=self.topic,
+            items=_encode_metrics_columns(batch.columns, batch.shared_fields, self.payload_format),
+            qos=self.qos,
+            batch_payloads=self.batch_payloads,
+            max_batch_bytes=self.max_batch_bytes,
+            payload_format=self.payload_format,
+        )
+
+    def _send(self, normalized_metrics: List[MqttMetrics]) -> int:
+        if self.batch_payloads:
+            return send_metrics_array(
+                transport=self.transport,
+                topic=self.topic,
+                metrics_list=normalized_metrics,
+                qos=self.qos,
+                max_batch_bytes=self.max_batch_bytes,
+                payload_format=self.payload_format,
+            )
         return send_metrics_batch(
             transport=self.transport,
             topic=self.topic,
@@ -78,13 +320,18 @@ class MqttMetricsPublisher:
             qos=self.qos,
         )
 
-    def _with_context(self, metrics: MqttMetrics) -> MqttMetrics:
-        metric_context_id = metrics.biz_scene_instance_id or metrics.job_instance_id
-        if metrics.biz_scene_instance_id and metrics.job_instance_id:
-            if metrics.biz_scene_instance_id != metrics.job_instance_id:
+    def _resolve_context_id(
+        self,
+        biz_scene_instance_id: Optional[str],
+        job_instance_id: Optional[str],
+    ) -> Optional[str]:
+        """校验指标的任务 ID 与自身及发布器上下文一致，返回最终使用的任务 ID。"""
+        metric_context_id = biz_scene_instance_id or job_instance_id
+        if biz_scene_instance_id and job_instance_id:
+            if biz_scene_instance_id != job_instance_id:
                 raise ValueError(
                     "metrics biz_scene_instance_id and job_instance_id must match: "
-                    f"{metrics.biz_scene_instance_id} != {metrics.job_instance_id}"
+                    f"{biz_scene_instance_id} != {job_instance_id}"
                 )
         if self.biz_scene_instance_id and metric_context_id:
             if metric_context_id != self.biz_scene_instance_id:
@@ -92,8 +339,10 @@ class MqttMetricsPublisher:
                     "metrics context does not match publisher context: "
                     f"{metric_context_id} != {self.biz_scene_instance_id}"
                 )
+        return metric_context_id or self.biz_scene_instance_id
 
-        context_id = metric_context_id or self.biz_scene_instance_id
+    def _with_context(self, metrics: MqttMetrics) -> MqttMetrics:
+        context_id = self._resolve_context_id(metrics.biz_scene_instance_id, metrics.job_instance_id)
         updates = {}
         if context_id:
             if metrics.biz_scene_instance_id != context_id:
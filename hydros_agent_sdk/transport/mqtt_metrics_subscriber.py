@@ -1,10 +1,10 @@
 """现地指标的 MQTT 订阅辅助对象。"""
 
-import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from hydros_agent_sdk.field_metrics_cache import FieldMetricsCache
+from hydros_agent_sdk.utils.json_codec import loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +21,9 @@ class MqttMetricsSubscriber:
         self.subscription_topic = metrics_topic
         self.transport.subscribe(metrics_topic, self._handle_transport_payload)
 
-    def _handle_transport_payload(self, topic: str, payload_str: str) -> None:
+    def _handle_transport_payload(self, topic: str, raw_payload: Union[str, bytes]) -> None:
         try:
-            payload = json.loads(payload_str)
+            payload = loads_json(raw_payload)
             self.handle_payload(topic, payload)
         except Exception as exc:
             logger.error("Error parsing field metrics payload on %s: %s", topic, exc)
@@ -31,13 +31,23 @@ class MqttMetricsSubscriber:
     def handle_message(self, msg) -> Optional[str]:
         """处理 Paho 风格的消息，供单元测试直接调用。"""
         try:
-            payload = json.loads(msg.payload.decode("utf-8"))
+            payload = loads_json(msg.payload)
             return self.handle_payload(msg.topic, payload)
         except Exception as exc:
             logger.error("Error parsing field metrics payload on %s: %s", msg.topic, exc)
             return None
 
-    def handle_payload(self, topic: str, payload: Dict[str, Any]) -> Optional[str]:
+    def handle_payload(
+        self,
+        topic: str,
+        payload: Union[Dict[str, Any], List[Dict[str, Any]]],
+    ) -> Optional[str]:
+        if isinstance(payload, list):
+            # 批量报文：逐条写入缓存，返回最后一条的缓存键。
+            cache_key = None
+            for item in payload:
+                cache_key = self.handle_payload(topic, item) or cache_key
+            return cache_key
         try:
             return self.metrics_data_cache.update(payload)
         except Exception as exc:
@@ -5,6 +5,7 @@ Hydros Agent SDK 工具模块。
 from .hydro_object_utils import (
     HydroObjectUtilsV2,
     WaterwayTopology,
+    TopologyAdjacency,
     TopHydroObject,
     SimpleChildObject,
     HydroObjectType,
@@ -26,8 +27,10 @@ from .id_generator import (
 )
 from .mqtt_metrics import (
     MqttMetrics,
+    MetricsColumns,
     send_metrics,
     send_metrics_batch,
+    send_metrics_array,
     create_mock_metrics,
 )
 from .property_parse_utils import PropertyParseUtils
@@ -36,6 +39,7 @@ from .yaml_loader import YamlLoader
 __all__ = [
     'HydroObjectUtilsV2',
     'WaterwayTopology',
+    'TopologyAdjacency',
     'TopHydroObject',
     'SimpleChildObject',
     'HydroObjectType',
@@ -53,8 +57,10 @@ __all__ = [
     'generate_sse_session_id',
     'generate_user_id',
     'MqttMetrics',
+    'MetricsColumns',
     'send_metrics',
     'send_metrics_batch',
+    'send_metrics_array',
     'create_mock_metrics',
     'PropertyParseUtils',
     'YamlLoader',
@@ -5,19 +5,29 @@ Hydros SDK 通用 ID 生成器。
 from __future__ import annotations
 
 import string
-from datetime import datetime
 from enum import Enum
-from secrets import choice
+from os import urandom
+from time import strftime
 from typing import Any
 
+_ALPHABET = (string.ascii_uppercase + string.digits).encode("ascii")
+# 随机字节到字母表的映射：252 = 36 * 7，0..251 取模后均匀落在 36 个字符上，
+# 252..255 直接丢弃（拒绝采样），避免取模偏差
+_BYTE_TO_ALPHABET = bytes(_ALPHABET[byte % len(_ALPHABET)] for byte in range(256))
+_REJECTED_BYTES = bytes(range(256 - 256 % len(_ALPHABET), 256))
+
 
 def _timestamp_str() -> str:
-    return datetime.now().strftime("%Y%m%d%H%M")
+    # time.strftime 直接格式化本地时间，不构造 datetime 对象
+    return strftime("%Y%m%d%H%M")
 
 
 def _random_alphanumeric(length: int) -> str:
-    alphabet = string.ascii_uppercase + string.digits
-    return "".join(choice(alphabet) for _ in range(length))
+    # 一次系统调用取一批安全随机字节，在 C 层完成映射和拒绝采样
+    result = b""
+    while len(result) < length:
+        result += urandom(length + 4).translate(_BYTE_TO_ALPHABET, _REJECTED_BYTES)
+    return result[:length].decode("ascii")
 
 
 def generate_agent_instance_id(agent_code: str) -> str:
@@ -0,0 +1,25 @@
+"""
+入站 MQTT 报文的 JSON 解码。
+
+安装可选依赖 orjson（pip install 'hydros-agent-sdk[orjson]'）时使用 orjson 解码，
+否则使用标准库 json。orjson 不接受 NaN/Infinity 字面量和超出 64 位的整数，
+遇到这类报文时回退到标准库，解码结果与标准库保持一致。
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖
+    orjson = None
+
+
+def loads_json(payload: Union[str, bytes]) -> Any:
+    """把 JSON 报文解码为 Python 对象。"""
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(payload)
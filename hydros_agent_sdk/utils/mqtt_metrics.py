@@ -5,13 +5,41 @@
 com.hydros.edge.agent.channel.etl.model.MqttMetrics 保持匹配。
 """
 
+import math
 import time
 import logging
-from typing import Optional, List
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
 from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic_core import to_json
 
 logger = logging.getLogger(__name__)
 
+# 单条 MQTT 批量指标报文的默认上限，超出后拆分为多条 PUBLISH。
+DEFAULT_MAX_BATCH_BYTES = 64 * 1024
+
+# 批量指标报文支持的编码格式；msgpack 需要安装可选依赖 msgpack。
+METRICS_PAYLOAD_FORMATS = ("json", "msgpack")
+
+
+def load_msgpack():
+    """导入可选依赖 msgpack，缺失时给出安装提示。"""
+    try:
+        import msgpack
+    except ImportError as exc:
+        raise ImportError(
+            "payload_format='msgpack' requires the msgpack package: "
+            "pip install 'hydros-agent-sdk[msgpack]'"
+        ) from exc
+    return msgpack
+
+
+def _msgpack_array_header(size: int) -> bytes:
+    if size < 16:
+        return bytes((0x90 | size,))
+    if size < 0x10000:
+        return b"\xdc" + size.to_bytes(2, "big")
+    return b"\xdd" + size.to_bytes(4, "big")
+
 
 class MqttMetrics(BaseModel):
     """
@@ -94,12 +122,18 @@ def send_metrics(
         payload = metrics.model_dump_json(exclude_none=True)
 
         transport.publish(topic, payload, qos=qos)
-        logger.debug(f"Sent metrics: {metrics.metrics_code}={metrics.value} "
-                    f"for object {metrics.object_name} (step {metrics.step_index})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sent metrics: %s=%s for object %s (step %s)",
+                metrics.metrics_code,
+                metrics.value,
+                metrics.object_name,
+                metrics.step_index,
+            )
         return True
 
     except Exception as e:
-        logger.error(f"Error sending metrics: {e}", exc_info=True)
+        logger.error("Error sending metrics: %s", e, exc_info=True)
         return False
 
 
@@ -127,7 +161,248 @@ def send_metrics_batch(
         if send_metrics(transport, topic, metrics, qos):
             success_count += 1
 
-    logger.info(f"Sent {success_count}/{len(metrics_list)} metrics messages")
+    logger.info("Sent %s/%s metrics messages", success_count, len(metrics_list))
+    return success_count
+
+
+def send_metrics_array(
+    transport,
+    topic: str,
+    metrics_list: List[MqttMetrics],
+    qos: int = 0,
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    payload_format: str = "json",
+) -> int:
+    """
+    把多条指标合并为数组报文发送，减少 MQTT PUBLISH 次数。
+
+    超过 max_batch_bytes 的批次会按条拆分为多个数组报文；单条指标本身超限时
+    仍单独成包发送。payload_format="msgpack" 时报文为 MessagePack 数组（bytes），
+    通常比 JSON 小 30%～50%，消费端必须支持 MessagePack 解码。
+
+    Args:
+        transport: 提供 publish 的传输对象
+        topic: 要发布到的 MQTT topic
+        metrics_list: 要发送的 MqttMetrics 对象列表
+        qos: 服务质量等级（0、1 或 2）
+        max_batch_bytes: 单个数组报文的字节上限
+        payload_format: 报文编码格式，"json" 或 "msgpack"
+
+    Returns:
+        成功发送的指标条数
+    """
+    _validate_array_options(max_batch_bytes, payload_format)
+
+    if payload_format == "msgpack":
+        packb = load_msgpack().packb
+        items = (packb(metrics.model_dump(exclude_none=True)) for metrics in metrics_list)
+    else:
+        items = (metrics.model_dump_json(exclude_none=True) for metrics in metrics_list)
+
+    success_count = _publish_encoded_arrays(transport, topic, items, qos, max_batch_bytes, payload_format)
+    logger.info("Sent %s/%s metrics in batched payloads", success_count, len(metrics_list))
+    return success_count
+
+
+def _validate_array_options(max_batch_bytes: int, payload_format: str) -> None:
+    if max_batch_bytes <= 0:
+        raise ValueError("max_batch_bytes must be positive")
+    if payload_format not in METRICS_PAYLOAD_FORMATS:
+        raise ValueError(f"unsupported metrics payload format: {payload_format}")
+
+
+def _publish_encoded_arrays(
+    transport,
+    topic: str,
+    items: Iterable[Union[str, bytes]],
+    qos: int,
+    max_batch_bytes: int,
+    payload_format: str,
+) -> int:
+    """把已编码的单条指标按字节上限拼成数组报文发布，返回成功发送的条数。"""
+    if payload_format == "msgpack":
+        def encode_chunk(chunk_items):
+            return _msgpack_array_header(len(chunk_items)) + b"".join(chunk_items)
+
+        def item_size(item):
+            return len(item)
+
+        # 数组头最长 5 字节，元素之间无分隔符
+        header_bytes, separator_bytes = 5, 0
+    else:
+        def encode_chunk(chunk_items):
+            return "[" + ",".join(chunk_items) + "]"
+
+        def item_size(item):
+            return len(item.encode("utf-8"))
+
+        header_bytes, separator_bytes = 2, 1
+
+    success_count = 0
+    chunk = []
+    chunk_bytes = header_bytes
+
+    def flush() -> int:
+        try:
+            transport.publish(topic, encode_chunk(chunk), qos=qos)
+            return len(chunk)
+        except Exception as e:
+            logger.error("Error sending metrics batch: %s", e, exc_info=True)
+            return 0
+
+    for item in items:
+        item_bytes = item_size(item) + separator_bytes
+        if chunk and chunk_bytes + item_bytes > max_batch_bytes:
+            success_count += flush()
+            chunk = []
+            chunk_bytes = header_bytes
+        chunk.append(item)
+        chunk_bytes += item_bytes
+
+    if chunk:
+        success_count += flush()
+    return success_count
+
+
+class MetricsColumns(NamedTuple):
+    """
+    按列组织的一批同一步指标。
+
+    四列等长，第 i 条指标由各列第 i 个元素组成；列可以是 list、tuple 或
+    numpy 数组。on_tick_simulation 返回该对象时，SDK 直接按列编码报文，
+    不再为每条指标构造 MqttMetrics。values 中的 None 会被省略，NaN/Inf 编码为 null。
+    """
+    object_ids: Sequence[int]
+    object_names: Sequence[Optional[str]]
+    metrics_codes: Sequence[str]
+    values: Sequence[Optional[float]]
+
+
+# 与 MqttMetrics 字段顺序一致：object_id 之前的共享字段、object_name 之后的共享字段
+_COLUMN_HEAD_FIELDS = ("source_id", "biz_scene_instance_id", "job_instance_id", "edge_node_code")
+_COLUMN_MIDDLE_FIELDS = ("step_index", "source_timestamp_ms")
+
+
+def _as_list(column: Sequence[Any]) -> List[Any]:
+    # numpy 数组一次性转换为 Python 标量列表，避免逐元素访问 numpy 标量
+    tolist = getattr(column, "tolist", None)
+    return tolist() if tolist is not None else list(column)
+
+
+def _encode_metrics_columns(
+    columns: MetricsColumns,
+    shared_fields: Dict[str, Any],
+    payload_format: str = "json",
+) -> List[Union[str, bytes]]:
+    """
+    把按列组织的指标编码为逐条报文。
+
+    JSON 编码结果与 MqttMetrics(...).model_dump_json(exclude_none=True) 逐字节一致：
+    字段值经 pydantic_core.to_json 编码，浮点数格式与 pydantic 相同（如 1e-7、0.00001），
+    而不是 Python repr 的 1e-07、1e-05。
+
+    Args:
+        columns: 按列组织的指标
+        shared_fields: 各条指标共享的字段，支持 source_id、biz_scene_instance_id、
+            job_instance_id、edge_node_code、step_index、source_timestamp_ms、position_code
+        payload_format: "json" 或 "msgpack"
+
+    Returns:
+        每条指标编码后的 str（JSON）或 bytes（MessagePack）
+    """
+    object_ids = _as_list(columns.object_ids)
+    object_names = _as_list(columns.object_names)
+    metrics_codes = _as_list(columns.metrics_codes)
+    values = _as_list(columns.values)
+    size = len(object_ids)
+    if not (len(object_names) == len(metrics_codes) == len(values) == size):
+        raise ValueError("metrics columns must have the same length")
+
+    shared = dict(shared_fields)
+    shared.setdefault("source_timestamp_ms", int(time.time() * 1000))
+    position_code = shared.pop("position_code", None) or "none"
+
+    if payload_format == "msgpack":
+        packb = load_msgpack().packb
+        head = {key: shared[key] for key in _COLUMN_HEAD_FIELDS if shared.get(key) is not None}
+        middle = {key: shared[key] for key in _COLUMN_MIDDLE_FIELDS if shared.get(key) is not None}
+        encoded = []
+        for object_id, object_name, metrics_code, value in zip(object_ids, object_names, metrics_codes, values):
+            row = dict(head)
+            row["object_id"] = object_id
+            if object_name is not None:
+                row["object_name"] = object_name
+            row.update(middle)
+            row["metrics_code"] = metrics_code
+            row["position_code"] = position_code
+            if value is not None:
+                row["value"] = value if math.isfinite(value) else None
+            encoded.append(packb(row))
+        return encoded
+
+    def dumps(value: Any) -> str:
+        return to_json(value).decode()
+
+    head = "{" + "".join(
+        f'"{key}":{dumps(shared[key])},' for key in _COLUMN_HEAD_FIELDS if shared.get(key) is not None
+    )
+    middle = "".join(
+        f',"{key}":{dumps(shared[key])}' for key in _COLUMN_MIDDLE_FIELDS if shared.get(key) is not None
+    )
+    position = f',"position_code":{dumps(position_code)}'
+    # 对象名和指标编码在各步之间大量重复，编码结果按值缓存
+    name_cache: Dict[Optional[str], str] = {None: ""}
+    code_cache: Dict[str, str] = {}
+
+    encoded = []
+    for object_id, object_name, metrics_code, value in zip(object_ids, object_names, metrics_codes, values):
+        name_part = name_cache.get(object_name)
+        if name_part is None:
+            name_part = name_cache[object_name] = f',"object_name":{dumps(object_name)}'
+        code_part = code_cache.get(metrics_code)
+        if code_part is None:
+            code_part = code_cache[metrics_code] = f',"metrics_code":{dumps(metrics_code)}'
+        if value is None:
+            value_part = ""
+        elif math.isfinite(value):
+            value_part = f',"value":{dumps(float(value))}'
+        else:
+            value_part = ',"value":null'
+        encoded.append(f'{head}"object_id":{int(object_id)}{name_part}{middle}{code_part}{position}{value_part}}}')
+    return encoded
+
+
+def _send_encoded_metrics(
+    transport,
+    topic: str,
+    items: List[Union[str, bytes]],
+    qos: int = 0,
+    batch_payloads: bool = False,
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    payload_format: str = "json",
+) -> int:
+    """
+    发布已编码的单条指标报文。
+
+    batch_payloads=False 且为 JSON 时逐条发布，否则按 max_batch_bytes 拼成数组报文。
+
+    Returns:
+        成功发送的指标条数
+    """
+    _validate_array_options(max_batch_bytes, payload_format)
+    if batch_payloads or payload_format == "msgpack":
+        success_count = _publish_encoded_arrays(transport, topic, items, qos, max_batch_bytes, payload_format)
+        logger.info("Sent %s/%s metrics in batched payloads", success_count, len(items))
+        return success_count
+
+    success_count = 0
+    for item in items:
+        try:
+            transport.publish(topic, item, qos=qos)
+            success_count += 1
+        except Exception as e:
+            logger.error("Error sending metrics: %s", e, exc_info=True)
+    logger.info("Sent %s/%s metrics messages", success_count, len(items))
     return success_count
 
 
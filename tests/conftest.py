@@ -9,9 +9,14 @@ if "paho.mqtt.client" not in sys.modules:
     reasoncodes_module = types.ModuleType("paho.mqtt.reasoncodes")
 
     class FakePublishResult:
-        def wait_for_publish(self):
+        rc = 0
+
+        def wait_for_publish(self, timeout=None):
             return None
 
+        def is_published(self):
+            return True
+
     class FakeMqttClient:
         def __init__(self, *args, **kwargs):
             self.published = []
@@ -23,6 +28,9 @@ if "paho.mqtt.client" not in sys.modules:
         def reconnect_delay_set(self, *args, **kwargs):
             return None
 
+        def max_inflight_messages_set(self, *args, **kwargs):
+            return None
+
         def username_pw_set(self, *args, **kwargs):
             return None
 
@@ -38,6 +46,9 @@ if "paho.mqtt.client" not in sys.modules:
         def disconnect(self):
             return None
 
+        def socket(self):
+            return None
+
         def subscribe(self, topic, qos=0):
             self.subscriptions.append((topic, qos))
             return (0, 1)
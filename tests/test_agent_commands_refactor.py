@@ -8,7 +8,12 @@ from unittest.mock import Mock, patch
 
 from pydantic import ValidationError
 
-from hydros_agent_sdk.config_loader import get_default_env_config_path, load_env_config
+from hydros_agent_sdk.config_loader import (
+    clear_env_config_cache,
+    get_default_env_config_path,
+    load_env_config,
+    load_properties_file,
+)
 from hydros_agent_sdk.agent_properties import AgentProperties
 from hydros_agent_sdk.agent_commands.runtime.handlers import AgentCommandHandler
 from hydros_agent_sdk.agent_commands.runtime.runtime import AgentCommandRuntime
@@ -1402,6 +1407,58 @@ class AgentCommandsRefactorTest(unittest.TestCase):
         )
         self.assertEqual(load_env_config()["mpc_request_timeout_seconds"], "180")
 
+    def test_load_env_config_reuses_parsed_file_until_it_changes(self):
+        env_path = os.path.join(self._temp_dir.name, "env.properties")
+        lines = [
+            "mqtt_broker_url=tcp://127.0.0.1",
+            "mqtt_broker_port=1883",
+            "hydros_cluster_id=test-cluster",
+            "hydros_node_id=test-node",
+        ]
+        with open(env_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+        clear_env_config_cache()
+
+        with patch(
+            "hydros_agent_sdk.config_loader.load_properties_file",
+            wraps=load_properties_file,
+        ) as load_properties:
+            first = load_env_config()
+            first["hydros_node_id"] = "mutated"
+            second = load_env_config()
+            self.assertEqual(load_properties.call_count, 1)
+            self.assertEqual(second["hydros_node_id"], "test-node")
+
+            with open(env_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines + ["metrics_topic=/custom/metrics"]))
+            third = load_env_config()
+
+        self.assertEqual(load_properties.call_count, 2)
+        self.assertEqual(third["metrics_topic"], "/custom/metrics")
+
+    def test_load_properties_file_parses_flat_key_values(self):
+        path = os.path.join(self._temp_dir.name, "agent.properties")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                "# comment=ignored\n"
+                "; also ignored\n"
+                "\n"
+                "Agent_Code = PUMP_AGENT\n"
+                "agent_name: Pump Agent\n"
+                "empty_value=\n"
+                "url=tcp://127.0.0.1:1883\n"
+            )
+
+        self.assertEqual(
+            load_properties_file(path),
+            {"agent_code": "PUMP_AGENT", "agent_name": "Pump Agent", "url": "tcp://127.0.0.1:1883"},
+        )
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("agent_code=OTHER\n")
+        with self.assertRaises(RuntimeError):
+            load_properties_file(path)
+
     def test_system_central_factory_passes_mpc_config_from_env_config(self):
         from hydros_agent_sdk.factory import SystemCentralSchedulingAgentFactory
 
@@ -2793,7 +2850,7 @@ class AgentCommandsRefactorTest(unittest.TestCase):
             ],
         )
 
-        with self.assertLogs("hydros_agent_sdk.runtime.coordination_outbox", level="INFO") as logs:
+        with self.assertLogs("hydros_agent_sdk.runtime.coordination_outbox", level="DEBUG") as logs:
             client.enqueue(report)
 
         log_output = "\n".join(logs.output)
@@ -2806,12 +2863,8 @@ class AgentCommandsRefactorTest(unittest.TestCase):
         self.assertNotIn('"object_id":503', log_output)
 
     def test_central_scheduling_agent_generates_java_style_command_id(self):
-        with patch("hydros_agent_sdk.utils.id_generator.datetime") as mock_datetime, \
-             patch("hydros_agent_sdk.utils.id_generator.choice", return_value="A"):
-            mock_now = Mock()
-            mock_now.strftime.return_value = "202601011230"
-            mock_datetime.now.return_value = mock_now
-
+        with patch("hydros_agent_sdk.utils.id_generator.strftime", return_value="202601011230"), \
+             patch("hydros_agent_sdk.utils.id_generator.urandom", side_effect=bytes):
             command_id = generate_agent_command_id()
 
         self.assertEqual(command_id, "AGTCMD202601011230AAAAAAAAAAAA")
@@ -2,6 +2,7 @@ import unittest
 import os
 import sys
 from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
 
 sys.path.insert(0, os.path.dirname(__file__))
 import conftest  # noqa: F401
@@ -62,6 +63,111 @@ properties:
         )
         self.assertEqual(config.agent_code, "CENTRAL_SCHEDULING_AGENT")
 
+    def test_from_url_reuses_cached_config_when_not_modified(self):
+        AgentConfigLoader.clear_cache()
+        self.addCleanup(AgentConfigLoader.clear_cache)
+        response = MagicMock()
+        response.read.return_value = b"""
+agent_code: CENTRAL_SCHEDULING_AGENT
+agent_type: CENTRAL_SCHEDULING_AGENT
+agent_name: Central Scheduling Agent
+properties:
+  driven_by_coordinator: true
+"""
+        response.headers = {"ETag": '"v1"'}
+        response.__enter__.return_value = response
+        response.__exit__.return_value = False
+        url = "https://s3.hydroos.pub/agents/agent_config.yaml"
+        not_modified = HTTPError(url, 304, "Not Modified", {}, None)
+
+        with patch("hydros_agent_sdk.agent_config.urlopen", side_effect=[response, not_modified]) as mocked_urlopen:
+            first = AgentConfigLoader.from_url(url)
+            second = AgentConfigLoader.from_url(url)
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second, first)
+        self.assertEqual(mocked_urlopen.call_args.args[0].get_header("If-none-match"), '"v1"')
+        self.assertEqual(second.merged_properties(), {"driven_by_coordinator": True})
+
+    def test_from_url_results_do_not_share_state_with_cache(self):
+        AgentConfigLoader.clear_cache()
+        self.addCleanup(AgentConfigLoader.clear_cache)
+        response = MagicMock()
+        response.read.return_value = b"""
+agent_code: CENTRAL_SCHEDULING_AGENT
+agent_type: CENTRAL_SCHEDULING_AGENT
+agent_name: Central Scheduling Agent
+properties:
+  driven_by_coordinator: true
+  targets: [a]
+"""
+        response.headers = {"ETag": '"v1"'}
+        response.__enter__.return_value = response
+        response.__exit__.return_value = False
+        url = "https://s3.hydroos.pub/agents/agent_config.yaml"
+        not_modified = [HTTPError(url, 304, "Not Modified", {}, None) for _ in range(2)]
+
+        with patch("hydros_agent_sdk.agent_config.urlopen", side_effect=[response, *not_modified]):
+            first = AgentConfigLoader.from_url(url)
+            first.agent_name = "changed"
+            first.merged_properties()["targets"].append("b")
+            second = AgentConfigLoader.from_url(url)
+            second.properties.driven_by_coordinator = False
+            third = AgentConfigLoader.from_url(url)
+
+        self.assertEqual(third.agent_name, "Central Scheduling Agent")
+        self.assertEqual(third.merged_properties(), {"driven_by_coordinator": True, "targets": ["a"]})
+
+    def test_merged_properties_interns_keys_and_applies_components_in_order(self):
+        config = AgentConfigLoader.from_dict({
+            "agent_code": "PUMP",
+            "agent_type": "PUMP",
+            "agent_name": "Pump",
+            "properties": {"step_resolution": 60, "custom_key": "top"},
+            "components": [
+                {"enabled": True, "properties": {"custom_key": "component"}},
+                {"enabled": False, "properties": {"custom_key": "disabled"}},
+            ],
+        })
+
+        merged = config.merged_properties()
+
+        self.assertEqual(merged["custom_key"], "component")
+        self.assertEqual(merged["step_resolution"], 60)
+        self.assertTrue(all(key is sys.intern(key) for key in merged))
+
+    def test_merged_properties_matches_model_dump_without_none_values(self):
+        config = AgentConfigLoader.from_dict({
+            "agent_code": "PUMP",
+            "agent_type": "PUMP",
+            "agent_name": "Pump",
+            "properties": {
+                "driven_by_coordinator": False,
+                "custom_none": None,
+                "nested": {"inner": None, "values": [1, 2]},
+            },
+        })
+
+        self.assertEqual(
+            config.merged_properties(),
+            config.properties.model_dump(exclude_none=True),
+        )
+
+    def test_merged_properties_do_not_share_containers_with_model(self):
+        config = AgentConfigLoader.from_dict({
+            "agent_code": "PUMP",
+            "agent_type": "PUMP",
+            "agent_name": "Pump",
+            "properties": {"station_ids": [1, 2], "limits": {"max_flow": 10}},
+        })
+
+        merged = config.merged_properties()
+
+        self.assertIsNot(merged["station_ids"], config.properties.station_ids)
+        self.assertIsNot(merged["limits"], config.properties.limits)
+        merged["station_ids"].append(3)
+        self.assertEqual(config.properties.station_ids, [1, 2])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -145,6 +145,28 @@ class BaseAgentConfigurationTest(unittest.TestCase):
             "https://example.test/constrains_targets.yaml",
         )
 
+    def test_agents_sharing_cached_config_get_independent_nested_properties(self):
+        config = AgentConfigLoader.from_dict(
+            {
+                "agent_code": "CENTRAL_SCHEDULING_AGENT",
+                "agent_type": "CENTRAL_SCHEDULING_AGENT",
+                "agent_name": "Central Scheduling Agent",
+                "properties": {"station_ids": [1, 2], "limits": {"max_flow": 10}},
+            }
+        )
+        first_agent = self.build_agent()
+        second_agent = self.build_agent()
+
+        with patch("hydros_agent_sdk.agent_config.AgentConfigLoader.from_url", return_value=config):
+            first_agent.load_agent_configuration(self.build_request(first_agent))
+            first_agent.properties.get_property("station_ids").append(3)
+            first_agent.properties.get_property("limits")["max_flow"] = 99
+            second_agent.load_agent_configuration(self.build_request(second_agent))
+
+        self.assertEqual(second_agent.properties.get_property("station_ids"), [1, 2])
+        self.assertEqual(second_agent.properties.get_property("limits"), {"max_flow": 10})
+        self.assertEqual(config.merged_properties()["station_ids"], [1, 2])
+
     def test_load_agent_configuration_rejects_unrelated_agent_code(self):
         agent = self.build_agent()
         request = self.build_request(agent)
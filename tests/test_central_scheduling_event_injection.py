@@ -180,6 +180,7 @@ class CentralSchedulingEventInjectionTest(unittest.TestCase):
         callback.set_client(client)
         outbound = Queue()
         client._task_runtime_registry.outbound_submitter = outbound.put
+        client._task_runtime_registry.outbound_batch_submitter = None
 
         if with_rolling_config:
             ContextManager.create(
@@ -1,4 +1,5 @@
 import json
+import logging
 import time
 from queue import Queue
 from threading import Event
@@ -290,6 +291,7 @@ def deliver_raw_command(client, command):
 def capture_outbound(client):
     responses = Queue()
     client._task_runtime_registry.outbound_submitter = responses.put
+    client._task_runtime_registry.outbound_batch_submitter = None
     return responses
 
 
@@ -313,6 +315,33 @@ def test_callback_returned_response_is_enqueued():
     assert runtime.router.handlers
 
 
+class MultiResponseCallback(ReturningCallback):
+    def on_tick(self, request):
+        response = super().on_tick(request)
+        return [response, None, [response.model_copy(update={"command_id": "CMD_SECOND"})]]
+
+
+def test_multiple_callback_responses_are_submitted_as_one_batch():
+    context = make_context()
+    agent = make_agent(context)
+    state_manager = AgentStateManager()
+    state_manager.set_node_id("node")
+    state_manager.activate_task(context, [agent])
+    client = make_client(MultiResponseCallback(agent), state_manager)
+    single, batches = [], []
+    client._task_runtime_registry.outbound_submitter = single.append
+    client._task_runtime_registry.outbound_batch_submitter = batches.append
+
+    task_runtime(client, context).handle(
+        TickCmdRequest(command_id="CMD_TICK", context=context, step=1)
+    )
+
+    assert single == []
+    assert [[command.command_id for command in batch] for batch in batches] == [
+        ["CMD_TICK", "CMD_SECOND"]
+    ]
+
+
 def test_client_does_not_expose_paho_or_transport_callback_internals():
     client = make_client(ReturningCallback(make_agent(make_context())), AgentStateManager())
 
@@ -763,14 +792,12 @@ def test_non_init_response_is_ignored_before_strict_envelope_parsing():
     }
 
     try:
-        with patch(
-            "hydros_agent_sdk.coordination_client.SimCommandEnvelope",
-            side_effect=AssertionError("ignored response reached envelope parsing"),
-        ):
+        with patch("hydros_agent_sdk.coordination_client.SIM_COMMAND_ADAPTER") as adapter:
             client.transport.deliver(
                 "/hydros/commands/coordination/test",
                 json.dumps(payload),
             )
+        adapter.validate_python.assert_not_called()
     finally:
         client.transport.stop()
 
@@ -859,6 +886,90 @@ def test_terminate_response_from_same_node_is_sendable_after_local_agent_removed
     assert client.outbox_publisher.should_send(response) is True
 
 
+def test_outbox_applies_per_command_type_qos_override():
+    context = make_context()
+    agent = make_agent(context)
+    transport = InMemoryTransport()
+    transport.start()
+    client = SimCoordinationClient(
+        broker_url="tcp://localhost",
+        broker_port=1883,
+        topic="/hydros/commands/coordination/test",
+        sim_coordination_callback=ReturningCallback(agent),
+        transport=transport,
+        command_qos={"tick_cmd_response": 0},
+    )
+    tick_response = TickCmdResponse(
+        command_id="CMD_TICK",
+        context=context,
+        completed_step=1,
+        command_status=CommandStatus.SUCCEED,
+        source_agent_instance=agent,
+        broadcast=False,
+    )
+    terminate_response = SimTaskTerminateResponse(
+        command_id="CMD_TERM",
+        context=context,
+        command_status=CommandStatus.SUCCEED,
+        source_agent_instance=agent,
+        broadcast=False,
+    )
+
+    client.outbox_publisher.send_with_retry(tick_response)
+    client.outbox_publisher.send_with_retry(terminate_response)
+
+    assert [record.qos for record in transport.published] == [0, 1]
+
+
+def test_outbox_enqueue_skips_log_serialization_when_info_is_disabled():
+    context = make_context()
+    agent = make_agent(context)
+    state_manager = AgentStateManager()
+    state_manager.activate_task(context, [agent])
+    client = make_client(ReturningCallback(agent), state_manager)
+    tick_response = TickCmdResponse(
+        command_id="CMD_TICK",
+        context=context,
+        completed_step=1,
+        command_status=CommandStatus.SUCCEED,
+        source_agent_instance=agent,
+        broadcast=False,
+    )
+    outbox_logger = client.outbox_publisher.logger
+    previous_level = outbox_logger.level
+    outbox_logger.setLevel(logging.WARNING)
+    try:
+        with patch.object(
+            type(client.outbox_publisher),
+            "format_command_for_log",
+            side_effect=AssertionError("log payload should not be built"),
+        ):
+            client.outbox_publisher.enqueue(tick_response)
+    finally:
+        outbox_logger.setLevel(previous_level)
+
+    assert client.outbox_publisher._queue.get_nowait() is tick_response
+
+
+def test_outbox_enqueue_drops_commands_that_stay_local():
+    context = make_context()
+    agent = make_agent(context)
+    client = make_client(ReturningCallback(agent), AgentStateManager())
+    tick_response = TickCmdResponse(
+        command_id="CMD_TICK",
+        context=context,
+        completed_step=1,
+        command_status=CommandStatus.SUCCEED,
+        source_agent_instance=agent,
+        broadcast=False,
+    )
+
+    client.outbox_publisher.enqueue(tick_response)
+    client.outbox_publisher.enqueue_many([TickCmdRequest(command_id="CMD_REQ", context=context, step=1), tick_response])
+
+    assert client.outbox_publisher._queue.empty()
+
+
 def test_hydro_event_command_routes_time_series_payload_and_returns_ack():
     context = make_context()
     agent = make_agent(context)
@@ -1121,3 +1232,180 @@ def test_hydro_event_command_can_deserialize_java_outflow_data_updated_payload_s
     assert envelope.command.payload.object_type == "GateStation"
     assert envelope.command.payload.object_time_series[0].object_id == 20000
     assert '"sourceAgentCode":"OUTFLOW_PLAN_AGENT_PUMP"' in envelope.command.model_dump_json(by_alias=True)
+
+
+def test_outbox_enqueue_many_publishes_each_command_in_order():
+    context = make_context()
+    agent = make_agent(context)
+    state_manager = AgentStateManager()
+    state_manager.set_node_id("node")
+    state_manager.activate_task(context, [agent])
+    transport = InMemoryTransport()
+    transport.start()
+    client = SimCoordinationClient(
+        broker_url="tcp://localhost",
+        broker_port=1883,
+        topic="/hydros/commands/coordination/test",
+        sim_coordination_callback=ReturningCallback(agent),
+        state_manager=state_manager,
+        transport=transport,
+    )
+    responses = [
+        TickCmdResponse(
+            command_id=f"CMD_TICK_{step}",
+            context=context,
+            completed_step=step,
+            command_status=CommandStatus.SUCCEED,
+            source_agent_instance=agent,
+            broadcast=False,
+        )
+        for step in range(3)
+    ]
+
+    client.outbox_publisher.start()
+    client.enqueue_many(responses)
+    client.outbox_publisher.stop()
+
+    published_ids = [json.loads(record.payload)["command_id"] for record in transport.published]
+    assert published_ids == ["CMD_TICK_0", "CMD_TICK_1", "CMD_TICK_2"]
+
+
+class PipelinedTransport(InMemoryTransport):
+    def __init__(self, failing_ids=()):
+        super().__init__()
+        self.batches = []
+        self.failing_ids = set(failing_ids)
+
+    def publish_many(self, topic, messages):
+        command_ids = [json.loads(payload)["command_id"] for payload, _qos in messages]
+        self.batches.append(command_ids)
+        return [RuntimeError("lost") if command_id in self.failing_ids else None for command_id in command_ids]
+
+
+def test_outbox_pipelines_drained_commands_and_retries_failures_individually():
+    context = make_context()
+    agent = make_agent(context)
+    state_manager = AgentStateManager()
+    state_manager.set_node_id("node")
+    state_manager.activate_task(context, [agent])
+    transport = PipelinedTransport(failing_ids={"CMD_TICK_1"})
+    transport.start()
+    client = SimCoordinationClient(
+        broker_url="tcp://localhost",
+        broker_port=1883,
+        topic="/hydros/commands/coordination/test",
+        sim_coordination_callback=ReturningCallback(agent),
+        state_manager=state_manager,
+        transport=transport,
+    )
+    for step in range(3):
+        client.enqueue(
+            TickCmdResponse(
+                command_id=f"CMD_TICK_{step}",
+                context=context,
+                completed_step=step,
+                command_status=CommandStatus.SUCCEED,
+                source_agent_instance=agent,
+                broadcast=False,
+            )
+        )
+
+    client.outbox_publisher.start()
+    client.outbox_publisher.stop()
+
+    assert transport.batches == [["CMD_TICK_0", "CMD_TICK_1", "CMD_TICK_2"]]
+    assert [json.loads(record.payload)["command_id"] for record in transport.published] == ["CMD_TICK_1"]
+
+
+def test_outbox_retries_pipelined_failures_without_reserializing():
+    context = make_context()
+    agent = make_agent(context)
+    state_manager = AgentStateManager()
+    state_manager.set_node_id("node")
+    state_manager.activate_task(context, [agent])
+    transport = PipelinedTransport(failing_ids={"CMD_TICK_0", "CMD_TICK_1"})
+    transport.start()
+    client = SimCoordinationClient(
+        broker_url="tcp://localhost",
+        broker_port=1883,
+        topic="/hydros/commands/coordination/test",
+        sim_coordination_callback=ReturningCallback(agent),
+        state_manager=state_manager,
+        transport=transport,
+    )
+    outbox = client.outbox_publisher
+    responses = [
+        TickCmdResponse(
+            command_id=f"CMD_TICK_{step}",
+            context=context,
+            completed_step=step,
+            command_status=CommandStatus.SUCCEED,
+            source_agent_instance=agent,
+            broadcast=False,
+        )
+        for step in range(2)
+    ]
+
+    with patch.object(outbox, "serialize", wraps=outbox.serialize) as serialize:
+        outbox._publish_outbound_batch(responses)
+
+    assert serialize.call_count == 2
+    assert [record.payload for record in transport.published] == [
+        response.model_dump_json(by_alias=True) for response in responses
+    ]
+
+
+class FlakyTransport(InMemoryTransport):
+    def __init__(self, failing_ids=()):
+        super().__init__()
+        self.failing_ids = set(failing_ids)
+
+    def publish(self, topic, payload, qos=1):
+        command_id = json.loads(payload)["command_id"]
+        if command_id in self.failing_ids:
+            self.failing_ids.discard(command_id)
+            raise RuntimeError("broker unavailable")
+        super().publish(topic, payload, qos=qos)
+
+
+def test_outbox_retry_backoff_does_not_block_later_commands():
+    context = make_context()
+    agent = make_agent(context)
+    state_manager = AgentStateManager()
+    state_manager.set_node_id("node")
+    state_manager.activate_task(context, [agent])
+    transport = FlakyTransport(failing_ids={"CMD_TICK_0"})
+    transport.start()
+    client = SimCoordinationClient(
+        broker_url="tcp://localhost",
+        broker_port=1883,
+        topic="/hydros/commands/coordination/test",
+        sim_coordination_callback=ReturningCallback(agent),
+        state_manager=state_manager,
+        transport=transport,
+        base_retry_delay_ms=20,
+    )
+    outbox = client.outbox_publisher
+    responses = [
+        TickCmdResponse(
+            command_id=f"CMD_TICK_{step}",
+            context=context,
+            completed_step=step,
+            command_status=CommandStatus.SUCCEED,
+            source_agent_instance=agent,
+            broadcast=False,
+        )
+        for step in range(2)
+    ]
+
+    outbox._publish_outbound(responses[0])
+    outbox._publish_outbound(responses[1])
+
+    assert [json.loads(record.payload)["command_id"] for record in transport.published] == ["CMD_TICK_1"]
+    assert len(outbox._retry_heap) == 1
+
+    outbox.start()
+    outbox.stop()
+
+    assert [json.loads(record.payload)["command_id"] for record in transport.published] == ["CMD_TICK_1", "CMD_TICK_0"]
+    assert outbox._retry_heap == []
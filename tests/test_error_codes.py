@@ -0,0 +1,43 @@
+from hydros_agent_sdk.error_codes import ErrorCode, ErrorCodes, create_error_response
+from hydros_agent_sdk.protocol.models import CommandStatus
+
+
+def test_format_message_fills_indexed_placeholders():
+    assert (
+        ErrorCodes.AGENT_TICK_FAILURE.format_message("AGENT_A", "ValueError: bad input")
+        == "Agent tick execution failed: AGENT_A, detail: ValueError: bad input"
+    )
+
+
+def test_format_message_keeps_placeholders_without_arguments():
+    assert ErrorCodes.SYSTEM_ERROR.format_message("NetworkError") == (
+        "Unknown system failure happens, cause: NetworkError-{1}"
+    )
+    assert ErrorCodes.DATA_NOT_FOUND.format_message("ignored") == "Data not found"
+
+
+def test_format_message_does_not_substitute_inside_arguments():
+    assert ErrorCodes.AGENT_INIT_FAILURE.format_message("{1}", "detail") == (
+        "Agent initialization failed: {1}, detail: detail"
+    )
+
+
+def test_format_message_leaves_other_braces_in_custom_templates():
+    error = ErrorCode("CUSTOM_ERROR", 'payload {"object_id": {0}} rejected')
+
+    assert error.format_message(101) == 'payload {"object_id": 101} rejected'
+
+
+def test_create_error_response_fills_failed_status_and_message():
+    class Response:
+        def __init__(self, **fields):
+            self.fields = fields
+
+    response = create_error_response(Response, ErrorCodes.DATA_NOT_FOUND, command_id="CMD_1")
+
+    assert response.fields == {
+        "command_status": CommandStatus.FAILED,
+        "error_code": ErrorCodes.DATA_NOT_FOUND.code,
+        "error_message": "Data not found",
+        "command_id": "CMD_1",
+    }
@@ -0,0 +1,111 @@
+import logging
+from unittest import mock
+
+import pytest
+
+from hydros_agent_sdk.error_codes import ErrorCode, ErrorCodes
+from hydros_agent_sdk.error_handling import (
+    AgentErrorContext,
+    handle_agent_errors,
+    safe_execute,
+    validate_request,
+)
+from hydros_agent_sdk.protocol.commands import SimTaskTerminateResponse
+from hydros_agent_sdk.protocol.models import (
+    AgentDriveMode,
+    AgentStatus,
+    CommandStatus,
+    HydroAgentInstance,
+    SimulationContext,
+)
+
+
+def fail():
+    raise ValueError("bad input")
+
+
+def test_safe_execute_includes_traceback_when_template_uses_detail():
+    success, result, error_message = safe_execute(fail, ErrorCodes.AGENT_TICK_FAILURE, "AGENT_A")
+
+    assert (success, result) == (False, None)
+    assert error_message.startswith("Agent tick execution failed: AGENT_A, detail: bad input\nTraceback")
+    assert "ValueError: bad input" in error_message
+
+
+def test_traceback_is_not_formatted_when_template_ignores_detail():
+    error_code = ErrorCode("CUSTOM_ERROR", "Agent {0} failed")
+
+    with mock.patch("hydros_agent_sdk.error_handling.traceback.format_exception") as format_exception:
+        with AgentErrorContext(error_code, agent_name="AGENT_A", include_traceback=True) as ctx:
+            fail()
+
+    assert ctx.has_error
+    assert ctx.error_message == "Agent AGENT_A failed"
+    format_exception.assert_not_called()
+
+
+def test_handle_agent_errors_reraises_without_response_class():
+    class Agent:
+        agent_code = "AGENT_A"
+
+        @handle_agent_errors(ErrorCodes.SYSTEM_ERROR)
+        def on_custom(self, request):
+            fail()
+
+    with pytest.raises(ValueError, match="bad input"):
+        Agent().on_custom(object())
+
+
+def test_traceback_is_logged_once_when_message_already_contains_it(caplog):
+    with caplog.at_level(logging.ERROR, logger="hydros_agent_sdk.error_handling"):
+        safe_execute(fail, ErrorCodes.AGENT_TICK_FAILURE, "AGENT_A")
+        with AgentErrorContext(ErrorCode("CUSTOM_ERROR", "Agent {0} failed"), agent_name="AGENT_A"):
+            fail()
+
+    with_detail, without_detail = caplog.records
+    assert "Traceback" in with_detail.getMessage()
+    assert not with_detail.exc_info
+    assert without_detail.exc_info
+
+
+def test_validate_request_reports_missing_and_none_fields():
+    class Request:
+        context = "TASK_001"
+        agent_list = None
+
+    assert validate_request(Request(), ["context"], "AGENT_A") == (True, None)
+    assert validate_request(Request(), ["context", "agent_list", "step"], "AGENT_A") == (
+        False,
+        ErrorCodes.MISSING_REQUIRED_FIELD.format_message("AGENT_A: agent_list, step"),
+    )
+
+
+def test_handle_agent_errors_builds_failed_response_with_agent_context_fallback():
+    context = SimulationContext(biz_scene_instance_id="TASK_001")
+
+    class Agent(HydroAgentInstance):
+        @handle_agent_errors(ErrorCodes.AGENT_TERMINATE_FAILURE, include_traceback=False)
+        def on_terminate(self, request):
+            fail()
+
+    agent = Agent(
+        agent_code="AGENT_A",
+        agent_type="TEST_AGENT",
+        agent_name="Agent A",
+        agent_configuration_url="",
+        agent_id="AGT_A",
+        biz_scene_instance_id="TASK_001",
+        hydros_cluster_id="cluster",
+        hydros_node_id="node-a",
+        context=context,
+        agent_status=AgentStatus.INIT,
+        drive_mode=AgentDriveMode.SIM_TICK_DRIVEN,
+    )
+
+    response = agent.on_terminate(object())
+
+    assert isinstance(response, SimTaskTerminateResponse)
+    assert response.command_id == "UNKNOWN"
+    assert response.context == context
+    assert response.command_status == CommandStatus.FAILED
+    assert response.error_message == ErrorCodes.AGENT_TERMINATE_FAILURE.format_message("AGENT_A", "bad input")
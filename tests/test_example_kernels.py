@@ -0,0 +1,125 @@
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+EXAMPLES_DIR = Path(__file__).parents[1] / "examples" / "agents"
+
+
+def _load_example(relative_path):
+    path = EXAMPLES_DIR / relative_path
+    spec = importlib.util.spec_from_file_location(f"example_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+ontology_rule_engine = _load_example("ontology/ontology_rule_engine.py")
+hydraulic_solver = _load_example("twins/hydraulic_solver.py")
+
+
+def _python_kernel(kernel):
+    # 安装了 numba 时内核已被编译，py_func 是原始 Python 函数
+    return getattr(kernel, "py_func", kernel)
+
+
+def _topology(object_count):
+    children = [
+        SimpleNamespace(object_id=object_id, object_name=f"obj-{object_id}", object_type="GATE", properties={})
+        for object_id in range(1, object_count + 1)
+    ]
+    return SimpleNamespace(top_objects=[SimpleNamespace(children=children)])
+
+
+def _boundary_conditions(step, object_count):
+    return {
+        object_id: {"inflow": 50.0 * step * object_id, "gate_opening": 0.4 + 0.3 * object_id}
+        for object_id in range(1, object_count + 1, 2)
+    }
+
+
+def _load_on_array_path(monkeypatch, module, engine, load):
+    # 不依赖 numba：强制走数组路径，内核以纯 Python 形式执行
+    monkeypatch.setattr(module, "np", np)
+    engine.use_jit = True
+    load(_topology(5))
+
+
+def _assert_states_match(results, expected):
+    assert results.keys() == expected.keys()
+    for object_id, state in expected.items():
+        assert results[object_id] == pytest.approx(state)
+
+
+def test_ontology_step_kernel_matches_python_rules():
+    engine = ontology_rule_engine.OntologyRuleEngine()
+    engine.load_ontology(_topology(4))
+    states = [
+        {"water_level": 9.9, "flow": 0.0, "gate_opening": 1.5},
+        {"water_level": 0.0, "flow": 0.0, "gate_opening": 0.5},
+        {"water_level": 2.0, "flow": 0.0, "gate_opening": -0.2},
+        {"water_level": 12.0, "flow": 0.0, "gate_opening": 0.9},
+    ]
+    inflow = [40.0, 0.0, -500.0, 300.0]
+    level = np.array([state["water_level"] for state in states])
+    flow = np.zeros(len(states))
+    opening = np.array([state["gate_opening"] for state in states])
+
+    _python_kernel(ontology_rule_engine._step_kernel)(level, flow, opening, np.array(inflow))
+    expected = engine._evaluate_partition(
+        [(object_id, {"state": dict(state)}) for object_id, state in enumerate(states)],
+        {object_id: {"inflow": value} for object_id, value in enumerate(inflow)},
+    )
+
+    assert level.tolist() == pytest.approx([expected[index]["water_level"] for index in range(len(states))])
+    assert flow.tolist() == pytest.approx([expected[index]["flow"] for index in range(len(states))])
+    assert opening.tolist() == pytest.approx([expected[index]["gate_opening"] for index in range(len(states))])
+
+
+def test_ontology_array_path_matches_python_path_and_syncs_state(monkeypatch):
+    python_engine = ontology_rule_engine.OntologyRuleEngine()
+    python_engine.load_ontology(_topology(5))
+    array_engine = ontology_rule_engine.OntologyRuleEngine()
+    _load_on_array_path(monkeypatch, ontology_rule_engine, array_engine, array_engine.load_ontology)
+
+    for step in range(1, 4):
+        boundary_conditions = _boundary_conditions(step, 5)
+        expected = python_engine.apply_rules(step, boundary_conditions)
+        results = array_engine.apply_rules(step, boundary_conditions)
+
+        _assert_states_match(results, expected)
+        for object_id, state in results.items():
+            assert array_engine.ontology_model[object_id]["state"] == state
+
+
+def test_ontology_partitioned_evaluation_matches_sequential():
+    sequential = ontology_rule_engine.OntologyRuleEngine()
+    sequential.load_ontology(_topology(8))
+    parallel = ontology_rule_engine.OntologyRuleEngine(force_sequential=False, max_workers=4, min_objects_per_worker=2)
+    parallel.load_ontology(_topology(8))
+    try:
+        assert len(parallel._partition(list(parallel.ontology_model.items()))) == 4
+
+        for step in range(1, 4):
+            boundary_conditions = _boundary_conditions(step, 8)
+            assert parallel.apply_rules(step, boundary_conditions) == sequential.apply_rules(step, boundary_conditions)
+    finally:
+        parallel.close()
+
+
+def test_hydraulic_solver_array_path_matches_python_path_and_syncs_state(monkeypatch):
+    python_solver = hydraulic_solver.HydraulicSolver()
+    python_solver.initialize(_topology(5))
+    array_solver = hydraulic_solver.HydraulicSolver()
+    _load_on_array_path(monkeypatch, hydraulic_solver, array_solver, array_solver.initialize)
+
+    for step in range(1, 13):
+        boundary_conditions = {1: {"water_level": 9.95}} if step == 3 else {}
+        expected = python_solver.solve_step(step, boundary_conditions)
+        results = array_solver.solve_step(step, boundary_conditions)
+
+        _assert_states_match(results, expected)
+        assert array_solver.state == results
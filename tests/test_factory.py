@@ -1,7 +1,9 @@
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from hydros_agent_sdk.config_loader import load_agent_config
 from hydros_agent_sdk.factory import CustomAgentFactory, HydroAgentFactory
 
 
@@ -63,5 +65,46 @@ class HydroAgentFactoryTest(unittest.TestCase):
 
         self.assertEqual("TEST_AGENT", config["agent_code"])
 
+    def test_load_config_reuses_parsed_file_until_it_changes(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            config_file = Path(temporary_directory) / "agent.properties"
+            config_file.write_text(
+                "# comment\n"
+                "agent_code=TEST_AGENT\n"
+                "agent_type : TEST_AGENT_TYPE\n"
+                "agent_name=Test Agent\n",
+                encoding="utf-8",
+            )
+            factory = HydroAgentFactory(StubAgent, config_file=str(config_file))
+
+            with mock.patch("hydros_agent_sdk.factory.load_agent_config", wraps=load_agent_config) as load:
+                first = factory._load_config(str(config_file))
+                first["agent_code"] = "MUTATED"
+                second = factory._load_config(str(config_file))
+                config_file.write_text(
+                    "agent_code=OTHER_AGENT\n"
+                    "agent_type=TEST_AGENT_TYPE\n"
+                    "agent_name=Test Agent\n",
+                    encoding="utf-8",
+                )
+                third = factory._load_config(str(config_file))
+
+        self.assertEqual(
+            {"agent_code": "TEST_AGENT", "agent_type": "TEST_AGENT_TYPE", "agent_name": "Test Agent"},
+            second,
+        )
+        self.assertEqual("OTHER_AGENT", third["agent_code"])
+        self.assertEqual(2, load.call_count)
+
+    def test_load_config_reports_missing_properties(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            config_file = Path(temporary_directory) / "agent.properties"
+            config_file.write_text("agent_code=TEST_AGENT\n", encoding="utf-8")
+            factory = HydroAgentFactory(StubAgent, config_file=str(config_file))
+
+            with self.assertRaisesRegex(ValueError, "agent_type, agent_name"):
+                factory._load_config(str(config_file))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,11 @@
 from unittest.mock import patch
 
-from hydros_agent_sdk.utils.hydro_object_utils import HydroObjectUtilsV2
+from hydros_agent_sdk.utils.hydro_object_utils import (
+    HydroObjectUtilsV2,
+    SimpleChildObject,
+    TopHydroObject,
+    WaterwayTopology,
+)
 
 
 def build_yaml_data():
@@ -80,3 +85,101 @@ def test_build_waterway_topology_loads_yaml_once():
     assert len(topology.top_objects) == 1
     assert topology.get_object(20001).object_name == "Section 20001"
     assert topology.child_to_parent_map[20001] == 20000
+
+
+def test_modeling_source_version_tracks_local_file_changes(tmp_path):
+    modeling_file = tmp_path / "objects.yaml"
+    modeling_file.write_text("objects: []\n", encoding="utf-8")
+    url = modeling_file.as_uri()
+
+    first_version = HydroObjectUtilsV2.get_modeling_source_version(url)
+    modeling_file.write_text("objects: []\ncross_sections: []\n", encoding="utf-8")
+
+    assert first_version is not None
+    assert HydroObjectUtilsV2.get_modeling_source_version(url) != first_version
+    assert HydroObjectUtilsV2.get_modeling_source_version("s3://bucket/objects.yaml") is None
+
+
+def test_ontology_agent_reuses_topology_for_unchanged_modeling_source():
+    from hydros_agent_sdk.agents import ontology_simulation_agent
+
+    ontology_simulation_agent._TOPOLOGY_CACHE.clear()
+    ontology_simulation_agent._SOURCE_VERSIONS.clear()
+    with patch.object(
+        HydroObjectUtilsV2, "get_modeling_source_version", side_effect=["v1", "v1", "v2"]
+    ), patch.object(
+        HydroObjectUtilsV2, "load_remote_yaml", return_value=build_yaml_data()
+    ) as load_remote_yaml, patch.object(
+        ontology_simulation_agent, "_SOURCE_VERSION_TTL_SECONDS", 0
+    ):
+        first = ontology_simulation_agent._load_cached_topology("https://example.test/objects.yaml", ["a"], True)
+        second = ontology_simulation_agent._load_cached_topology("https://example.test/objects.yaml", {"a"}, True)
+        third = ontology_simulation_agent._load_cached_topology("https://example.test/objects.yaml", {"a"}, True)
+
+    assert second == first
+    assert second is not first
+    assert second.top_objects[0] is not first.top_objects[0]
+    assert third is not first
+    assert load_remote_yaml.call_count == 2
+    ontology_simulation_agent._TOPOLOGY_CACHE.clear()
+    ontology_simulation_agent._SOURCE_VERSIONS.clear()
+
+
+def test_ontology_agent_topology_copies_are_independent_and_version_probe_is_reused():
+    from hydros_agent_sdk.agents import ontology_simulation_agent
+
+    ontology_simulation_agent._TOPOLOGY_CACHE.clear()
+    ontology_simulation_agent._SOURCE_VERSIONS.clear()
+    with patch.object(
+        HydroObjectUtilsV2, "get_modeling_source_version", return_value="v1"
+    ) as probe, patch.object(
+        HydroObjectUtilsV2, "load_remote_yaml", return_value=build_yaml_data()
+    ):
+        first = ontology_simulation_agent._load_cached_topology("https://example.test/objects.yaml", None, True)
+        first.top_objects.clear()
+        second = ontology_simulation_agent._load_cached_topology("https://example.test/objects.yaml", None, True)
+
+    assert len(second.top_objects) == 1
+    assert probe.call_count == 1
+    ontology_simulation_agent._TOPOLOGY_CACHE.clear()
+    ontology_simulation_agent._SOURCE_VERSIONS.clear()
+
+
+def test_ontology_agent_always_restats_local_modeling_files(tmp_path):
+    from hydros_agent_sdk.agents import ontology_simulation_agent
+
+    modeling_file = tmp_path / "objects.yaml"
+    modeling_file.write_text("objects: []\n", encoding="utf-8")
+    url = modeling_file.as_uri()
+    ontology_simulation_agent._SOURCE_VERSIONS.clear()
+
+    first_version = ontology_simulation_agent._modeling_source_version(url)
+    modeling_file.write_text("objects: []\ncross_sections: []\n", encoding="utf-8")
+
+    assert ontology_simulation_agent._modeling_source_version(url) != first_version
+    assert ontology_simulation_agent._SOURCE_VERSIONS == {}
+
+
+def test_topology_adjacency_is_csr_of_merged_neighbors():
+    topology = WaterwayTopology(
+        top_objects=[
+            TopHydroObject(
+                object_id=1,
+                object_type="Channel",
+                object_name="C1",
+                children=[SimpleChildObject(object_id=11, object_type="Gate", object_name="G11")],
+            ),
+            TopHydroObject(object_id=2, object_type="Channel", object_name="C2"),
+        ],
+        upstream_map={2: [1], 99: [2]},
+        downstream_map={1: [2], 2: [99]},
+    )
+
+    adjacency = topology.adjacency()
+
+    assert adjacency.object_ids == (1, 11, 2, 99)
+    assert adjacency.indptr.typecode == adjacency.indices.typecode == "q"
+    assert list(adjacency.indptr) == [0, 1, 1, 3, 4]
+    assert list(adjacency.neighbors(adjacency.positions[2])) == [0, 3]
+    assert adjacency.degree(adjacency.positions[11]) == 0
+    assert topology.adjacency() is adjacency
@@ -55,6 +55,88 @@ class HydrosTopicsTest(unittest.TestCase):
         self.assertTrue(transport.connected.is_set())
         self.assertEqual(subscriptions, [("/hydros/commands/coordination/demo_cluster", 1)])
 
+    def test_coordination_transport_on_connect_disables_nagle(self):
+        transport = MqttCoordinationTransport(
+            broker_url="tcp://127.0.0.1",
+            broker_port=1883,
+            client_id="test-client",
+            topic="/hydros/commands/coordination/demo_cluster",
+            handler=lambda _topic, _payload: None,
+        )
+        sock = Mock()
+        transport.mqtt_client.socket = lambda: sock
+        transport.mqtt_client.subscribe = lambda topic, qos=0: None
+
+        transport._on_connect(None, None, None, ReasonCode(packetType=2, aName="Success"))
+
+        sock.setsockopt.assert_called_once_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def test_coordination_transport_hands_raw_payload_bytes_to_handler(self):
+        received = []
+        transport = MqttCoordinationTransport(
+            broker_url="tcp://127.0.0.1",
+            broker_port=1883,
+            client_id="test-client",
+            topic="/hydros/commands/coordination/demo_cluster",
+            handler=lambda topic, payload: received.append((topic, payload)),
+        )
+
+        transport._on_message(
+            None,
+            None,
+            Mock(topic="/hydros/commands/coordination/demo_cluster", payload=b'{"command_type":"tick_cmd"}'),
+        )
+
+        self.assertEqual(received, [("/hydros/commands/coordination/demo_cluster", b'{"command_type":"tick_cmd"}')])
+
+    def test_coordination_transport_publish_waits_only_for_acknowledged_qos(self):
+        transport = MqttCoordinationTransport(
+            broker_url="tcp://127.0.0.1",
+            broker_port=1883,
+            client_id="test-client",
+            topic="/hydros/commands/coordination/demo_cluster",
+            handler=lambda _topic, _payload: None,
+            publish_timeout_seconds=0.5,
+        )
+        result = Mock(rc=0)
+        result.is_published.return_value = False
+        transport.mqtt_client.publish = Mock(return_value=result)
+
+        transport.publish("/metrics", "{}", qos=0)
+        result.wait_for_publish.assert_not_called()
+
+        with self.assertRaises(TimeoutError):
+            transport.publish("/commands", "{}", qos=1)
+        result.wait_for_publish.assert_called_once_with(timeout=0.5)
+
+    def test_coordination_transport_publish_many_bounds_unacknowledged_messages(self):
+        transport = MqttCoordinationTransport(
+            broker_url="tcp://127.0.0.1",
+            broker_port=1883,
+            client_id="test-client",
+            topic="/hydros/commands/coordination/demo_cluster",
+            handler=lambda _topic, _payload: None,
+            max_inflight_messages=2,
+        )
+        inflight = []
+        peak = []
+
+        def publish(_topic, payload, qos=0):
+            result = Mock(rc=0)
+            result.is_published.return_value = payload != "lost"
+            result.wait_for_publish.side_effect = lambda timeout: inflight.remove(payload)
+            inflight.append(payload)
+            peak.append(len(inflight))
+            return result
+
+        transport.mqtt_client.publish = publish
+
+        errors = transport.publish_many("/commands", [(payload, 1) for payload in ("a", "b", "lost", "c", "d")])
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(inflight, [])
+        self.assertEqual([type(error) for error in errors], [type(None), type(None), TimeoutError, type(None), type(None)])
+
     def test_agent_command_client_subscribes_through_shared_transport(self):
         transport = Mock()
         client = AgentCommandClient(
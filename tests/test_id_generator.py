@@ -1,3 +1,4 @@
+import string
 import unittest
 from enum import Enum
 from unittest.mock import patch
@@ -15,6 +16,7 @@ from hydros_agent_sdk.utils.id_generator import (
     generate_data_series_id,
     generate_sse_session_id,
     generate_user_id,
+    _random_alphanumeric,
 )
 
 
@@ -24,15 +26,14 @@ class DummyTaskType(Enum):
 
 class IdGeneratorTest(unittest.TestCase):
     def setUp(self):
-        patcher = patch("hydros_agent_sdk.utils.id_generator.datetime")
+        patcher = patch("hydros_agent_sdk.utils.id_generator.strftime", return_value="202601011230")
         self.addCleanup(patcher.stop)
-        self.mock_datetime = patcher.start()
-        mock_now = self.mock_datetime.now.return_value
-        mock_now.strftime.return_value = "202601011230"
+        patcher.start()
 
-        choice_patcher = patch("hydros_agent_sdk.utils.id_generator.choice", return_value="A")
-        self.addCleanup(choice_patcher.stop)
-        choice_patcher.start()
+        # 全零随机字节映射为字母表首字符 A
+        urandom_patcher = patch("hydros_agent_sdk.utils.id_generator.urandom", side_effect=bytes)
+        self.addCleanup(urandom_patcher.stop)
+        urandom_patcher.start()
 
     def test_java_style_timestamped_ids(self):
         self.assertEqual(generate_agent_instance_id("TWINS_SIMULATION_AGENT"), "AGT202601011230AAAAAA_TWINS_SIMULATION_AGENT")
@@ -59,5 +60,32 @@ class IdGeneratorTest(unittest.TestCase):
         )
 
 
+class TimestampTest(unittest.TestCase):
+    def test_timestamp_matches_local_minute_format(self):
+        from datetime import datetime
+
+        from hydros_agent_sdk.utils.id_generator import _timestamp_str
+
+        before = datetime.now().strftime("%Y%m%d%H%M")
+        value = _timestamp_str()
+        after = datetime.now().strftime("%Y%m%d%H%M")
+
+        self.assertIn(value, {before, after})
+
+
+class RandomAlphanumericTest(unittest.TestCase):
+    def test_uses_uppercase_alphanumeric_alphabet(self):
+        value = _random_alphanumeric(500)
+
+        self.assertEqual(len(value), 500)
+        self.assertTrue(set(value) <= set(string.ascii_uppercase + string.digits))
+
+    def test_discards_bytes_that_would_bias_the_alphabet(self):
+        batches = iter([bytes([255, 252, 36, 35]), bytes([1, 2, 3, 4, 5])])
+        with patch("hydros_agent_sdk.utils.id_generator.urandom", side_effect=lambda size: next(batches)):
+            self.assertEqual(_random_alphanumeric(2), "A9")
+            self.assertEqual(_random_alphanumeric(3), "BCD")
+
+
 if __name__ == "__main__":
     unittest.main()
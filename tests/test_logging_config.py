@@ -1,9 +1,16 @@
 import logging
 
+from hydros_agent_sdk import logging_config
 from hydros_agent_sdk.logging_config import (
     HydrosFormatter,
+    HydrosQueueHandler,
+    LogContext,
+    get_biz_component,
+    get_biz_scene_instance_id,
+    set_biz_component,
     set_hydros_cluster_id,
     set_hydros_node_id,
+    setup_logging,
 )
 
 
@@ -23,3 +30,56 @@ def test_full_formatter_uses_empty_markers_when_deployment_identity_is_unavailab
     formatted = HydrosFormatter().format(record)
 
     assert formatted.split("|", maxsplit=2)[:2] == ["-", "-"]
+
+
+def test_log_context_skips_unchanged_values_and_restores_changed_ones():
+    outer_component = get_biz_component()
+    with LogContext(biz_scene_instance_id="TASK_A", biz_component="AGENT_A"):
+        with LogContext(biz_scene_instance_id="TASK_A", biz_component="AGENT_B") as inner:
+            assert len(inner.tokens) == 1
+            assert get_biz_component() == "AGENT_B"
+        assert get_biz_component() == "AGENT_A"
+        assert get_biz_scene_instance_id() == "TASK_A"
+    assert get_biz_component() == outer_component
+
+
+def test_log_context_restores_unchanged_value_overwritten_inside_block():
+    with LogContext(biz_component="AGENT_A"):
+        with LogContext(biz_component="AGENT_A"):
+            set_biz_component("SIM_SDK")
+        assert get_biz_component() == "AGENT_A"
+
+
+def test_async_handlers_keep_caller_log_context(tmp_path):
+    root_logger = logging.getLogger()
+    previous_handlers = list(root_logger.handlers)
+    previous_level = root_logger.level
+    log_file = tmp_path / "hydros.log"
+    try:
+        setup_logging(
+            hydros_cluster_id="cluster-a",
+            hydros_node_id="node-a",
+            log_file=str(log_file),
+            console=False,
+            format_style="full",
+            async_handlers=True,
+        )
+        assert [type(handler) for handler in root_logger.handlers] == [HydrosQueueHandler]
+
+        with LogContext(biz_scene_instance_id="TASK_A", biz_component="AGENT_A"):
+            logging.getLogger("hydros.test").info("step %s done", 3)
+        logging_config._queue_listener.stop()
+    finally:
+        listener = logging_config._queue_listener
+        if listener is not None:
+            for handler in listener.handlers:
+                handler.close()
+        logging_config._queue_listener = None
+        root_logger.handlers[:] = previous_handlers
+        root_logger.setLevel(previous_level)
+
+    line = log_file.read_text(encoding="utf-8").strip()
+    fields = line.split("|")
+    assert fields[:2] == ["cluster-a", "node-a"]
+    assert fields[4:6] == ["TASK_A", "AGENT_A"]
+    assert fields[-1] == "step 3 done"
@@ -0,0 +1,103 @@
+from hydros_agent_sdk.message_filter import MessageFilter
+from hydros_agent_sdk.protocol.commands import (
+    AgentInstanceStatusReport,
+    EdgeControlExecutionReport,
+    TickCmdRequest,
+    TickCmdResponse,
+)
+from hydros_agent_sdk.protocol.models import (
+    AgentDriveMode,
+    AgentStatus,
+    CommandStatus,
+    HydroAgentInstance,
+    SimulationContext,
+)
+from hydros_agent_sdk.state_manager import AgentStateManager
+
+
+def make_context():
+    return SimulationContext(biz_scene_instance_id="TASK_001")
+
+
+def make_agent(context, agent_id, node_id):
+    return HydroAgentInstance(
+        agent_code="TEST_AGENT",
+        agent_type="TEST_AGENT",
+        agent_name="Test Agent",
+        agent_configuration_url="",
+        agent_id=agent_id,
+        biz_scene_instance_id=context.biz_scene_instance_id,
+        hydros_cluster_id="cluster",
+        hydros_node_id=node_id,
+        context=context,
+        agent_status=AgentStatus.INIT,
+        drive_mode=AgentDriveMode.SIM_TICK_DRIVEN,
+    )
+
+
+def make_filter():
+    context = make_context()
+    local_agent = make_agent(context, "AGT_LOCAL", "node-a")
+    remote_agent = make_agent(context, "AGT_REMOTE", "node-b")
+    state_manager = AgentStateManager()
+    state_manager.set_node_id("node-a")
+    state_manager.activate_task(context, [local_agent])
+    return MessageFilter(state_manager), context, local_agent, remote_agent
+
+
+def make_edge_report(context, source, target):
+    return EdgeControlExecutionReport(
+        command_id="CMD_EDGE",
+        context=context,
+        source_agent_instance=source,
+        target_agent_instance=target,
+        exec_command_id="AGTCMD_EDGE",
+        object_type="GateStation",
+        object_id=101,
+        target_value_type="water_level",
+        target_value=3.5,
+        exec_status="COMPLETED",
+    )
+
+
+def test_receive_rules_follow_java_is_received_branches():
+    message_filter, context, local_agent, remote_agent = make_filter()
+
+    def status_report(source):
+        return AgentInstanceStatusReport(
+            command_id="CMD_STATUS",
+            context=context,
+            source_agent_instance=source,
+            agent_instance_status="RUNNING",
+        )
+
+    assert message_filter.is_received(TickCmdRequest(command_id="CMD_TICK", context=context, step=1)) is True
+    assert message_filter.is_received(status_report(remote_agent)) is True
+    assert message_filter.is_received(status_report(local_agent)) is False
+    assert message_filter.is_received(
+        TickCmdResponse(
+            command_id="CMD_TICK",
+            context=context,
+            completed_step=1,
+            command_status=CommandStatus.SUCCEED,
+            source_agent_instance=remote_agent,
+        )
+    ) is False
+    assert message_filter.is_received(make_edge_report(context, remote_agent, local_agent)) is False
+
+
+def test_edge_control_execution_report_requires_remote_source_and_local_target():
+    message_filter, context, local_agent, remote_agent = make_filter()
+
+    assert message_filter.should_process_message(make_edge_report(context, remote_agent, local_agent)) is True
+    assert message_filter.should_process_message(make_edge_report(context, local_agent, local_agent)) is False
+    assert message_filter.should_process_message(make_edge_report(context, remote_agent, remote_agent)) is False
+
+
+def test_inactive_context_is_filtered_before_receive_rules():
+    message_filter, _context, _local_agent, _remote_agent = make_filter()
+    other_context = SimulationContext(biz_scene_instance_id="TASK_OTHER")
+
+    assert message_filter.should_process_message(
+        TickCmdRequest(command_id="CMD_TICK", context=other_context, step=1)
+    ) is False
@@ -1,7 +1,13 @@
+import importlib.util
+import json
+import threading
+import time
 import unittest
+from unittest import mock
 
+from hydros_agent_sdk.runtime.env_settings import load_runtime_env_settings
 from hydros_agent_sdk.transport import MqttMetricsPublisher
-from hydros_agent_sdk.utils.mqtt_metrics import MqttMetrics
+from hydros_agent_sdk.utils.mqtt_metrics import MetricsColumns, MqttMetrics
 
 
 class PublishResult:
@@ -42,6 +48,19 @@ class MqttMetricsPublisherTest(unittest.TestCase):
 
         self.assertEqual(publisher.topic, "/hydros/commands/coordination/test/metrics")
 
+    def test_loads_runtime_env_settings_once_per_publisher(self):
+        with mock.patch(
+            "hydros_agent_sdk.transport.mqtt_metrics_publisher.load_runtime_env_settings",
+            wraps=load_runtime_env_settings,
+        ) as load_settings:
+            MqttMetricsPublisher.from_coordination_client(
+                FakeCoordinationClient(),
+                biz_scene_instance_id="task-a",
+                cluster_id="cluster-a",
+            )
+
+        self.assertEqual(load_settings.call_count, 1)
+
     def test_publish_batch_delegates_to_transport(self):
         client = FakeCoordinationClient()
         publisher = MqttMetricsPublisher.from_coordination_client(
@@ -114,6 +133,258 @@ class MqttMetricsPublisherTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             publisher.publish_batch([metrics])
 
+    def test_publish_batch_packs_metrics_into_array_payloads_when_enabled(self):
+        client = FakeCoordinationClient()
+        publisher = MqttMetricsPublisher(
+            transport=client.transport,
+            topic="/metrics/task-a",
+            biz_scene_instance_id="task-a",
+            batch_payloads=True,
+        )
+        metrics_list = [
+            MqttMetrics(object_id=object_id, metrics_code="water_level", value=1.0, source_timestamp_ms=1)
+            for object_id in range(3)
+        ]
+
+        published_count = publisher.publish_batch(metrics_list)
+
+        self.assertEqual(published_count, 3)
+        self.assertEqual(len(client.transport.published), 1)
+        payload = json.loads(client.transport.published[0][1])
+        self.assertEqual([item["object_id"] for item in payload], [0, 1, 2])
+        self.assertTrue(all(item["biz_scene_instance_id"] == "task-a" for item in payload))
+
+    def test_array_payloads_are_split_at_max_batch_bytes(self):
+        client = FakeCoordinationClient()
+        single_size = len(
+            MqttMetrics(object_id=0, metrics_code="water_level", value=1.0, source_timestamp_ms=1)
+            .model_dump_json(exclude_none=True)
+            .encode("utf-8")
+        )
+        publisher = MqttMetricsPublisher(
+            transport=client.transport,
+            topic="/metrics/task-a",
+            batch_payloads=True,
+            max_batch_bytes=2 * single_size + 4,
+        )
+        metrics_list = [
+            MqttMetrics(object_id=object_id, metrics_code="water_level", value=1.0, source_timestamp_ms=1)
+            for object_id in range(5)
+        ]
+
+        self.assertEqual(publisher.publish_batch(metrics_list), 5)
+        self.assertEqual(len(client.transport.published), 3)
+
+    def test_async_writer_publishes_after_flush(self):
+        client = FakeCoordinationClient()
+        publisher = MqttMetricsPublisher(
+            transport=client.transport,
+            topic="/metrics/task-a",
+            write_and_flush=False,
+            buffered_msg_count=100,
+            idle_flush_timeout_ms=10_000,
+        )
+        metrics_list = [
+            MqttMetrics(object_id=object_id, metrics_code="water_level", value=1.0, source_timestamp_ms=1)
+            for object_id in range(3)
+        ]
+
+        self.assertEqual(publisher.publish_batch(metrics_list), 3)
+        self.assertTrue(publisher.flush(timeout=5))
+        self.assertEqual(len(client.transport.published), 3)
+        self.assertTrue(publisher.close(timeout=5))
+        self.assertIsNone(publisher._writer)
+
+    def test_async_writer_flushes_on_idle_timeout(self):
+        client = FakeCoordinationClient()
+        publisher = MqttMetricsPublisher(
+            transport=client.transport,
+            topic="/metrics/task-a",
+            write_and_flush=False,
+            idle_flush_timeout_ms=1,
+        )
+        metrics = MqttMetrics(object_id=1, metrics_code="water_level", value=1.0, source_timestamp_ms=1)
+
+        publisher.publish_batch([metrics])
+        for _ in range(500):
+            if client.transport.published:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(len(client.transport.published), 1)
+        publisher.close(timeout=5)
+
+    def test_publish_after_timed_out_close_is_not_queued_behind_stop_signal(self):
+        release = threading.Event()
+
+        class BlockingTransport(FakeTransport):
+            def publish(self, topic, payload, qos=0):
+                release.wait(5)
+                return super().publish(topic, payload, qos)
+
+        transport = BlockingTransport()
+        publisher = MqttMetricsPublisher(
+            transport=transport,
+            topic="/metrics/task-a",
+            write_and_flush=False,
+            buffered_msg_count=1,
+        )
+
+        publisher.publish_batch([MqttMetrics(object_id=1, metrics_code="water_level", value=1.0)])
+        self.assertFalse(publisher.close(timeout=0.05))
+        publisher.publish_batch([MqttMetrics(object_id=2, metrics_code="water_level", value=1.0)])
+        release.set()
+
+        self.assertTrue(publisher.close(timeout=5))
+        for _ in range(500):
+            if len(transport.published) == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(sorted(json.loads(payload)["object_id"] for _, payload, _ in transport.published), [1, 2])
+
+    def test_async_writer_still_validates_context_synchronously(self):
+        client = FakeCoordinationClient()
+        publisher = MqttMetricsPublisher(
+            transport=client.transport,
+            topic="/metrics/task-a",
+            biz_scene_instance_id="task-a",
+            write_and_flush=False,
+        )
+        metrics = MqttMetrics(
+            biz_scene_instance_id="task-b",
+            object_id=1,
+            metrics_code="water_level",
+            value=1.0,
+            source_timestamp_ms=1,
+        )
+
+        with self.assertRaises(ValueError):
+            publisher.publish_batch([metrics])
+        self.assertIsNone(publisher._writer)
+
+    def test_publish_columns_matches_per_metric_payloads(self):
+        client = FakeCoordinationClient()
+        publisher = MqttMetricsPublisher(
+            transport=client.transport,
+            topic="/metrics/task-a",
+            biz_scene_instance_id="task-a",
+            edge_node_code="node-a",
+        )
+        columns = MetricsColumns(
+            object_ids=[1, 2, 3],
+            object_names=["闸门-1", None, "obj-3"],
+            metrics_codes=["water_level", "water_flow", "water_level"],
+            values=[73.2, None, float("nan")],
+        )
+
+        self.assertEqual(publisher.publish_columns(columns, step_index=4, source_id="agent-a", source_timestamp_ms=9), 3)
+
+        expected = [
+            MqttMetrics(
+                source_id="agent-a",
+                biz_scene_instance_id="task-a",
+                job_instance_id="task-a",
+                edge_node_code="node-a",
+                object_id=object_id,
+                object_name=object_name,
+                step_index=4,
+                source_timestamp_ms=9,
+                metrics_code=metrics_code,
+                value=value,
+            ).model_dump_json(exclude_none=True)
+            for object_id, object_name, metrics_code, value in zip(*columns)
+        ]
+        self.assertEqual([payload for _, payload, _ in client.transport.published], expected)
+
+    def test_publish_columns_formats_floats_like_per_metric_payloads(self):
+        client = FakeCoordinationClient()
+        publisher = MqttMetricsPublisher(transport=client.transport, topic="/metrics/task-a")
+        values = [1e-7, 1e-5, 1e16, 0.1, 5]
+        columns = MetricsColumns(range(len(values)), ["obj"] * len(values), ["water_level"] * len(values), values)
+
+        publisher.publish_columns(columns, step_index=1, source_timestamp_ms=9)
+
+        payloads = [payload for _, payload, _ in client.transport.published]
+        self.assertEqual(
+            payloads,
+            [
+                MqttMetrics(
+                    object_id=index,
+                    object_name="obj",
+                    step_index=1,
+                    source_timestamp_ms=9,
+                    metrics_code="water_level",
+                    value=value,
+                ).model_dump_json(exclude_none=True)
+                for index, value in enumerate(values)
+            ],
+        )
+        self.assertIn('"value":1e-7', payloads[0])
+        self.assertIn('"value":1e+16', payloads[2])
+
+    def test_publish_columns_rejects_mismatched_context_id(self):
+        publisher = MqttMetricsPublisher(
+            transport=FakeTransport(),
+            topic="/metrics/task-a",
+            biz_scene_instance_id="task-a",
+        )
+        columns = MetricsColumns([1], ["obj"], ["water_level"], [1.0])
+
+        with self.assertRaisesRegex(ValueError, "does not match publisher context"):
+            publisher.publish_columns(columns, step_index=1, biz_scene_instance_id="task-b")
+
+    def test_publish_columns_rejects_ragged_columns(self):
+        publisher = MqttMetricsPublisher(transport=FakeTransport(), topic="/metrics/task-a")
+
+        with self.assertRaises(ValueError):
+            publisher.publish_columns(MetricsColumns([1, 2], ["a"], ["water_level"] * 2, [1.0, 2.0]))
+
+    def test_async_writer_publishes_columns_as_arrays(self):
+        client = FakeCoordinationClient()
+        publisher = MqttMetricsPublisher(
+            transport=client.transport,
+            topic="/metrics/task-a",
+            batch_payloads=True,
+            write_and_flush=False,
+        )
+        columns = MetricsColumns(range(5), ["obj"] * 5, ["water_level"] * 5, [1.0] * 5)
+
+        self.assertEqual(publisher.publish_columns(columns, step_index=1), 5)
+        self.assertTrue(publisher.close(timeout=5))
+        self.assertEqual(len(client.transport.published), 1)
+        payload = json.loads(client.transport.published[0][1])
+        self.assertEqual([item["object_id"] for item in payload], list(range(5)))
+
+    def test_rejects_unknown_payload_format(self):
+        with self.assertRaises(ValueError):
+            MqttMetricsPublisher(
+                transport=FakeTransport(),
+                topic="/metrics/task-a",
+                payload_format="cbor",
+            )
+
+    @unittest.skipUnless(importlib.util.find_spec("msgpack"), "msgpack is not installed")
+    def test_msgpack_payload_decodes_to_metrics_array(self):
+        import msgpack
+
+        client = FakeCoordinationClient()
+        publisher = MqttMetricsPublisher(
+            transport=client.transport,
+            topic="/metrics/task-a",
+            biz_scene_instance_id="task-a",
+            payload_format="msgpack",
+        )
+        metrics_list = [
+            MqttMetrics(object_id=object_id, metrics_code="water_level", value=1.0, source_timestamp_ms=1)
+            for object_id in range(20)
+        ]
+
+        self.assertEqual(publisher.publish_batch(metrics_list), 20)
+        self.assertEqual(len(client.transport.published), 1)
+        payload = msgpack.unpackb(client.transport.published[0][1])
+        self.assertEqual([item["object_id"] for item in payload], list(range(20)))
+        self.assertEqual(payload[0]["biz_scene_instance_id"], "task-a")
+
 
 if __name__ == "__main__":
     unittest.main()
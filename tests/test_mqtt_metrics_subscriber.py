@@ -1,4 +1,5 @@
 import json
+import math
 import unittest
 from types import SimpleNamespace
 
@@ -44,6 +45,26 @@ class MqttMetricsSubscriberTest(unittest.TestCase):
         self.assertEqual(cache.by_step(4)[cache_key]["status"], "ON")
         self.assertEqual(cache.by_step(4)[cache_key]["attributes"], "{\"front_water_flow\":2.5}")
 
+    def test_caches_every_entry_of_batched_array_payload(self):
+        transport = FakeTransport()
+        cache = FieldMetricsCache(max_steps=3, biz_scene_instance_id="task-a")
+        subscriber = MqttMetricsSubscriber(transport, cache)
+
+        subscriber.subscribe("/metrics/topic")
+        topic, handler, _qos = transport.subscriptions[0]
+        handler(
+            topic,
+            json.dumps(
+                [
+                    {"object_id": 1001, "metrics_code": "water_flow", "value": 2.5, "step_index": 4},
+                    {"object_id": 1002, "metrics_code": "water_level", "value": 7.0, "step_index": 4},
+                ]
+            ),
+        )
+
+        self.assertEqual(cache.get_value(1001, "water_flow"), 2.5)
+        self.assertEqual(cache.get_value(1002, "water_level"), 7.0)
+
     def test_invalid_json_is_ignored(self):
         cache = FieldMetricsCache(max_steps=3)
         subscriber = MqttMetricsSubscriber(FakeTransport(), cache)
@@ -53,6 +74,15 @@ class MqttMetricsSubscriberTest(unittest.TestCase):
             self.assertIsNone(subscriber.handle_message(msg))
         self.assertEqual(cache.history(), {})
 
+    def test_nan_literal_payload_is_still_decoded(self):
+        cache = FieldMetricsCache(max_steps=3, biz_scene_instance_id="task-a")
+        subscriber = MqttMetricsSubscriber(FakeTransport(), cache)
+        payload = json.dumps({"object_id": 1001, "metrics_code": "water_flow", "value": float("nan"), "step_index": 1})
+        msg = SimpleNamespace(topic="/metrics/topic", payload=payload.encode("utf-8"))
+
+        self.assertIsNotNone(subscriber.handle_message(msg))
+        self.assertTrue(math.isnan(cache.get_value(1001, "water_flow")))
+
 
 if __name__ == "__main__":
     unittest.main()
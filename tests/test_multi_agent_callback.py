@@ -236,6 +236,15 @@ def test_multi_agent_router_returns_init_response_with_pending_status_report():
     assert client.enqueued == []
 
 
+def test_router_dispatches_pass_through_commands_to_callback_bound_methods():
+    callback = MultiAgentCallback()
+    router = CoordinationCommandRouter(callback)
+
+    assert router.handlers["tick_cmd_request"] == callback.on_tick
+    assert router.handlers["task_init_request"] == callback.on_sim_task_init
+    assert router.handlers["task_terminate_request"] == callback.on_task_terminate
+
+
 def test_pending_status_reports_are_consumed_by_task_context():
     first_context = make_context()
     second_context = SimulationContext(biz_scene_instance_id="TASK_002")
@@ -438,6 +447,30 @@ def test_multi_agent_tick_and_terminate_return_response_lists():
     assert not client.state_manager.has_active_context(context)
 
 
+def test_multi_agent_terminate_drains_metrics_even_when_agent_terminate_fails():
+    class FailingTerminateAgent(FakeAgent):
+        def __init__(self, instance):
+            super().__init__(instance)
+            self.flushed = 0
+
+        def on_terminate(self, request):
+            raise RuntimeError("terminate failed")
+
+        def flush_metrics(self):
+            self.flushed += 1
+            return True
+
+    context = make_context()
+    agent = FailingTerminateAgent(make_instance(context))
+    callback = MultiAgentCallback()
+    activate_callback_task(callback, context, [agent])
+
+    responses = callback.on_task_terminate(SimTaskTerminateRequest(command_id="CMD_TERM", context=context))
+
+    assert responses == []
+    assert agent.flushed == 1
+
+
 def test_multi_agent_terminate_cleans_initializing_task_without_agents():
     context = make_context()
     callback = MultiAgentCallback()
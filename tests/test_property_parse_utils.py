@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from hydros_agent_sdk.agent_properties import AgentProperties
@@ -35,6 +37,43 @@ class PropertyParseUtilsTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             PropertyParseUtils.get_float(properties, "threshold", None)
 
+    def test_typed_reads_track_every_mutation_entry_point(self):
+        properties = AgentProperties({"roll_steps": "6"})
+        self.assertEqual(properties.get_property_as_integer("roll_steps"), 6)
+
+        properties.update(roll_steps="7")
+        self.assertEqual(properties.get_property_as_integer("roll_steps"), 7)
+
+        properties |= {"roll_steps": 8}
+        self.assertEqual(properties.get_property_as_integer("roll_steps"), 8)
+
+        properties.pop("roll_steps")
+        properties.setdefault("roll_steps", "9")
+        self.assertEqual(properties.get_property_as_integer("roll_steps"), 9)
+
+        properties.clear()
+        with self.assertRaises(KeyError):
+            properties.get_property_as_integer("roll_steps")
+
+    def test_typed_reads_see_in_place_changes_to_container_values(self):
+        properties = AgentProperties(targets=[], options={})
+        self.assertEqual(properties.get_property_as_string("targets"), "[]")
+        self.assertFalse(properties.get_property_as_bool("options"))
+
+        properties["targets"].append("gate-1")
+        properties["options"]["enabled"] = True
+
+        self.assertEqual(properties.get_property_as_string("targets"), "['gate-1']")
+        self.assertTrue(properties.get_property_as_bool("options"))
+
+    def test_copies_keep_typed_access(self):
+        properties = AgentProperties(enabled="on")
+        for clone in (copy.deepcopy(properties), pickle.loads(pickle.dumps(properties))):
+            self.assertIsInstance(clone, AgentProperties)
+            self.assertTrue(clone.get_property_as_bool("enabled"))
+            clone["enabled"] = "off"
+            self.assertFalse(clone.get_property_as_bool("enabled"))
+
 
 if __name__ == "__main__":
     unittest.main()
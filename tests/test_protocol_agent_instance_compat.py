@@ -11,6 +11,7 @@ from hydros_agent_sdk.protocol.commands import (
     MpcExecutionStatusReport,
     MpcExecutionStatus,
     SimCommandEnvelope,
+    SimTaskInitRequest,
     SimTaskInitResponse,
 )
 from hydros_agent_sdk.protocol.models import (
@@ -18,6 +19,7 @@ from hydros_agent_sdk.protocol.models import (
     AgentInstanceStatus,
     AgentStatus,
     CommandStatus,
+    HydroAgent,
     HydroAgentInstance,
     SimulationContext,
 )
@@ -168,6 +170,23 @@ def test_task_init_response_accepts_missing_managed_top_objects():
     assert envelope.command.managed_top_objects == {}
 
 
+def test_task_init_request_find_agent_returns_first_match_and_tracks_list_changes():
+    first = HydroAgent(agent_code="PUMP", agent_type="PUMP", agent_configuration_url="a.yaml")
+    duplicate = HydroAgent(agent_code="PUMP", agent_type="PUMP", agent_configuration_url="b.yaml")
+    request = SimTaskInitRequest(
+        command_id="CMD_INIT",
+        context=make_context(),
+        agent_list=[first, duplicate],
+    )
+
+    assert request.find_agent("PUMP") is first
+    assert request.find_agent("GATE") is None
+
+    gate = HydroAgent(agent_code="GATE", agent_type="GATE")
+    request.agent_list.append(gate)
+    assert request.find_agent("GATE") is gate
+
+
 def test_device_status_change_response_envelope_matches_java_command_type():
     context = make_context()
     agent = HydroAgentInstance(
@@ -69,3 +69,25 @@ def test_station_flow_command_preserves_group_fields_through_builder_and_dispatc
     assert request.group_size == 1
     assert request.main_step_index == 8
     assert request.algo_required_inputs == [planning_signal]
+
+
+def test_registered_command_builder_overrides_default_for_its_command_type():
+    default_builder = Mock(return_value="station-request")
+    custom_builder = Mock(return_value="custom-request")
+    send_command = Mock()
+    dispatcher = ControlCommandDispatcher(
+        send_command=send_command,
+        build_station_target_value_request=default_builder,
+    )
+    dispatcher.register_command_builder("gate_opening", custom_builder)
+
+    dispatcher.dispatch(
+        [
+            {"target_agent_code": "GATE_AGENT", "target_command_type": "gate_opening", "target_value": 0.5},
+            {"target_agent_code": "STATION_AGENT", "target_command_type": "water_flow", "target_value": 1.0},
+        ]
+    )
+
+    assert custom_builder.call_args.kwargs["target_agent_code"] == "GATE_AGENT"
+    assert default_builder.call_args.kwargs["target_agent_code"] == "STATION_AGENT"
+    assert [call.args[0] for call in send_command.call_args_list] == ["custom-request", "station-request"]
@@ -3,14 +3,19 @@ from hydros_agent_sdk.protocol.commands import (
     SimTaskInitResponse,
     SimTaskTerminateResponse,
     TickCmdRequest,
+    TimeSeriesDataUpdateRequest,
 )
+from hydros_agent_sdk.protocol.events import TimeSeriesDataChangedEvent
 from hydros_agent_sdk.protocol.models import (
     AgentStatus,
     AgentDriveMode,
     CommandStatus,
+    ObjectTimeSeries,
     SimulationContext,
+    TimeSeriesValue,
 )
 from hydros_agent_sdk.state_manager import AgentStateManager
+from hydros_agent_sdk.utils.mqtt_metrics import MqttMetrics
 
 
 class FakeClient:
@@ -54,6 +59,16 @@ class FailingTickableAgent(MinimalTickableAgent):
         raise ValueError("boom")
 
 
+class MetricsTickableAgent(MinimalTickableAgent):
+    def on_tick_simulation(self, request: TickCmdRequest):
+        return [MqttMetrics(object_id=1, metrics_code="water_level", value=1.0)]
+
+
+class FailingPublisher:
+    def publish_batch(self, metrics_list):
+        raise ConnectionError("broker down")
+
+
 def test_tickable_agent_can_be_instantiated():
     context = SimulationContext(biz_scene_instance_id="TASK_001")
     agent = MinimalTickableAgent(
@@ -117,3 +132,115 @@ def test_tick_failure_response_includes_error_detail():
     assert response.error_code == "AGENT_TICK_FAILURE"
     assert "TEST_AGENT" in response.error_message
     assert "ValueError: boom" in response.error_message
+
+
+def test_tick_succeeds_when_metrics_publish_fails():
+    context = SimulationContext(biz_scene_instance_id="TASK_001")
+    agent = MetricsTickableAgent(
+        sim_coordination_client=FakeClient(),
+        agent_id="AGT_TEST",
+        agent_code="TEST_AGENT",
+        agent_type="TEST_AGENT",
+        agent_name="Test Agent",
+        context=context,
+        hydros_cluster_id="cluster",
+        hydros_node_id="node",
+        agent_status=AgentStatus.INIT,
+        drive_mode=AgentDriveMode.SIM_TICK_DRIVEN,
+    )
+    agent.metrics_publisher = FailingPublisher()
+
+    response = agent.on_tick(TickCmdRequest(command_id="CMD_TICK", context=context, step=1))
+
+    assert response.command_status == CommandStatus.SUCCEED
+
+
+def test_tick_runtime_state_is_kept_out_of_pydantic_extra():
+    context = SimulationContext(biz_scene_instance_id="TASK_001")
+    agent = MinimalTickableAgent(
+        sim_coordination_client=FakeClient(),
+        agent_id="AGT_TEST",
+        agent_code="TEST_AGENT",
+        agent_type="TEST_AGENT",
+        agent_name="Test Agent",
+        context=context,
+        hydros_cluster_id="cluster",
+        hydros_node_id="node",
+    )
+
+    extra = agent.__pydantic_extra__ or {}
+    assert "time_series_cache" not in extra
+    assert "metrics_publisher" not in extra
+    assert "sim_coordination_client" not in extra
+    assert "properties" not in extra
+    assert agent.state_manager is agent.sim_coordination_client.state_manager
+    assert "metrics_publisher" not in agent.model_dump()
+
+
+class RecordingTickableAgent(MinimalTickableAgent):
+    __slots__ = ("applied",)
+
+    def _apply_single_boundary(self, time_series):
+        # 应用时该条序列已经可以从缓存中查询到
+        self.applied.append(
+            (time_series.object_id, self.time_series_cache.get_value(time_series.object_id, "inflow", 1))
+        )
+
+
+def test_slot_assignment_bypasses_pydantic_but_extras_still_work():
+    context = SimulationContext(biz_scene_instance_id="TASK_001")
+    agent = RecordingTickableAgent(
+        sim_coordination_client=FakeClient(),
+        agent_id="AGT_TEST",
+        agent_code="TEST_AGENT",
+        agent_type="TEST_AGENT",
+        agent_name="Test Agent",
+        context=context,
+        hydros_cluster_id="cluster",
+        hydros_node_id="node",
+    )
+
+    assert {"applied", "_current_step", "properties"} <= RecordingTickableAgent._slot_attribute_names
+    agent.applied = []
+    agent.custom_value = 1
+    agent.agent_status = AgentStatus.ACTIVE
+
+    extra = agent.__pydantic_extra__ or {}
+    assert "applied" not in extra
+    assert extra["custom_value"] == 1
+    assert agent.model_dump()["agent_status"] == AgentStatus.ACTIVE
+
+
+def test_time_series_update_applies_each_boundary_after_caching_it():
+    context = SimulationContext(biz_scene_instance_id="TASK_001")
+    agent = RecordingTickableAgent(
+        sim_coordination_client=FakeClient(),
+        agent_id="AGT_TEST",
+        agent_code="TEST_AGENT",
+        agent_type="TEST_AGENT",
+        agent_name="Test Agent",
+        context=context,
+        hydros_cluster_id="cluster",
+        hydros_node_id="node",
+    )
+    agent.applied = []
+    request = TimeSeriesDataUpdateRequest(
+        context=context,
+        command_id="CMD_TS",
+        time_series_data_changed_event=TimeSeriesDataChangedEvent(
+            object_time_series=[
+                ObjectTimeSeries(
+                    object_id=object_id,
+                    metrics_code="inflow",
+                    time_series=[TimeSeriesValue(step=1, value=float(object_id))],
+                )
+                for object_id in (1, 2)
+            ],
+        ),
+        broadcast=False,
+    )
+
+    response = agent.on_time_series_data_update(request)
+
+    assert response.command_status == CommandStatus.SUCCEED
+    assert agent.applied == [(1, 1.0), (2, 2.0)]
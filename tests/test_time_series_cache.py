@@ -1,3 +1,4 @@
+import math
 import unittest
 
 from hydros_agent_sdk.runtime.time_series_cache import TimeSeriesCache
@@ -21,9 +22,97 @@ class TimeSeriesCacheTest(unittest.TestCase):
         )
 
         self.assertEqual(cache.get_value(1, "WATER_LEVEL", 2), 72.4)
+        self.assertEqual(cache.get_value("1", "WATER_LEVEL", 2), 72.4)
+        self.assertIs(cache.get("1", "WATER_LEVEL"), cache.get(1, "WATER_LEVEL"))
         self.assertIsNone(cache.get_value(1, "WATER_LEVEL", 3))
         self.assertIsNone(cache.get_value(1, "WATER_FLOW", 2))
 
+    def test_get_value_sees_series_written_directly_to_store(self):
+        cache = TimeSeriesCache()
+        cache.update(
+            ObjectTimeSeries(
+                object_id=1,
+                metrics_code="WATER_LEVEL",
+                time_series=[TimeSeriesValue(step=1, value=72.1)],
+            )
+        )
+        self.assertEqual(cache.get_value(1, "WATER_LEVEL", 1), 72.1)
+
+        cache.store[cache.build_key(1, "WATER_LEVEL")] = ObjectTimeSeries(
+            object_id=1,
+            metrics_code="WATER_LEVEL",
+            time_series=[
+                TimeSeriesValue(step=1, value=70.0),
+                TimeSeriesValue(step=1, value=71.0),
+            ],
+        )
+
+        self.assertEqual(cache.get_value(1, "WATER_LEVEL", 1), 70.0)
+
+    def test_remove_and_direct_store_deletes_release_step_indexes(self):
+        cache = TimeSeriesCache()
+        for object_id in (1, 2):
+            cache.update(
+                ObjectTimeSeries(
+                    object_id=object_id,
+                    metrics_code="WATER_LEVEL",
+                    time_series=[TimeSeriesValue(step=1, value=72.1)],
+                )
+            )
+            cache.get_step_arrays(object_id, "WATER_LEVEL")
+
+        self.assertIsNotNone(cache.remove(1, "WATER_LEVEL"))
+        self.assertNotIn(cache.build_key(1, "WATER_LEVEL"), cache._step_index)
+        self.assertNotIn(cache.build_key(1, "WATER_LEVEL"), cache._step_arrays)
+        self.assertIsNone(cache.get_value(1, "WATER_LEVEL", 1))
+
+        del cache.store[cache.build_key(2, "WATER_LEVEL")]
+        self.assertIsNone(cache.get_value(2, "WATER_LEVEL", 1))
+        self.assertEqual(cache._step_index, {})
+        self.assertEqual(cache._step_arrays, {})
+
+    def test_get_step_arrays_returns_sorted_parallel_arrays(self):
+        cache = TimeSeriesCache()
+        cache.update(
+            ObjectTimeSeries(
+                object_id=1,
+                metrics_code="WATER_FLOW",
+                time_series=[
+                    TimeSeriesValue(step=3, value=3.5),
+                    TimeSeriesValue(step=1, value=1.5),
+                    TimeSeriesValue(step=2, value=None),
+                ],
+            )
+        )
+
+        steps, values = cache.get_step_arrays(1, "WATER_FLOW")
+
+        self.assertEqual(list(steps), [1, 2, 3])
+        self.assertEqual(values[0], 1.5)
+        self.assertTrue(math.isnan(values[1]))
+        self.assertEqual(values[2], 3.5)
+        self.assertIsNone(cache.get_step_arrays(1, "WATER_LEVEL"))
+
+    def test_fp32_step_arrays_keep_get_value_exact(self):
+        cache = TimeSeriesCache(values_typecode="f")
+        cache.update(
+            ObjectTimeSeries(
+                object_id=1,
+                metrics_code="WATER_LEVEL",
+                time_series=[TimeSeriesValue(step=1, value=72.123456789)],
+            )
+        )
+
+        steps, values = cache.get_step_arrays(1, "WATER_LEVEL")
+
+        self.assertEqual(values.itemsize, 4)
+        self.assertAlmostEqual(values[0], 72.123456789, places=4)
+        self.assertEqual(cache.get_value(1, "WATER_LEVEL", 1), 72.123456789)
+
+    def test_rejects_unsupported_values_typecode(self):
+        with self.assertRaises(ValueError):
+            TimeSeriesCache(values_typecode="h")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,244 @@
+import math
+import threading
+from array import array
+from unittest.mock import patch
+
+import pytest
+
+from hydros_agent_sdk.agents.twins_simulation_agent import TwinsSimulationAgent
+from hydros_agent_sdk.protocol.commands import SimTaskInitRequest, SimTaskTerminateRequest, TickCmdRequest
+from hydros_agent_sdk.protocol.models import (
+    AgentStatus,
+    CommandStatus,
+    HydroAgent,
+    ObjectTimeSeries,
+    SimulationContext,
+    TimeSeriesValue,
+)
+from hydros_agent_sdk.state_manager import AgentStateManager
+from hydros_agent_sdk.utils.hydro_object_utils import HydroObjectUtilsV2
+
+
+class FakeClient:
+    def __init__(self):
+        self.state_manager = AgentStateManager()
+        self.topic = "/hydros/commands/coordination/test"
+        self.transport = object()
+
+
+def build_yaml_data():
+    return {
+        "objects": [
+            {
+                "id": 10000 + index,
+                "type": "GateStation",
+                "name": f"Station {index}",
+                "device_children": [
+                    {"id": 20000 + index * 10 + child, "type": "Gate", "name": f"Gate {index}-{child}"}
+                    for child in range(3)
+                ],
+            }
+            for index in range(4)
+        ]
+    }
+
+
+def build_agent():
+    return TwinsSimulationAgent(
+        sim_coordination_client=FakeClient(),
+        agent_id="TWINS_001",
+        agent_code="TWINS_SIMULATION_AGENT",
+        agent_type="TWINS_SIMULATION_AGENT",
+        agent_name="Twins Simulation Agent",
+        context=SimulationContext(biz_scene_instance_id="TASK_001"),
+        hydros_cluster_id="cluster",
+        hydros_node_id="node",
+    )
+
+
+def test_default_twins_simulation_emits_mock_metrics_for_leading_objects():
+    agent = build_agent()
+    with patch.object(HydroObjectUtilsV2, "load_remote_yaml", return_value=build_yaml_data()):
+        agent._topology = HydroObjectUtilsV2.build_waterway_topology(
+            "https://example.test/objects.yaml",
+            with_metrics_code=True,
+        )
+
+    metrics_list = agent._execute_twins_simulation(step=3)
+
+    assert [metrics.object_id for metrics in metrics_list] == [20000, 20001, 20010, 20011, 20020, 20021]
+    assert {metrics.source_id for metrics in metrics_list} == {"TWINS_SIMULATION_AGENT"}
+    assert {metrics.job_instance_id for metrics in metrics_list} == {"TASK_001"}
+    assert {metrics.step_index for metrics in metrics_list} == {3}
+    assert metrics_list[0].value == 0.65
+
+
+def test_mock_metric_spec_is_built_once_per_topology():
+    agent = build_agent()
+    with patch.object(HydroObjectUtilsV2, "load_remote_yaml", return_value=build_yaml_data()):
+        agent._topology = HydroObjectUtilsV2.build_waterway_topology(
+            "https://example.test/objects.yaml",
+            with_metrics_code=True,
+        )
+
+    agent._execute_twins_simulation(step=1)
+    spec = agent._mock_metric_spec
+    agent._execute_twins_simulation(step=2)
+
+    assert agent._mock_metric_spec is spec
+    assert len(spec) == 6
+
+
+def test_mock_metric_spec_is_not_cached_before_topology_is_loaded():
+    agent = build_agent()
+
+    assert agent._execute_twins_simulation(step=1) == []
+    assert agent._mock_metric_spec is None
+
+    with patch.object(HydroObjectUtilsV2, "load_remote_yaml", return_value=build_yaml_data()):
+        agent._topology = HydroObjectUtilsV2.build_waterway_topology(
+            "https://example.test/objects.yaml",
+            with_metrics_code=True,
+        )
+
+    assert len(agent._execute_twins_simulation(step=2)) == 6
+
+
+def test_boundary_state_keeps_latest_value_per_object_and_metrics_code():
+    agent = build_agent()
+
+    agent._apply_single_boundary(ObjectTimeSeries(
+        object_id=20000,
+        metrics_code="gate_opening",
+        time_series=[TimeSeriesValue(step=1, value=0.2), TimeSeriesValue(step=2, value=0.4)],
+    ))
+    agent._apply_single_boundary(ObjectTimeSeries(object_id=20001, metrics_code="gate_opening"))
+    agent._apply_single_boundary(ObjectTimeSeries(
+        object_id=20000,
+        metrics_code="gate_opening",
+        time_series=[TimeSeriesValue(step=3, value=0.6)],
+    ))
+
+    index, values, steps = agent.get_boundary_state()
+    assert index == {(20000, "gate_opening"): 0, (20001, "gate_opening"): 1}
+    assert values[0] == 0.6
+    assert math.isnan(values[1])
+    assert list(steps) == [3, -1]
+
+
+def test_bulk_boundary_update_matches_per_item_updates():
+    agent = build_agent()
+    time_series_list = [
+        ObjectTimeSeries(
+            object_id=20000,
+            metrics_code="gate_opening",
+            time_series=[TimeSeriesValue(step=1, value=0.2)],
+        ),
+        ObjectTimeSeries(object_id=20001, metrics_code="gate_opening"),
+        ObjectTimeSeries(
+            object_id=20000,
+            metrics_code="gate_opening",
+            time_series=[TimeSeriesValue(step=2, value=0.4)],
+        ),
+    ]
+
+    agent._ingest_and_apply(time_series_list)
+
+    index, values, steps = agent.get_boundary_state()
+    assert index == {(20000, "gate_opening"): 0, (20001, "gate_opening"): 1}
+    assert values[0] == 0.4
+    assert math.isnan(values[1])
+    assert list(steps) == [2, -1]
+    assert agent.time_series_cache.get(20000, "gate_opening") is not None
+
+    rows = agent.update_boundary_state_bulk(
+        array("q", [20001, 20000, 20002]),
+        ["gate_opening", "gate_opening", "gate_opening"],
+        array("d", [1.0, 2.0, 3.0]),
+        [5, 5, 5],
+    )
+    assert rows == [1, 0, 2]
+    assert list(values) == [2.0, 1.0, 3.0]
+    assert list(steps) == [5, 5, 5]
+
+    agent.update_boundary_state_bulk([20000, 20001, 20002], ["gate_opening"] * 3, [7.0, 8.0, 9.0], [6, 6, 6])
+    assert list(values) == [7.0, 8.0, 9.0]
+
+
+def test_bulk_boundary_update_rejects_ragged_columns():
+    agent = build_agent()
+
+    with pytest.raises(ValueError):
+        agent.update_boundary_state_bulk([1, 2], ["a"], [1.0, 2.0], [1, 2])
+
+
+def test_async_topology_load_does_not_block_init_response():
+    agent = build_agent()
+    agent.properties.update({
+        "hydros_objects_modeling_url": "https://example.test/async-objects.yaml",
+        "async_topology_load": "true",
+    })
+    context = agent.context
+    request = SimTaskInitRequest(
+        command_id="CMD_INIT",
+        context=context,
+        agent_list=[
+            HydroAgent(
+                agent_code="TWINS_SIMULATION_AGENT",
+                agent_type="TWINS_SIMULATION_AGENT",
+                agent_name="Twins Simulation Agent",
+                agent_configuration_url="",
+            )
+        ],
+    )
+    release = threading.Event()
+
+    def load_yaml(*args, **kwargs):
+        assert release.wait(5)
+        return build_yaml_data()
+
+    with patch.object(TwinsSimulationAgent, "load_agent_configuration"), \
+            patch.object(HydroObjectUtilsV2, "load_remote_yaml", side_effect=load_yaml):
+        response = agent.on_init(request)
+
+        assert response.command_status == CommandStatus.SUCCEED
+        assert agent.agent_status == AgentStatus.ACTIVE
+        assert agent._topology is None
+
+        release.set()
+        metrics_list = agent.on_tick_simulation(TickCmdRequest(command_id="CMD_TICK", context=context, step=1))
+
+    assert len(metrics_list) == 6
+    assert agent._topology_future is None
+
+
+def test_terminate_discards_topology_that_finishes_loading_afterwards():
+    agent = build_agent()
+    agent.properties.update({
+        "hydros_objects_modeling_url": "https://example.test/late-objects.yaml",
+        "async_topology_load": "true",
+    })
+    context = agent.context
+    request = SimTaskInitRequest(command_id="CMD_INIT", context=context, agent_list=[])
+    started = threading.Event()
+    release = threading.Event()
+
+    def load_yaml(*args, **kwargs):
+        started.set()
+        assert release.wait(5)
+        return build_yaml_data()
+
+    with patch.object(TwinsSimulationAgent, "load_agent_configuration"), \
+            patch.object(HydroObjectUtilsV2, "load_remote_yaml", side_effect=load_yaml):
+        agent.on_init(request)
+        future = agent._topology_future
+        assert started.wait(5)
+
+        response = agent.on_terminate(SimTaskTerminateRequest(command_id="CMD_TERM", context=context))
+        release.set()
+        future.result(timeout=5)
+
+    assert response.command_status == CommandStatus.SUCCEED
+    assert agent._topology_future is None
+    assert agent._topology is None
+    assert agent._mock_metric_spec is None